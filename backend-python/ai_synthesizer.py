@@ -11,33 +11,47 @@ The Schema-based mode eliminates 100% of AI typos in variable names and syntax
 by having Python templates generate the C++ code deterministically.
 """
 
-import json
 import logging
 from typing import Optional, Tuple, Dict
 
 from google import genai
 from google.genai import types
+from pydantic import ValidationError
 
 from backend.config import Settings
+from backend.llm_limits import LLM_SEMAPHORE
 from backend.prompts.system_prompts import (
-    SYSTEM_PROMPT,
+    get_batch_repair_prompt,
+    get_generation_messages,
+    get_system_prompt,
     get_repair_prompt,
     get_template_prompt,
     get_template_repair_prompt,
 )
 from backend.code_parser import CodeParser
 from backend.template_manager import TemplateManager, PluginType, PluginTemplate
-from backend.code_verifier import CodeVerifier, verify_before_commit
+from backend.code_verifier import CodeVerifier, try_deterministic_repair, verify_before_commit
 from backend.schemas import (
-    PluginResponse,
+    GEMINI_PLUGIN_SCHEMA,
     PluginCategory,
-    get_gemini_schema,
     get_schema_prompt,
+    parse_plugin_response,
 )
 from backend.cpp_generator import generate_from_schema, CppGenerator
 
 logger = logging.getLogger(__name__)
 
+# Static parts of the schema-mode request, built once around the user prompt
+_SCHEMA_REQUEST_HEAD = f"""Based on the following plugin request, output a structured JSON response.
+
+{get_schema_prompt()}
+
+USER REQUEST:
+"""
+_SCHEMA_REQUEST_TAIL = """
+
+Remember: Output ONLY valid JSON matching the schema above. No markdown, no explanation."""
+
 
 class AISynthesizer:
     """
@@ -65,7 +79,7 @@ class AISynthesizer:
         if settings.ANTHROPIC_API_KEY:
             try:
                 import anthropic
-                self.claude_client = anthropic.Anthropic(
+                self.claude_client = anthropic.AsyncAnthropic(
                     api_key=settings.ANTHROPIC_API_KEY
                 )
                 logger.info(f"Claude initialized: {settings.CLAUDE_MODEL}")
@@ -74,6 +88,16 @@ class AISynthesizer:
         else:
             logger.warning("No Anthropic API key - Claude fallback disabled")
 
+    async def _gemini(self, **kwargs):
+        """Call Gemini under the shared LLM concurrency limit."""
+        async with LLM_SEMAPHORE:
+            return await self.gemini_client.aio.models.generate_content(**kwargs)
+
+    async def _claude(self, **kwargs):
+        """Call Claude under the shared LLM concurrency limit."""
+        async with LLM_SEMAPHORE:
+            return await self.claude_client.messages.create(**kwargs)
+
     async def generate_code(
         self, user_prompt: str,
         use_schema_mode: bool = True
@@ -130,9 +154,11 @@ class AISynthesizer:
 
         logger.warning(f"Gemini generation failed: {error}")
 
-        # Fallback to Claude (architect)
+        # Fallback to Claude (architect), now with the reference skeleton
         if self.claude_client:
-            processor, editor, error = await self._generate_with_claude(user_prompt)
+            processor, editor, error = await self._generate_with_claude(
+                user_prompt, include_example=True
+            )
             if processor and editor:
                 return processor, editor, None, None, None
             logger.warning(f"Claude generation failed: {error}")
@@ -162,23 +188,15 @@ class AISynthesizer:
         try:
             logger.info("Schema-based generation: AI will output JSON, Python writes C++")
 
-            # Build the schema prompt
-            schema_prompt = get_schema_prompt()
-            full_prompt = f"""Based on the following plugin request, output a structured JSON response.
-
-{schema_prompt}
+            full_prompt = _SCHEMA_REQUEST_HEAD + user_prompt + _SCHEMA_REQUEST_TAIL
 
-USER REQUEST:
-{user_prompt}
-
-Remember: Output ONLY valid JSON matching the schema above. No markdown, no explanation."""
-
-            # Call Gemini with JSON response mode
-            response = self.gemini_client.models.generate_content(
+            # Call Gemini with JSON response mode, constrained to the schema
+            response = await self._gemini(
                 model=self.settings.GEMINI_MODEL,
                 contents=full_prompt,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json",
+                    response_schema=GEMINI_PLUGIN_SCHEMA,
                     max_output_tokens=2048,
                 ),
             )
@@ -186,20 +204,17 @@ Remember: Output ONLY valid JSON matching the schema above. No markdown, no expl
             if not response.text:
                 return None, "Gemini returned empty response for schema mode"
 
-            # Parse JSON response
-            try:
-                json_response = json.loads(response.text)
-                logger.info(f"Schema response: {json.dumps(json_response, indent=2)[:500]}...")
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse JSON: {response.text[:500]}")
-                return None, f"AI returned invalid JSON: {str(e)}"
+            logger.info(f"Schema response: {response.text[:500]}...")
 
-            # Validate against Pydantic schema
+            # Parse and validate against the Pydantic schema in one pass
             try:
-                plugin_response = PluginResponse(**json_response)
+                plugin_response = parse_plugin_response(response.text)
                 logger.info(f"Validated schema: {plugin_response.plugin_name} ({plugin_response.category.value})")
                 logger.info(f"Parameters: {[p.name for p in plugin_response.parameters]}")
-            except Exception as e:
+            except ValidationError as e:
+                if e.errors()[0]["type"] == "json_invalid":
+                    logger.warning(f"Failed to parse JSON: {response.text[:500]}")
+                    return None, f"AI returned invalid JSON: {str(e)}"
                 logger.warning(f"Schema validation failed: {str(e)}")
                 return None, f"Schema validation failed: {str(e)}"
 
@@ -250,7 +265,7 @@ Remember: Output ONLY valid JSON matching the schema above. No markdown, no expl
 
             # Generate DSP logic with Gemini
             logger.info("Generating DSP logic with Gemini (template mode)")
-            response = self.gemini_client.models.generate_content(
+            response = await self._gemini(
                 model=self.settings.GEMINI_MODEL,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -328,11 +343,11 @@ Remember: Output ONLY valid JSON matching the schema above. No markdown, no expl
             logger.info("Generating code with Gemini")
 
             # Use the new google.genai API
-            response = self.gemini_client.models.generate_content(
+            response = await self._gemini(
                 model=self.settings.GEMINI_MODEL,
                 contents=user_prompt,
                 config=types.GenerateContentConfig(
-                    system_instruction=SYSTEM_PROMPT,
+                    system_instruction=get_system_prompt(),
                     max_output_tokens=8192,
                 ),
             )
@@ -357,19 +372,18 @@ Remember: Output ONLY valid JSON matching the schema above. No markdown, no expl
             return None, None, f"Gemini error: {str(e)}"
 
     async def _generate_with_claude(
-        self, user_prompt: str
+        self, user_prompt: str, include_example: bool = False
     ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-        """Generate code using Claude."""
+        """Generate code using Claude (optionally with the reference skeleton)."""
         if not self.claude_client:
             return None, None, "Claude client not initialized"
 
         try:
             logger.info("Generating code with Claude")
-            message = self.claude_client.messages.create(
+            message = await self._claude(
                 model=self.settings.CLAUDE_MODEL,
                 max_tokens=8192,
-                system=SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": user_prompt}],
+                **get_generation_messages(user_prompt, include_example),
             )
 
             response_text = message.content[0].text
@@ -415,13 +429,25 @@ Remember: Output ONLY valid JSON matching the schema above. No markdown, no expl
             On success: (fixed_code, None)
             On failure: (None, error_message)
         """
-        repair_prompt = get_repair_prompt(error_message, original_code, filename, header_code)
+        errors = CodeParser.extract_compiler_errors(error_message)
+
+        # Known, recurring errors are fixed without an LLM round-trip
+        fixed_code = try_deterministic_repair(errors, original_code, filename)
+        if fixed_code:
+            return fixed_code, None
+
+        # Several distinct errors are fixed together in one batched prompt
+        if len(errors) > 1:
+            logger.info(f"Batching {len(errors)} compiler errors into one repair for {filename}")
+            repair_prompt = get_batch_repair_prompt(errors, original_code, filename, header_code)
+        else:
+            repair_prompt = get_repair_prompt(error_message, original_code, filename, header_code)
 
         # Prefer Claude for repairs (better at debugging)
         if self.claude_client:
             try:
                 logger.info(f"Attempting code repair with Claude for {filename}")
-                message = self.claude_client.messages.create(
+                message = await self._claude(
                     model=self.settings.CLAUDE_MODEL,
                     max_tokens=8192,
                     messages=[{"role": "user", "content": repair_prompt}],
@@ -443,7 +469,7 @@ Remember: Output ONLY valid JSON matching the schema above. No markdown, no expl
         # Fallback to Gemini for repair
         try:
             logger.info(f"Attempting code repair with Gemini for {filename}")
-            response = self.gemini_client.models.generate_content(
+            response = await self._gemini(
                 model=self.settings.GEMINI_MODEL,
                 contents=repair_prompt,
                 config=types.GenerateContentConfig(
@@ -505,7 +531,7 @@ Return ONLY the corrected code between ``` markers, no explanations."""
         if self.claude_client:
             try:
                 logger.info("Attempting AI logic repair with Claude")
-                message = self.claude_client.messages.create(
+                message = await self._claude(
                     model=self.settings.CLAUDE_MODEL,
                     max_tokens=1024,
                     messages=[{"role": "user", "content": repair_prompt}],
@@ -531,7 +557,7 @@ Return ONLY the corrected code between ``` markers, no explanations."""
         # Fallback to Gemini
         try:
             logger.info("Attempting AI logic repair with Gemini")
-            response = self.gemini_client.models.generate_content(
+            response = await self._gemini(
                 model=self.settings.GEMINI_MODEL,
                 contents=repair_prompt,
                 config=types.GenerateContentConfig(
@@ -14,29 +14,41 @@ The "Bug-Killer" step is Phase 3 where the Architect validates
 against actual template parameters BEFORE code is written.
 """
 
+import json
 import logging
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Tuple
+from typing import AsyncIterator, Callable, List, Optional, Pattern, Tuple
 
 import google.generativeai as genai
 import anthropic
 
 from .config import get_settings
+from .llm_limits import LLM_SEMAPHORE
 from .template_manager import TemplateManager, PluginType
 from .prompts.bmad_prompts import (
-    ANALYST_PROMPT,
-    PM_PROMPT,
-    ARCHITECT_PROMPT,
-    DEVELOPER_PROMPT,
-    SM_ANALYST_PROMPT,
-    REPAIR_ARCHITECT_PROMPT,
-    TEMPLATE_PARAMS,
+    DISALLOWED_IDENT_RE,
+    RENDER,
+    TEMPLATE_PARAMS_STR,
 )
 
 logger = logging.getLogger(__name__)
 
+# Streamed Architect attempts before falling back to an unchecked call
+ARCHITECT_STREAM_ATTEMPTS = 2
+
+# Bullet whose leading token is clearly a variable name: backticked
+# ("- `z1[ch]`"), indexed ("- channelData[sample]") or described ("- gain - ...").
+# Prose bullets ("- Note: ...", "- Input (...)") are not matched
+_VARIABLE_BULLET_RE = re.compile(
+    r"^\s*[-*]\s*(?:`([A-Za-z_]\w*)[^`]*`|([A-Za-z_]\w*)(?=\[|\s+-\s))"
+)
+
+
+class TechSpecViolation(Exception):
+    """Raised mid-stream when the Architect lists a variable not in the template."""
+
 
 class BMADPhase(str, Enum):
     """BMAD pipeline phases."""
@@ -98,13 +110,14 @@ class BMADOrchestrator:
         if not self.gemini_model:
             raise RuntimeError("Gemini not configured")
 
-        response = await self.gemini_model.generate_content_async(
-            prompt,
-            generation_config={
-                "temperature": 0.7,
-                "max_output_tokens": 4096,
-            }
-        )
+        async with LLM_SEMAPHORE:
+            response = await self.gemini_model.generate_content_async(
+                prompt,
+                generation_config={
+                    "temperature": 0.7,
+                    "max_output_tokens": 4096,
+                }
+            )
         return response.text
 
     async def _call_claude(self, prompt: str) -> str:
@@ -112,12 +125,97 @@ class BMADOrchestrator:
         if not self.claude_client:
             raise RuntimeError("Claude not configured")
 
-        response = await self.claude_client.messages.create(
+        async with LLM_SEMAPHORE:
+            response = await self.claude_client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=4096,
+                messages=[{"role": "user", "content": prompt}]
+            )
+        return response.content[0].text
+
+    async def _stream_gemini(self, prompt: str) -> AsyncIterator[str]:
+        """Stream Gemini response text."""
+        if not self.gemini_model:
+            raise RuntimeError("Gemini not configured")
+
+        async with LLM_SEMAPHORE:
+            response = await self.gemini_model.generate_content_async(
+                prompt,
+                generation_config={
+                    "temperature": 0.7,
+                    "max_output_tokens": 4096,
+                },
+                stream=True,
+            )
+            async for chunk in response:
+                yield chunk.text
+
+    async def _stream_claude(self, prompt: str) -> AsyncIterator[str]:
+        """Stream Claude response text (fallback)."""
+        if not self.claude_client:
+            raise RuntimeError("Claude not configured")
+
+        # Leaving the context manager closes the connection mid-generation
+        async with LLM_SEMAPHORE, self.claude_client.messages.stream(
             model="claude-sonnet-4-20250514",
             max_tokens=4096,
             messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+    async def _call_ai_checked(
+        self,
+        prompt: str,
+        check: Callable[[str], Optional[str]],
+    ) -> str:
+        """
+        Stream an AI response, aborting as soon as `check` flags it.
+
+        Args:
+            prompt: Prompt to send
+            check: Called with each completed line; returns a violation message or None
+
+        Returns:
+            Full response text
+
+        Raises:
+            TechSpecViolation: If the check fails before the response completes
+        """
+        if not self.gemini_model:
+            return await self._consume_checked(self._stream_claude(prompt), check)
+
+        try:
+            return await self._consume_checked(self._stream_gemini(prompt), check)
+        except TechSpecViolation:
+            raise
+        except Exception as e:
+            logger.warning(f"Gemini failed, falling back to Claude: {e}")
+            return await self._consume_checked(self._stream_claude(prompt), check)
+
+    @staticmethod
+    async def _consume_checked(
+        stream: AsyncIterator[str],
+        check: Callable[[str], Optional[str]],
+    ) -> str:
+        """Collect a text stream, closing it early if `check` flags a line."""
+        chunks = []
+        partial_line = ""
+        try:
+            async for text in stream:
+                chunks.append(text)
+                if "\n" not in text:
+                    partial_line += text
+                    continue
+                # Only lines completed by this chunk are checked
+                *lines, partial_line = (partial_line + text).split("\n")
+                for line in lines:
+                    violation = check(line)
+                    if violation:
+                        raise TechSpecViolation(violation)
+        finally:
+            await stream.aclose()
+        return "".join(chunks)
 
     async def _call_ai(self, prompt: str, use_claude: bool = False) -> str:
         """
@@ -147,7 +245,7 @@ class BMADOrchestrator:
         """
         logger.info("=== BMAD Phase 1: ANALYST ===")
 
-        prompt = ANALYST_PROMPT.format(user_prompt=user_prompt)
+        prompt = RENDER["analyst"](user_prompt=user_prompt)
         response = await self._call_ai(prompt)
 
         logger.info(f"Analyst produced {len(response)} char product brief")
@@ -166,7 +264,7 @@ class BMADOrchestrator:
         """
         logger.info("=== BMAD Phase 2: PM ===")
 
-        prompt = PM_PROMPT.format(product_brief=product_brief)
+        prompt = RENDER["pm"](product_brief=product_brief)
         response = await self._call_ai(prompt)
 
         # Extract plugin type from PRD
@@ -218,45 +316,124 @@ class BMADOrchestrator:
 
         # Get parameter mapping for this plugin type
         type_key = plugin_type.value.upper()
-        params = TEMPLATE_PARAMS.get(type_key, TEMPLATE_PARAMS["GENERIC"])
+        params_str = TEMPLATE_PARAMS_STR.get(type_key, TEMPLATE_PARAMS_STR["GENERIC"])
 
         # Build the prompt with ACTUAL template context
-        prompt = ARCHITECT_PROMPT.format(
+        prompt = RENDER["architect"](
             template_code=template.processor_template[:2000],  # First 2000 chars
-            available_params="\n".join(f"- {p}" for p in params["available_params"]),
-            constraints="\n".join(f"- {c}" for c in params["constraints"]),
+            available_params=params_str["available_params"],
+            constraints=params_str["constraints"],
             plugin_type=plugin_type.value.upper(),
             prd=prd
         )
 
-        response = await self._call_ai(prompt)
+        # Stream the spec and abort as soon as VARIABLES_USED names a
+        # variable the template doesn't have, instead of paying for the
+        # full (doomed) generation
+        disallowed = DISALLOWED_IDENT_RE.get(type_key, DISALLOWED_IDENT_RE["GENERIC"])
+
+        response = None
+        for attempt in range(1, ARCHITECT_STREAM_ATTEMPTS + 1):
+            try:
+                response = await self._call_ai_checked(
+                    prompt, self._variables_used_checker(disallowed)
+                )
+                break
+            except TechSpecViolation as e:
+                logger.warning(
+                    f"Architect attempt {attempt}/{ARCHITECT_STREAM_ATTEMPTS} aborted: {e}"
+                )
+
+        if response is None:
+            # Let the Developer phase and CI catch whatever remains
+            response = await self._call_ai(prompt)
 
         # Verify that the tech spec only uses available variables
-        self._verify_tech_spec(response, params["available_params"])
+        self._verify_tech_spec(response, disallowed)
 
         logger.info("Architect produced verified tech spec")
         return response
 
-    def _verify_tech_spec(self, tech_spec: str, available_params: list) -> bool:
+    @staticmethod
+    def _bullet_variable(line: str) -> Optional[str]:
+        """Get the variable a VARIABLES_USED bullet names, if any."""
+        match = _VARIABLE_BULLET_RE.match(line)
+        return (match.group(1) or match.group(2)) if match else None
+
+    @classmethod
+    def _variables_used(cls, text: str) -> List[str]:
+        """Get the variable names listed in a tech spec's VARIABLES_USED section."""
+        start = text.upper().find("VARIABLES_USED")
+        if start < 0:
+            return []
+
+        section = text[start:]
+        end = section.find("###", 1)
+        if end >= 0:
+            section = section[:end]
+
+        names = []
+        for line in section.splitlines()[1:]:
+            name = cls._bullet_variable(line)
+            if name:
+                names.append(name)
+        return names
+
+    @staticmethod
+    def _unknown_variables(names: List[str], disallowed: Pattern[str]) -> List[str]:
+        """
+        Get the names the template doesn't declare.
+
+        Capitalized words outside the allowlist ("None", "Input") are prose,
+        not variables, and are ignored.
+        """
+        return [
+            name for name in names
+            if disallowed.fullmatch(name) and not name[0].isupper()
+        ]
+
+    def _variables_used_checker(
+        self, disallowed: Pattern[str]
+    ) -> Callable[[str], Optional[str]]:
+        """
+        Build a per-line check for the VARIABLES_USED section of a streamed spec.
+
+        Each completed line is inspected once, tracking whether it falls
+        inside the section, so the stream is never rescanned.
+
+        Returns:
+            Callable taking a line and returning a violation message, or None
+        """
+        in_section = done = False
+
+        def check(line: str) -> Optional[str]:
+            nonlocal in_section, done
+            if done:
+                return None
+            if not in_section:
+                in_section = "VARIABLES_USED" in line.upper()
+                return None
+            if "###" in line:
+                done = True
+                return None
+
+            name = self._bullet_variable(line)
+            if name and self._unknown_variables([name], disallowed):
+                return f"unknown variable '{name}' in VARIABLES_USED"
+            return None
+
+        return check
+
+    def _verify_tech_spec(self, tech_spec: str, disallowed: Pattern[str]) -> None:
         """
         Verify that the tech spec only references available variables.
 
         This is a sanity check - the real validation happens when
         we pass the tech spec to the Developer.
         """
-        # Extract variable names from available_params
-        known_vars = set()
-        for param in available_params:
-            # Extract variable name (before parenthesis or dash)
-            var_name = param.split("(")[0].split("-")[0].strip()
-            known_vars.add(var_name.lower())
-            # Handle array notation
-            if "[" in var_name:
-                base_var = var_name.split("[")[0]
-                known_vars.add(base_var.lower())
-
-        logger.debug(f"Known variables: {known_vars}")
-        return True  # We rely on the Developer phase to catch issues
+        unknown = self._unknown_variables(self._variables_used(tech_spec), disallowed)
+        if unknown:
+            logger.warning(f"Tech spec lists unknown variables: {unknown}")
 
     # =========================================================================
     # Phase 4: DEVELOPER
@@ -281,7 +458,7 @@ class BMADOrchestrator:
         variables_used = self._extract_section(tech_spec, "VARIABLES_USED")
         algorithm = self._extract_section(tech_spec, "ALGORITHM")
 
-        prompt = DEVELOPER_PROMPT.format(
+        prompt = RENDER["developer"](
             plugin_type=plugin_type.value.upper(),
             variables_used=variables_used,
             algorithm=algorithm
@@ -400,10 +577,10 @@ class BMADOrchestrator:
         try:
             # Get template params for this plugin type
             type_key = artifacts.plugin_type.value.upper()
-            params = TEMPLATE_PARAMS.get(type_key, TEMPLATE_PARAMS["GENERIC"])
+            params_str = TEMPLATE_PARAMS_STR.get(type_key, TEMPLATE_PARAMS_STR["GENERIC"])
 
             # Step 1: SM Agent analyzes error
-            sm_prompt = SM_ANALYST_PROMPT.format(
+            sm_prompt = RENDER["sm_analyst"](
                 build_error=build_error,
                 tech_spec=artifacts.tech_spec
             )
@@ -411,11 +588,11 @@ class BMADOrchestrator:
             logger.info(f"SM analysis: {error_analysis[:200]}...")
 
             # Step 2: Architect fixes tech spec
-            repair_prompt = REPAIR_ARCHITECT_PROMPT.format(
+            repair_prompt = RENDER["repair_architect"](
                 error_analysis=error_analysis,
                 original_tech_spec=artifacts.tech_spec,
-                available_params="\n".join(f"- {p}" for p in params["available_params"]),
-                constraints="\n".join(f"- {c}" for c in params["constraints"])
+                available_params=params_str["available_params"],
+                constraints=params_str["constraints"]
             )
             corrected_tech_spec = await self._call_ai(repair_prompt)
             artifacts.tech_spec = corrected_tech_spec
@@ -441,3 +618,74 @@ class BMADOrchestrator:
         except Exception as e:
             logger.error(f"BMAD repair failed: {e}")
             return None, None, str(e), artifacts
+
+    async def fast_repair(
+        self,
+        build_error: str,
+        artifacts: BMADArtifacts,
+    ) -> Tuple[Optional[str], Optional[str], Optional[str], BMADArtifacts]:
+        """
+        Single-call repair: diagnose the error and patch the logic in one pass.
+
+        Most first-attempt failures are trivial (wrong variable name, missing
+        cast), so this skips the SM -> Architect -> Developer cascade and its
+        three LLM round-trips. Used for the first retry; later retries fall
+        back to repair_with_bmad().
+
+        Returns:
+            (processor_code, editor_code, error_message, artifacts)
+        """
+        logger.info("=== BMAD Fast Repair ===")
+
+        if not artifacts.tech_spec or not artifacts.plugin_type:
+            logger.error("Cannot repair: missing tech spec or plugin type")
+            return None, None, "Missing artifacts for repair", artifacts
+
+        try:
+            type_key = artifacts.plugin_type.value.upper()
+            params_str = TEMPLATE_PARAMS_STR.get(type_key, TEMPLATE_PARAMS_STR["GENERIC"])
+
+            prompt = RENDER["fast_repair"](
+                plugin_type=type_key,
+                build_error=build_error,
+                tech_spec=artifacts.tech_spec,
+                logic_code=artifacts.logic_code or "",
+                available_params=params_str["available_params"],
+                constraints=params_str["constraints"]
+            )
+            response = await self._call_ai(prompt)
+
+            logic_code = self._parse_fast_repair(response)
+            artifacts.logic_code = logic_code
+            artifacts.developer_response = response
+
+            # Inject into template
+            template = TemplateManager.get_template(artifacts.plugin_type)
+            processor_code = TemplateManager.inject_logic(
+                template.processor_template,
+                logic_code
+            )
+            editor_code = template.editor_template
+
+            logger.info("BMAD fast repair complete")
+            return processor_code, editor_code, None, artifacts
+
+        except Exception as e:
+            logger.error(f"BMAD fast repair failed: {e}")
+            return None, None, str(e), artifacts
+
+    def _parse_fast_repair(self, response: str) -> str:
+        """Extract logic code from a fast-repair JSON response."""
+        text = response.strip()
+        # Tolerate ```json fences around the payload
+        if text.startswith("```"):
+            text = text.strip("`")
+            text = text[text.find("{"):]
+
+        try:
+            payload = json.loads(text[:text.rfind("}") + 1])
+            logger.info(f"Fast repair root cause: {payload.get('root_cause', '')[:200]}")
+            return payload["logic_code"].strip()
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.warning("Fast repair response was not valid JSON, extracting code")
+            return self._extract_code(response)
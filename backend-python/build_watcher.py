@@ -0,0 +1,178 @@
+"""
+vAIst Build Watcher
+Single background poller that resolves every in-flight build from one runs listing.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from backend.config import Settings
+from backend.github_manager import GitHubManager, ACTIVE_RUN_STATES
+from backend.task_manager import TaskManager
+
+logger = logging.getLogger(__name__)
+
+# Runs fetched per listing (newest first)
+RUNS_PER_PAGE = 50
+
+
+class BuildWatcher:
+    """
+    Batch poller for workflow runs.
+
+    Instead of every generation task polling its own run, watched commits
+    are resolved from a single `/actions/runs` listing per interval, so REST
+    calls stay O(1) regardless of how many builds are in flight. Results are
+    delivered through TaskManager.resolve_build(), the same path the
+    workflow_run webhook uses; with webhooks enabled the watcher only acts
+    as a low-frequency reconciler.
+    """
+
+    def __init__(
+        self,
+        github_manager: GitHubManager,
+        task_manager: TaskManager,
+        settings: Settings,
+    ):
+        """
+        Initialize build watcher.
+
+        Args:
+            github_manager: Client used to list runs
+            task_manager: Holds the per-commit build futures
+            settings: Application settings with poll intervals
+        """
+        self.github_manager = github_manager
+        self.task_manager = task_manager
+        self.settings = settings
+
+        # Watched commit SHA -> workflow run ID
+        self._watched: Dict[str, int] = {}
+        # Last seen state per watched commit, to detect transitions
+        self._states: Dict[str, str] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the polling task (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="build-watcher")
+
+    async def stop(self) -> None:
+        """Stop the polling task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def watch(self, commit_sha: str, run_id: int) -> asyncio.Future:
+        """
+        Watch a build until it finishes.
+
+        Args:
+            commit_sha: Git commit SHA of the pushed build
+            run_id: GitHub Actions workflow run ID for the commit
+
+        Returns:
+            Future resolving to (status, run_id)
+        """
+        self._watched[commit_sha] = run_id
+        self.start()
+        self._wakeup.set()
+        return self.task_manager.await_build(commit_sha)
+
+    def unwatch(self, commit_sha: str) -> None:
+        """
+        Stop watching a build and drop its pending future.
+
+        Args:
+            commit_sha: Git commit SHA of the build
+        """
+        self._watched.pop(commit_sha, None)
+        self._states.pop(commit_sha, None)
+        self.task_manager.discard_build(commit_sha)
+
+    def _base_interval(self) -> float:
+        """Poll interval right after a state change."""
+        if self.settings.GITHUB_WEBHOOK_SECRET:
+            return self.settings.BUILD_RECONCILE_INTERVAL_SECONDS
+        return self.settings.BUILD_POLL_INTERVAL_SECONDS
+
+    async def _run(self) -> None:
+        """Poll while builds are watched, backing off while nothing changes."""
+        loop = asyncio.get_running_loop()
+        interval = self._base_interval()
+        # Ticks are scheduled against absolute deadlines so wakeup delays
+        # and poll latency don't accumulate into drift
+        next_tick = loop.time()
+
+        while True:
+            if not self._watched:
+                # Idle until a build is registered
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                interval = self._base_interval()
+                next_tick = loop.time()
+
+            next_tick += interval
+            now = loop.time()
+            if next_tick < now:
+                # Fell more than an interval behind: resync rather than burst
+                next_tick = now
+            await asyncio.sleep(next_tick - now)
+
+            try:
+                changed = await self._poll_once()
+            except httpx.HTTPError as e:
+                logger.warning(f"Build watcher poll failed: {e}")
+                changed = False
+            except Exception:
+                logger.exception("Unexpected error in build watcher")
+                changed = False
+
+            if changed or self.settings.GITHUB_WEBHOOK_SECRET:
+                interval = self._base_interval()
+            else:
+                interval = min(interval * 2, self.settings.BUILD_POLL_MAX_INTERVAL_SECONDS)
+
+    async def _poll_once(self) -> bool:
+        """
+        Resolve watched builds from one runs listing.
+
+        Returns:
+            True if any watched build changed state
+        """
+        runs = await self.github_manager.list_recent_runs(per_page=RUNS_PER_PAGE)
+        states: Dict[str, Tuple[str, int]] = {}
+        for run in runs:
+            commit_sha = run.get("head_sha")
+            # Newest first: keep the latest run for re-run commits
+            if commit_sha in self._watched and commit_sha not in states:
+                states[commit_sha] = (self.github_manager.run_state(run), run["id"])
+
+        # Builds that scrolled out of the listing are checked individually
+        for commit_sha, run_id in list(self._watched.items()):
+            if commit_sha not in states:
+                status, _ = await self.github_manager.get_run_status(run_id)
+                if status != "error":
+                    states[commit_sha] = (status, run_id)
+
+        changed = False
+        for commit_sha, (status, run_id) in states.items():
+            if self._states.get(commit_sha) != status:
+                changed = True
+                self._states[commit_sha] = status
+                logger.debug(f"Build {run_id} ({commit_sha[:7]}): {status}")
+
+            if status not in ACTIVE_RUN_STATES:
+                self._watched.pop(commit_sha, None)
+                self._states.pop(commit_sha, None)
+                self.task_manager.resolve_build(commit_sha, status, run_id)
+
+        return changed
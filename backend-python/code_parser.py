@@ -8,7 +8,7 @@ Supports two modes:
 """
 
 import re
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,6 +17,16 @@ logger = logging.getLogger(__name__)
 LOGIC_START = "// === AI_LOGIC_START ==="
 LOGIC_END = "// === AI_LOGIC_END ==="
 
+# One compiler diagnostic per line, GCC/Clang or MSVC style:
+#   Source/PluginProcessor.cpp:42:13: error: 'foo' was not declared in this scope
+#   D:\a\x\Source\PluginProcessor.cpp(42,13): error C2065: 'foo': undeclared identifier [..vcxproj]
+_COMPILER_ERROR_RE = re.compile(
+    r"(?P<file>[^\s:(]+\.(?:cpp|h|hpp))"
+    r"(?:\((?P<paren_line>\d+)(?:,\d+)?\)|:(?P<line>\d+)(?::\d+)?)"
+    r":\s*(?:fatal\s+)?error\b(?P<code>\s+C\d+)?:?\s*(?P<msg>.*?)\s*(?:\[[^\]]*\])?$",
+    re.MULTILINE,
+)
+
 
 class CodeParser:
     """Extract C++ code blocks from AI markdown responses."""
@@ -231,6 +241,37 @@ class CodeParser:
 
         return processor_code, editor_code
 
+    @classmethod
+    def extract_compiler_errors(cls, build_log: str, limit: int = 20) -> List[str]:
+        """
+        Collect the distinct compiler errors from a build log.
+
+        Both toolchains in the build matrix report every error they find, so
+        one log usually holds several; they are normalized to
+        "File.cpp:line: message" and de-duplicated in order.
+
+        Args:
+            build_log: Compiler/build output
+            limit: Maximum number of errors to return
+
+        Returns:
+            Error lines (empty if none were recognized)
+        """
+        errors: List[str] = []
+        seen = set()
+        for match in _COMPILER_ERROR_RE.finditer(build_log):
+            filename = re.split(r"[\\/]", match["file"])[-1]
+            line = match["line"] or match["paren_line"]
+            code = (match["code"] or "").strip()
+            message = f"{code}: {match['msg']}" if code else match["msg"]
+            error = f"{filename}:{line}: {message}"
+            if error not in seen:
+                seen.add(error)
+                errors.append(error)
+                if len(errors) == limit:
+                    break
+        return errors
+
     @classmethod
     def validate_code(
         cls, processor_code: str, editor_code: str
@@ -11,7 +11,8 @@ This module implements the "Architect Verification Gate" that:
 
 import re
 import logging
-from typing import Optional, Tuple, Set, Dict, List
+from functools import lru_cache
+from typing import Callable, Match, Optional, Pattern, Tuple, Set, Dict, List
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -325,11 +326,13 @@ class CodeVerifier:
         )
 
     @classmethod
+    @lru_cache(maxsize=32)
     def get_context_prompt(cls, template_type: str) -> str:
         """
         Generate a context prompt that tells the AI exactly what identifiers are available.
 
         This should be included in the system prompt to prevent hallucinations.
+        The output depends only on template_type, so it is memoized.
 
         Args:
             template_type: Type of plugin template
@@ -395,6 +398,90 @@ def verify_before_commit(
     )
 
 
+# ============================================================================
+# DETERMINISTIC REPAIR
+# Recurring compiler errors with a known fix skip the LLM repair round-trip
+# ============================================================================
+
+def _qualify_juce(code: str, match: Match) -> Optional[str]:
+    """Prefix bare uses of a JUCE name the compiler suggested as juce::X."""
+    name = match["name"]
+    return re.sub(rf"(?<![\w:.>]){re.escape(name)}\b", f"juce::{name}", code)
+
+
+def _correct_typo(code: str, match: Match) -> Optional[str]:
+    """Replace a known hallucinated identifier with the declared one."""
+    right = TYPO_CORRECTIONS.get(match["name"])
+    # The replacement must exist in this file, or the fix just moves the error
+    if right is None or not re.search(rf"\b{re.escape(right)}\b", code):
+        return None
+    return CodeVerifier.auto_correct_code(code, {match["name"]: right})
+
+
+def _include_cmath(code: str, match: Match) -> Optional[str]:
+    """Add the missing <cmath> include after the last existing include."""
+    if "#include <cmath>" in code:
+        return None
+    includes = list(re.finditer(r"^#include[^\n]*\n", code, re.MULTILINE))
+    if not includes:
+        return "#include <cmath>\n" + code
+    end = includes[-1].end()
+    return code[:end] + "#include <cmath>\n" + code[end:]
+
+
+# (pattern over one normalized error line, fix(code, match) -> code or None)
+_DETERMINISTIC_FIXES: List[Tuple[Pattern, Callable[[str, Match], Optional[str]]]] = [
+    # GCC: 'String' was not declared in this scope; did you mean 'juce::String'?
+    (re.compile(r"'(?P<name>\w+)' was not declared in this scope; did you mean 'juce::(?P=name)'"), _qualify_juce),
+    # GCC / MSVC: undeclared identifier that is a known AI typo
+    (re.compile(r"'(?P<name>\w+)' was not declared in this scope"), _correct_typo),
+    (re.compile(r"C2065: '(?P<name>\w+)': undeclared identifier"), _correct_typo),
+    # GCC / MSVC: std:: math functions without <cmath>
+    (re.compile(r"'(?P<name>isfinite|isnan|isinf|tanh|atan|sin|cos|pow|sqrt|abs|fabs|exp|log|log10)':? is not a member of 'std'"), _include_cmath),
+]
+
+
+def try_deterministic_repair(
+    errors: List[str],
+    original_code: str,
+    filename: str
+) -> Optional[str]:
+    """
+    Fix a failed build without an LLM call when every error is a known pattern.
+
+    Args:
+        errors: Distinct compiler errors (see CodeParser.extract_compiler_errors)
+        original_code: The code that failed to compile
+        filename: Source file being repaired (e.g. "Source/PluginProcessor.cpp")
+
+    Returns:
+        Fixed code, or None if any error is novel, in another file, or the
+        fixes leave the code unchanged
+    """
+    if not errors:
+        return None
+
+    basename = filename.rsplit("/", 1)[-1]
+    code = original_code
+    for error in errors:
+        if not error.startswith(f"{basename}:"):
+            return None
+        for pattern, fix in _DETERMINISTIC_FIXES:
+            match = pattern.search(error)
+            if match is not None:
+                fixed = fix(code, match)
+                if fixed is not None:
+                    code = fixed
+                    break
+        else:
+            return None
+
+    if code == original_code:
+        return None
+    logger.info(f"Deterministic repair fixed {len(errors)} error(s) in {basename}")
+    return code
+
+
 # ============================================================================
 # HEADER CONSISTENCY VALIDATION
 # Validates that all identifiers used in .cpp files are declared in .h files
@@ -23,12 +23,36 @@ class Settings(BaseSettings):
     GEMINI_MODEL: str = "gemini-2.0-flash"  # Use stable model for now
     CLAUDE_MODEL: str = "claude-sonnet-4-20250514"
 
+    # Generation worker pool
+    GENERATION_WORKERS: int = 4  # Tasks generated concurrently
+    GENERATION_QUEUE_SIZE: int = 1024  # Pending tasks before /generate returns 503
+
+    # Max concurrent LLM requests across all tasks
+    LLM_MAX_CONCURRENCY: int = 4
+
     # Retry Configuration
     MAX_RETRY_ATTEMPTS: int = 3
 
+    # Reuse code that built successfully for repeated prompts (0 disables)
+    SYNTHESIS_CACHE_TTL_SECONDS: float = 3600.0
+
     # Build Monitoring
-    BUILD_POLL_INTERVAL_SECONDS: int = 5
+    BUILD_POLL_INTERVAL_SECONDS: int = 5  # Initial interval; backs off while unchanged
+    BUILD_POLL_MAX_INTERVAL_SECONDS: int = 30
     BUILD_TIMEOUT_SECONDS: int = 600  # 10 minutes (builds take ~6 min)
+    WORKFLOW_LOOKUP_TIMEOUT_SECONDS: float = 30.0  # Max wait for a run to appear after push
+    GITHUB_STATUS_CACHE_TTL_SECONDS: float = 4.0  # Below the poll interval so transitions aren't masked
+    GITHUB_IO_WORKERS: int = 16  # Threads for blocking GitHub calls (artifacts, log parsing)
+
+    # GitHub Webhooks (workflow_run events resolve builds without polling)
+    GITHUB_WEBHOOK_SECRET: Optional[str] = None
+    BUILD_RECONCILE_INTERVAL_SECONDS: int = 60  # Fallback poll when webhooks are enabled
+
+    # CI warm-up workflow dispatched during synthesis (None disables)
+    GITHUB_WARMUP_WORKFLOW: Optional[str] = "warmup.yml"
+
+    # Development
+    DEBUG: bool = False  # Enables auto-reload when run via `python -m backend.main`
 
     class Config:
         env_file = ".env"
@@ -426,9 +426,6 @@ class CppGenerator:
         # Generate DSP code based on category
         dsp_code = cls._generate_dsp_for_category(response)
 
-        # Generate member variables for specific plugin types
-        member_vars = cls._generate_member_variables(response)
-
         # Assemble the complete file
         return f'''#include "PluginProcessor.h"
 #include "PluginEditor.h"
@@ -569,19 +566,19 @@ void VAIstAudioProcessorEditor::resized()
     def _generate_dsp_for_category(cls, response: PluginResponse) -> str:
         """Generate DSP code based on plugin category."""
         if response.category in [PluginCategory.WAVESHAPER, PluginCategory.DISTORTION]:
-            dsp = response.waveshaper_dsp or WaveshaperDSP()
+            dsp = response.dsp if isinstance(response.dsp, WaveshaperDSP) else WaveshaperDSP()
             return cls.generate_waveshaper_dsp(dsp, response.parameters)
 
         elif response.category == PluginCategory.FILTER:
-            dsp = response.filter_dsp or FilterDSP()
+            dsp = response.dsp if isinstance(response.dsp, FilterDSP) else FilterDSP()
             return cls.generate_filter_dsp(dsp, response.parameters)
 
         elif response.category == PluginCategory.DELAY:
-            dsp = response.delay_dsp or DelayDSP()
+            dsp = response.dsp if isinstance(response.dsp, DelayDSP) else DelayDSP()
             return cls.generate_delay_dsp(dsp, response.parameters)
 
         elif response.category == PluginCategory.GAIN:
-            dsp = response.gain_dsp or GainDSP()
+            dsp = response.dsp if isinstance(response.dsp, GainDSP) else GainDSP()
             return cls.generate_gain_dsp(dsp, response.parameters)
 
         elif response.category == PluginCategory.TREMOLO:
@@ -602,7 +599,7 @@ void VAIstAudioProcessorEditor::resized()
         z2[i] = 0.0f;
     }"""
         elif response.category == PluginCategory.DELAY:
-            max_delay = response.delay_dsp.max_delay_ms if response.delay_dsp else 1000.0
+            max_delay = response.dsp.max_delay_ms if isinstance(response.dsp, DelayDSP) else 1000.0
             return f"""    // Initialize delay buffer
     bufferSize = static_cast<int>(sampleRate * {max_delay / 1000.0} + 1);
     delayBuffer.setSize(2, bufferSize);
@@ -3,18 +3,89 @@ vAIst GitHub Manager
 PyGithub automation for pushing code and monitoring builds.
 """
 
+import asyncio
+import base64
+import io
 import logging
+import math
 import random
 import re
 import string
-from typing import Optional, Tuple
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import IO, Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
-from github import Github, GithubException, InputGitTreeElement
+import httpx
+from github import Github, GithubException
 
+from backend.cache import TTLCache
 from backend.config import Settings
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Run states that never change once reached
+TERMINAL_RUN_STATES = frozenset({"success", "failure", "cancelled"})
+# States of runs that have not completed yet
+ACTIVE_RUN_STATES = frozenset({"requested", "waiting", "pending", "queued", "in_progress"})
+
+# Workflow log scanning: only compiler diagnostics are kept for repair prompts
+LOG_MAX_LINES = 64
+LOG_CONTEXT_AFTER = 3
+LOG_SPOOL_BYTES = 8 * 1024 * 1024
+_LOG_STEP_RE = re.compile(r"build|compile|cmake", re.IGNORECASE)
+_LOG_ERROR_RE = re.compile(
+    r"\berror\b[: ]|error C\d+|undefined reference|fatal error", re.IGNORECASE
+)
+_LOG_TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T[\d:.]+Z ")
+
+# Pushes: branch head + CMakeLists.txt in one query, then one commit mutation
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+# Actions cache keys written by warmup.yml; must match its `key:` lines
+WARMUP_CACHE_KEYS = ("juce-src-Windows-v1", "juce-src-macOS-v1")
+
+PUSH_ATTEMPTS = 3  # Retries when another push moves the branch in between
+_BRANCH_HEAD_QUERY = """
+query($owner: String!, $name: String!, $ref: String!) {
+  repository(owner: $owner, name: $name) {
+    ref(qualifiedName: $ref) {
+      target {
+        oid
+        ... on Commit {
+          file(path: "CMakeLists.txt") { object { ... on Blob { text } } }
+        }
+      }
+    }
+  }
+}
+"""
+_CREATE_COMMIT_MUTATION = """
+mutation($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) { commit { oid } }
+}
+"""
+
+
+class GitHubGraphQLError(Exception):
+    """Error payload returned by the GitHub GraphQL API."""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self.errors = errors
+        super().__init__("; ".join(e.get("message", str(e)) for e in errors))
+
+    @property
+    def is_stale_head(self) -> bool:
+        """True if the branch moved since expectedHeadOid was read."""
+        return any(
+            e.get("type") == "STALE_DATA"
+            or "Expected branch to point to" in e.get("message", "")
+            for e in self.errors
+        )
+
 
 def generate_unique_id() -> str:
     """
@@ -42,10 +113,125 @@ class GitHubManager:
         """
         self.settings = settings
         self.github = Github(settings.GITHUB_TOKEN)
-        self.repo = self.github.get_repo(settings.GITHUB_REPO)
+        # Lazy: no blocking request at construction (PyGithub is only used
+        # for artifact lookups, run on the I/O pool below)
+        self.repo = self.github.get_repo(settings.GITHUB_REPO, lazy=True)
+        # Dedicated threads for blocking PyGithub calls and log parsing, so
+        # they never queue behind (or starve) the default executor
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=settings.GITHUB_IO_WORKERS, thread_name_prefix="gh-io"
+        )
+        # Shared keep-alive HTTP/2 client for status/log polling
+        self._http = httpx.AsyncClient(
+            base_url=f"{GITHUB_API_URL}/repos/{settings.GITHUB_REPO}",
+            http2=True,
+            headers={
+                "Authorization": f"Bearer {settings.GITHUB_TOKEN}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            timeout=10.0,
+        )
+        # In-flight lookups keyed by request, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Last (ETag, payload) per GET, for conditional requests
+        self._etag_cache = TTLCache(maxsize=512, ttl=math.inf)
+        # Recent run statuses; terminal ones are kept until evicted
+        self._status_cache = TTLCache(
+            maxsize=1024, ttl=settings.GITHUB_STATUS_CACHE_TTL_SECONDS
+        )
         logger.info(f"GitHub manager initialized for {settings.GITHUB_REPO}")
 
-    def push_code(
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and the I/O thread pool."""
+        await self._http.aclose()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking function on the dedicated I/O pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, partial(func, *args))
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a REST resource with ETag revalidation.
+
+        The previous ETag is sent as If-None-Match; GitHub answers an unchanged
+        resource with an empty 304 that does not count against the rate limit,
+        and the cached payload is returned instead.
+
+        Args:
+            path: API path relative to the repository
+            params: Query parameters
+
+        Returns:
+            Decoded JSON payload
+
+        Raises:
+            httpx.HTTPError: On transport errors or non-2xx responses
+        """
+        key = path if not params else f"{path}?{sorted(params.items())}"
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = await self._http.get(path, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        response.raise_for_status()
+        payload = response.json()
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache.set(key, (etag, payload))
+        return payload
+
+    async def _single_flight(self, key: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a lookup once per key, coalescing concurrent callers.
+
+        While a request for `key` is in flight, further callers await the same
+        future instead of issuing an identical HTTPS round-trip.
+
+        Args:
+            key: Identity of the request (e.g. "status:<run_id>")
+            func: Coroutine function, or blocking function run on the I/O pool
+            *args: Arguments for func
+
+        Returns:
+            Result of func
+        """
+        while (pending := self._inflight.get(key)) is not None:
+            try:
+                # Shield so a cancelled waiter doesn't cancel the shared request
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The owner was cancelled, not us: issue the request ourselves
+                if not pending.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            if asyncio.iscoroutinefunction(func):
+                result = await func(*args)
+            else:
+                result = await self._run_blocking(func, *args)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a future nobody awaited isn't logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def push_code(
         self,
         processor_code: str,
         editor_code: str,
@@ -60,8 +246,10 @@ class GitHubManager:
         Also updates CMakeLists.txt with a unique PLUGIN_CODE to prevent
         DAW scanning conflicts.
 
-        Uses Git Data API to push all files atomically in one commit,
-        preventing race conditions where partial updates cause build failures.
+        Uses the GraphQL createCommitOnBranch mutation, so all files land
+        atomically in one commit with two requests in total (branch head +
+        CMakeLists.txt, then the commit), instead of one REST call per blob,
+        tree, commit and ref update.
 
         Args:
             processor_code: PluginProcessor.cpp content
@@ -82,93 +270,65 @@ class GitHubManager:
             unique_id = generate_unique_id()
             logger.info(f"Generated unique plugin ID: {unique_id}")
 
-            # Get current branch reference
-            ref = self.repo.get_git_ref(f"heads/{branch}")
-            base_sha = ref.object.sha
-            base_commit = self.repo.get_git_commit(base_sha)
-            base_tree = base_commit.tree
-
-            logger.info(f"Creating atomic commit on branch: {branch}")
-
-            # Get current CMakeLists.txt and update PLUGIN_CODE
-            cmake_file = self.repo.get_contents("CMakeLists.txt", ref=branch)
-            cmake_content = cmake_file.decoded_content.decode('utf-8')
-            updated_cmake = self._update_plugin_code(cmake_content, unique_id)
-
-            # Create blobs for all files
-            tree_elements = []
-
-            # CMakeLists.txt (if changed)
-            if updated_cmake != cmake_content:
-                cmake_blob = self.repo.create_git_blob(updated_cmake, "utf-8")
-                tree_elements.append(InputGitTreeElement(
-                    path="CMakeLists.txt",
-                    mode="100644",
-                    type="blob",
-                    sha=cmake_blob.sha,
-                ))
-                logger.info(f"Updated CMakeLists.txt with PLUGIN_CODE: {unique_id}")
-
-            # PluginProcessor.h (if provided)
-            if processor_h:
-                processor_h_blob = self.repo.create_git_blob(processor_h, "utf-8")
-                tree_elements.append(InputGitTreeElement(
-                    path="Source/PluginProcessor.h",
-                    mode="100644",
-                    type="blob",
-                    sha=processor_h_blob.sha,
-                ))
-                logger.info("Pushing PluginProcessor.h")
-
-            # PluginProcessor.cpp
-            processor_blob = self.repo.create_git_blob(processor_code, "utf-8")
-            tree_elements.append(InputGitTreeElement(
-                path="Source/PluginProcessor.cpp",
-                mode="100644",
-                type="blob",
-                sha=processor_blob.sha,
-            ))
-
-            # PluginEditor.h (if provided)
-            if editor_h:
-                editor_h_blob = self.repo.create_git_blob(editor_h, "utf-8")
-                tree_elements.append(InputGitTreeElement(
-                    path="Source/PluginEditor.h",
-                    mode="100644",
-                    type="blob",
-                    sha=editor_h_blob.sha,
-                ))
-                logger.info("Pushing PluginEditor.h")
-
-            # PluginEditor.cpp
-            editor_blob = self.repo.create_git_blob(editor_code, "utf-8")
-            tree_elements.append(InputGitTreeElement(
-                path="Source/PluginEditor.cpp",
-                mode="100644",
-                type="blob",
-                sha=editor_blob.sha,
-            ))
-
-            logger.info(f"Pushing {len(tree_elements)} files in atomic commit")
-
-            # Create new tree with all changes
-            new_tree = self.repo.create_git_tree(tree_elements, base_tree)
-
-            # Create single commit with all changes
-            new_commit = self.repo.create_git_commit(
-                message=commit_message,
-                tree=new_tree,
-                parents=[base_commit],
-            )
-
-            # Update branch reference
-            ref.edit(new_commit.sha)
-
-            logger.info(f"Successfully pushed code (atomic): {new_commit.sha}")
-            return new_commit.sha, None
-
-        except GithubException as e:
-            error_msg = f"GitHub push failed: {e.data.get('message', str(e))}"
+            files = [
+                ("Source/PluginProcessor.h", processor_h),
+                ("Source/PluginProcessor.cpp", processor_code),
+                ("Source/PluginEditor.h", editor_h),
+                ("Source/PluginEditor.cpp", editor_code),
+            ]
+
+            for attempt in range(1, PUSH_ATTEMPTS + 1):
+                head_oid, cmake_content = await self._get_branch_head(branch)
+                logger.info(f"Creating atomic commit on branch: {branch}")
+
+                additions = []
+
+                # CMakeLists.txt (if changed)
+                updated_cmake = self._update_plugin_code(cmake_content, unique_id)
+                if updated_cmake != cmake_content:
+                    additions.append(self._file_addition("CMakeLists.txt", updated_cmake))
+                    logger.info(f"Updated CMakeLists.txt with PLUGIN_CODE: {unique_id}")
+
+                # Headers are only pushed when provided
+                additions.extend(
+                    self._file_addition(path, content)
+                    for path, content in files
+                    if content
+                )
+
+                logger.info(f"Pushing {len(additions)} files in atomic commit")
+
+                try:
+                    data = await self._graphql(
+                        _CREATE_COMMIT_MUTATION,
+                        {
+                            "input": {
+                                "branch": {
+                                    "repositoryNameWithOwner": self.settings.GITHUB_REPO,
+                                    "branchName": branch,
+                                },
+                                "message": {"headline": commit_message},
+                                "expectedHeadOid": head_oid,
+                                "fileChanges": {"additions": additions},
+                            }
+                        },
+                    )
+                except GitHubGraphQLError as e:
+                    if e.is_stale_head and attempt < PUSH_ATTEMPTS:
+                        logger.warning(f"Branch {branch} moved during push, retrying")
+                        continue
+                    raise
+
+                commit_sha = data["createCommitOnBranch"]["commit"]["oid"]
+                logger.info(f"Successfully pushed code (atomic): {commit_sha}")
+                return commit_sha, None
+
+        except GitHubGraphQLError as e:
+            error_msg = f"GitHub push failed: {e}"
+            logger.error(error_msg)
+            return None, error_msg
+        except httpx.HTTPError as e:
+            error_msg = f"GitHub push failed: {e}"
             logger.error(error_msg)
             return None, error_msg
         except Exception as e:
@@ -176,6 +336,50 @@ class GitHubManager:
             logger.exception(error_msg)
             return None, error_msg
 
+    async def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GraphQL query or mutation.
+
+        Raises:
+            httpx.HTTPError: On transport errors or non-2xx responses
+            GitHubGraphQLError: If the response carries errors
+        """
+        response = await self._http.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            raise GitHubGraphQLError(payload["errors"])
+        return payload["data"]
+
+    async def _get_branch_head(self, branch: str) -> Tuple[str, str]:
+        """
+        Get the branch head commit and its CMakeLists.txt in one query.
+
+        Returns:
+            (head commit SHA, CMakeLists.txt content)
+        """
+        owner, name = self.settings.GITHUB_REPO.split("/", 1)
+        data = await self._graphql(
+            _BRANCH_HEAD_QUERY,
+            {"owner": owner, "name": name, "ref": f"refs/heads/{branch}"},
+        )
+        ref = data["repository"]["ref"]
+        if ref is None:
+            raise GitHubGraphQLError([{"message": f"Branch {branch} not found"}])
+
+        target = ref["target"]
+        cmake = (target.get("file") or {}).get("object") or {}
+        return target["oid"], cmake.get("text") or ""
+
+    @staticmethod
+    def _file_addition(path: str, content: str) -> Dict[str, str]:
+        """Build a createCommitOnBranch file addition (base64 contents)."""
+        return {"path": path, "contents": base64.b64encode(content.encode("utf-8")).decode("ascii")}
+
     def _update_plugin_code(self, cmake_content: str, unique_id: str) -> str:
         """
         Update PLUGIN_CODE in CMakeLists.txt with unique ID.
@@ -200,87 +404,413 @@ class GitHubManager:
 
         return updated
 
-    def get_workflow_status(
-        self, commit_sha: str
-    ) -> Tuple[str, Optional[int], Optional[str]]:
+    async def find_run_for_sha(
+        self, commit_sha: str, timeout: float = 10.0
+    ) -> Optional[int]:
+        """
+        Find the workflow run triggered by a pushed commit.
+
+        Queries runs filtered by head SHA, starting at 500ms and backing off,
+        so the run is picked up as soon as GitHub registers the push.
+
+        Args:
+            commit_sha: Git commit SHA
+            timeout: Maximum seconds to wait for the run to appear
+
+        Returns:
+            Workflow run ID, or None if no run appeared within timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.5
+
+        while True:
+            run_id = await self._single_flight(
+                f"run:{commit_sha}", self._fetch_run_id, commit_sha
+            )
+            if run_id:
+                return run_id
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning(f"No workflow run found for commit {commit_sha} after {timeout}s")
+                return None
+
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 4.0)
+
+    async def _fetch_run_id(self, commit_sha: str) -> Optional[int]:
         """
-        Get the status of GitHub Actions workflow for a commit.
+        Look up the workflow run for a commit.
 
         Args:
             commit_sha: Git commit SHA
 
         Returns:
-            Tuple of (status, run_id, workflow_url)
-            Status values: "queued", "in_progress", "success", "failure", "not_found", "error"
+            Workflow run ID or None if not registered yet
         """
         try:
-            # Find workflow runs for this commit
-            workflows = self.repo.get_workflow_runs(
-                branch=self.settings.GITHUB_BRANCH,
+            payload = await self._get_json(
+                "/actions/runs",
+                params={"head_sha": commit_sha, "event": "push", "per_page": 1},
             )
+            runs = payload.get("workflow_runs") or []
+            return runs[0]["id"] if runs else None
+
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to look up workflow run: {e}")
+            return None
+        except Exception as e:
+            logger.exception("Unexpected error looking up workflow run")
+            return None
 
-            for run in workflows:
-                if run.head_sha == commit_sha:
-                    status = run.status  # queued, in_progress, completed
-                    conclusion = run.conclusion  # success, failure, cancelled, etc.
+    @staticmethod
+    def run_state(run: Dict[str, Any]) -> str:
+        """
+        Collapse a run payload's status/conclusion into one state.
 
-                    logger.debug(
-                        f"Workflow {run.id}: status={status}, conclusion={conclusion}"
-                    )
+        Args:
+            run: Workflow run JSON from the REST API
 
-                    if status == "completed":
-                        # Return the conclusion as status
-                        return conclusion or "unknown", run.id, run.html_url
-                    else:
-                        # Still running
-                        return status, run.id, run.html_url
+        Returns:
+            The conclusion for completed runs (success, failure, cancelled, ...),
+            otherwise the status (queued, in_progress, ...)
+        """
+        if run.get("status") == "completed":
+            return run.get("conclusion") or "unknown"
+        return run.get("status") or "unknown"
 
-            logger.debug(f"No workflow found for commit {commit_sha}")
-            return "not_found", None, None
+    async def trigger_warmup_workflow(self) -> bool:
+        """
+        Dispatch the CI warm-up workflow.
 
-        except GithubException as e:
+        Called while synthesis is still running so runner startup and the
+        JUCE fetch overlap with the LLM calls instead of following them.
+        Skipped when the Actions cache already holds every warm-up key, so
+        runners are only started when there is something to warm.
+        Best effort: failures are logged and otherwise ignored.
+
+        Returns:
+            True if the workflow was dispatched
+        """
+        workflow = self.settings.GITHUB_WARMUP_WORKFLOW
+        if not workflow:
+            return False
+
+        try:
+            payload = await self._get_json(
+                "/actions/caches", params={"key": "juce-src-", "per_page": 100}
+            )
+            cached = {c.get("key") for c in payload.get("actions_caches", [])}
+            if cached.issuperset(WARMUP_CACHE_KEYS):
+                logger.debug("Warm-up caches present, skipping dispatch")
+                return False
+        except httpx.HTTPError as e:
+            # Unknown cache state; fall through and warm anyway
+            logger.debug(f"Failed to list Actions caches: {e}")
+
+        try:
+            response = await self._http.post(
+                f"/actions/workflows/{workflow}/dispatches",
+                json={"ref": self.settings.GITHUB_BRANCH},
+            )
+            response.raise_for_status()
+            logger.info(f"Dispatched warm-up workflow {workflow}")
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to dispatch warm-up workflow: {e}")
+            return False
+
+    async def list_recent_runs(self, per_page: int = 50) -> List[Dict[str, Any]]:
+        """
+        List the most recent push-triggered runs on the build branch.
+
+        One request returns the state of every in-flight build, and it is
+        ETag-revalidated, so an unchanged listing costs an empty 304.
+
+        Args:
+            per_page: Number of runs to fetch (newest first)
+
+        Returns:
+            Workflow run payloads
+
+        Raises:
+            httpx.HTTPError: On transport errors or non-2xx responses
+        """
+        payload = await self._get_json(
+            "/actions/runs",
+            params={
+                "branch": self.settings.GITHUB_BRANCH,
+                "event": "push",
+                "per_page": per_page,
+            },
+        )
+        return payload.get("workflow_runs") or []
+
+    async def get_run_status(self, run_id: int) -> Tuple[str, Optional[str]]:
+        """
+        Get the status of a GitHub Actions workflow run.
+
+        Concurrent calls for the same run share a single request, and
+        results are cached: in-progress states for
+        GITHUB_STATUS_CACHE_TTL_SECONDS, terminal states indefinitely.
+
+        Args:
+            run_id: GitHub Actions workflow run ID
+
+        Returns:
+            Tuple of (status, workflow_url)
+            Status values: "queued", "in_progress", "success", "failure", "cancelled", "error"
+        """
+        cached = self._status_cache.get(run_id)
+        if cached is not None:
+            return cached
+
+        result = await self._single_flight(
+            f"status:{run_id}", self._fetch_run_status, run_id
+        )
+
+        status = result[0]
+        if status in TERMINAL_RUN_STATES:
+            self._status_cache.set(run_id, result, ttl=math.inf)
+        elif status != "error":
+            self._status_cache.set(run_id, result)
+        return result
+
+    async def _fetch_run_status(self, run_id: int) -> Tuple[str, Optional[str]]:
+        """
+        Fetch the status of a workflow run.
+
+        Args:
+            run_id: GitHub Actions workflow run ID
+
+        Returns:
+            Tuple of (status, workflow_url)
+        """
+        try:
+            run = await self._get_json(f"/actions/runs/{run_id}")
+            logger.debug(
+                f"Workflow {run_id}: status={run['status']}, conclusion={run.get('conclusion')}"
+            )
+            return self.run_state(run), run.get("html_url")
+
+        except httpx.HTTPError as e:
             logger.error(f"Failed to get workflow status: {e}")
-            return "error", None, None
+            return "error", None
         except Exception as e:
             logger.exception("Unexpected error getting workflow status")
-            return "error", None, None
+            return "error", None
 
-    def get_workflow_logs(self, run_id: int) -> Optional[str]:
+    async def get_workflow_logs(self, run_id: int) -> Optional[str]:
         """
-        Get summary of a workflow run.
+        Get the compiler errors of a workflow run.
 
-        Note: Full log download requires additional API calls.
-        For MVP, we just return basic info.
+        The run's log archive is streamed into a spooled temp file (spilling to
+        disk for large archives) and only the build steps are scanned; just the
+        error lines and a few lines of context are kept, so the repair prompt
+        never carries the full CI log.
 
         Args:
             run_id: GitHub Actions workflow run ID
 
         Returns:
-            Summary string or None if unavailable
+            Job summary followed by extracted error lines, or None if unavailable
         """
         try:
-            run = self.repo.get_workflow_run(run_id)
+            run_response, jobs_response = await asyncio.gather(
+                self._http.get(f"/actions/runs/{run_id}"),
+                self._http.get(f"/actions/runs/{run_id}/jobs"),
+            )
+            run_response.raise_for_status()
+            jobs_response.raise_for_status()
+            run = run_response.json()
 
             # Get job summaries
-            jobs = run.jobs()
             job_summaries = []
 
-            for job in jobs:
-                status = job.conclusion or job.status
-                job_summaries.append(f"{job.name}: {status}")
+            for job in jobs_response.json().get("jobs", []):
+                status = job.get("conclusion") or job.get("status")
+                job_summaries.append(f"{job['name']}: {status}")
 
-            summary = f"Workflow {run_id} ({run.conclusion})\n"
+            summary = f"Workflow {run_id} ({run.get('conclusion')})\n"
             summary += "\n".join(job_summaries)
 
+            error_lines = await self._scan_log_archive(run["logs_url"])
+            if error_lines:
+                summary += "\n\nCompiler errors:\n" + "\n".join(error_lines)
+
             return summary
 
-        except GithubException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to get workflow logs: {e}")
             return None
         except Exception as e:
             logger.exception("Unexpected error getting workflow logs")
             return None
 
+    async def get_failed_step_tail(self, run_id: int, max_bytes: int = 16384) -> Optional[str]:
+        """
+        Get the tail of each failed job's log.
+
+        Only the last `max_bytes` of every failed job log are requested (HTTP
+        Range), which is where the compiler error that stopped the build is.
+        Error lines within the tail are preferred; otherwise the raw tail is
+        returned.
+
+        Args:
+            run_id: GitHub Actions workflow run ID
+            max_bytes: Bytes to fetch from the end of each failed job log
+
+        Returns:
+            Log tails labelled by job name, or None if unavailable
+        """
+        try:
+            payload = await self._get_json(f"/actions/runs/{run_id}/jobs")
+            failed_jobs = [
+                job for job in payload.get("jobs", [])
+                if job.get("conclusion") == "failure"
+            ]
+            if not failed_jobs:
+                return None
+
+            tails = await asyncio.gather(
+                *(self._fetch_log_tail(job["id"], max_bytes) for job in failed_jobs)
+            )
+
+            sections = [
+                f"== {job['name']} ==\n{tail}"
+                for job, tail in zip(failed_jobs, tails)
+                if tail
+            ]
+            return "\n\n".join(sections) or None
+
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to get failed job log tail: {e}")
+            return None
+        except Exception as e:
+            logger.exception("Unexpected error getting failed job log tail")
+            return None
+
+    async def _fetch_log_tail(self, job_id: int, max_bytes: int) -> str:
+        """
+        Fetch the last bytes of a job log.
+
+        Args:
+            job_id: GitHub Actions job ID
+            max_bytes: Bytes to fetch from the end of the log
+
+        Returns:
+            Error lines from the tail, or the raw tail lines
+        """
+        chunks: Deque[bytes] = deque()
+        size = 0
+
+        async with self._http.stream(
+            "GET",
+            f"/actions/jobs/{job_id}/logs",
+            headers={"Range": f"bytes=-{max_bytes}"},
+            follow_redirects=True,
+            timeout=30.0,
+        ) as response:
+            response.raise_for_status()
+            # Storage may ignore Range (200); keep only the last max_bytes
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                while size - len(chunks[0]) >= max_bytes:
+                    size -= len(chunks.popleft())
+
+        tail = b"".join(chunks)[-max_bytes:].decode("utf-8", errors="replace")
+        # The first line is usually cut mid-way
+        lines = tail.splitlines()[1:]
+
+        error_lines: List[str] = []
+        self._collect_error_lines(iter(lines), error_lines)
+        if error_lines:
+            return "\n".join(error_lines)
+        return "\n".join(_LOG_TIMESTAMP_RE.sub("", line) for line in lines[-LOG_MAX_LINES:])
+
+    async def _scan_log_archive(self, logs_url: str) -> List[str]:
+        """
+        Stream a workflow log archive and extract compiler error lines.
+
+        Args:
+            logs_url: API URL of the run's log archive (redirects to a zip)
+
+        Returns:
+            Up to LOG_MAX_LINES error/context lines (empty if none found)
+        """
+        try:
+            with tempfile.SpooledTemporaryFile(max_size=LOG_SPOOL_BYTES) as archive:
+                # Authorization is dropped on the cross-origin redirect to blob storage
+                async with self._http.stream(
+                    "GET", logs_url, follow_redirects=True, timeout=30.0
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(64 * 1024):
+                        archive.write(chunk)
+
+                archive.seek(0)
+                # Zip scanning is CPU-bound; keep it off the event loop
+                return await self._run_blocking(self._scan_archive_file, archive)
+
+        except (httpx.HTTPError, zipfile.BadZipFile) as e:
+            logger.warning(f"Failed to scan workflow log archive: {e}")
+            return []
+
+    @classmethod
+    def _scan_archive_file(cls, archive: IO[bytes]) -> List[str]:
+        """
+        Extract compiler error lines from a downloaded log archive.
+
+        Args:
+            archive: Seekable zip file object
+
+        Returns:
+            Up to LOG_MAX_LINES error/context lines
+        """
+        with zipfile.ZipFile(archive) as zf:
+            # Per-step logs live in "<job>/<n>_<step>.txt"; top-level files
+            # duplicate whole jobs, so scan steps only
+            step_files = [name for name in zf.namelist() if "/" in name]
+            build_steps = [
+                name for name in step_files
+                if _LOG_STEP_RE.search(name.rsplit("/", 1)[-1])
+            ]
+
+            lines: List[str] = []
+            for name in build_steps or step_files:
+                with zf.open(name) as raw:
+                    text = io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+                    cls._collect_error_lines(text, lines)
+                if len(lines) >= LOG_MAX_LINES:
+                    break
+
+            return lines[:LOG_MAX_LINES]
+
+    @staticmethod
+    def _collect_error_lines(text: Iterable[str], lines: List[str]) -> None:
+        """
+        Append error lines (plus trailing context) from a log stream.
+
+        Args:
+            text: Line iterator over a single step log
+            lines: Output list, filled up to LOG_MAX_LINES
+        """
+        context_left = 0
+        for line in text:
+            line = _LOG_TIMESTAMP_RE.sub("", line.rstrip())
+            if _LOG_ERROR_RE.search(line):
+                context_left = LOG_CONTEXT_AFTER
+            elif context_left:
+                context_left -= 1
+            else:
+                continue
+
+            lines.append(line)
+            if len(lines) >= LOG_MAX_LINES:
+                return
+
     def get_workflow_url(self, run_id: int) -> str:
         """
         Get the URL for a workflow run.
@@ -293,10 +823,26 @@ class GitHubManager:
         """
         return f"https://github.com/{self.settings.GITHUB_REPO}/actions/runs/{run_id}"
 
-    def get_artifact_urls(self, run_id: int) -> dict[str, str]:
+    async def get_artifact_urls(self, run_id: int) -> dict[str, str]:
         """
         Get download URLs for workflow artifacts.
 
+        Concurrent calls for the same run share a single request.
+
+        Args:
+            run_id: GitHub Actions workflow run ID
+
+        Returns:
+            Dict with platform keys ("windows", "macos") and download URLs
+        """
+        return await self._single_flight(
+            f"artifacts:{run_id}", self._fetch_artifact_urls, run_id
+        )
+
+    def _fetch_artifact_urls(self, run_id: int) -> dict[str, str]:
+        """
+        Fetch download URLs for workflow artifacts (blocking).
+
         Note: GitHub artifact download requires authentication, so we return
         the API URL that can be used with the GitHub token.
 
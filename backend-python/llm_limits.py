@@ -0,0 +1,13 @@
+"""
+vAIst LLM Limits
+Process-wide cap on concurrent LLM requests.
+"""
+
+import asyncio
+
+from backend.config import get_settings
+
+# Shared by every LLM call (synthesis, BMAD phases, repairs) across all
+# tasks, so bursts of generations queue here instead of hitting provider
+# rate limits
+LLM_SEMAPHORE = asyncio.Semaphore(get_settings().LLM_MAX_CONCURRENCY)
@@ -4,24 +4,32 @@ AI-powered VST3 plugin generator API.
 """
 
 import asyncio
+import hashlib
+import hmac
+import json
 import logging
+import re
 from contextlib import asynccontextmanager
-from typing import Dict
+from dataclasses import replace
+from enum import Enum
+from typing import Dict, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.cache import TTLCache
 from backend.config import get_settings
 from backend.models import (
     GenerateRequest,
     GenerateResponse,
     StatusResponse,
+    TaskState,
     TaskStatus,
-    DownloadUrls,
 )
 from backend.task_manager import task_manager
 from backend.ai_synthesizer import AISynthesizer
 from backend.github_manager import GitHubManager
+from backend.build_watcher import BuildWatcher
 from backend.bmad_orchestrator import BMADOrchestrator, BMADArtifacts
 from backend.code_verifier import validate_header_consistency
 
@@ -39,6 +47,11 @@ settings = get_settings()
 _ai_synthesizer: AISynthesizer | None = None
 _github_manager: GitHubManager | None = None
 _bmad_orchestrator: BMADOrchestrator | None = None
+_build_watcher: BuildWatcher | None = None
+
+# Bounded generation queue drained by a fixed worker pool (created at startup)
+_generation_queue: "asyncio.Queue[Tuple[str, str]] | None" = None
+_generation_workers: list[asyncio.Task] = []
 
 # Use BMAD v6 pipeline by default (set to False to use legacy single-agent)
 # TEMPORARILY DISABLED: BMAD doesn't generate header files, causing build failures
@@ -70,6 +83,14 @@ def get_bmad_orchestrator() -> BMADOrchestrator:
     return _bmad_orchestrator
 
 
+def get_build_watcher() -> BuildWatcher:
+    """Get or create the shared build watcher."""
+    global _build_watcher
+    if _build_watcher is None:
+        _build_watcher = BuildWatcher(get_github_manager(), task_manager, settings)
+    return _build_watcher
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application startup and shutdown."""
@@ -79,9 +100,26 @@ async def lifespan(app: FastAPI):
     logger.info(f"  GitHub Repo: {settings.GITHUB_REPO}")
     logger.info(f"  Gemini Model: {settings.GEMINI_MODEL}")
     logger.info(f"  Claude Fallback: {'Enabled' if settings.ANTHROPIC_API_KEY else 'Disabled'}")
+    logger.info(f"  Generation Workers: {settings.GENERATION_WORKERS}")
     logger.info("=" * 60)
+
+    global _generation_queue
+    _generation_queue = asyncio.Queue(maxsize=settings.GENERATION_QUEUE_SIZE)
+    _generation_workers.extend(
+        asyncio.create_task(_generation_worker(_generation_queue), name=f"generation-worker-{i}")
+        for i in range(settings.GENERATION_WORKERS)
+    )
+
     yield
     logger.info("vAIst Backend shutting down...")
+    for worker in _generation_workers:
+        worker.cancel()
+    await asyncio.gather(*_generation_workers, return_exceptions=True)
+    _generation_workers.clear()
+    if _build_watcher is not None:
+        await _build_watcher.stop()
+    if _github_manager is not None:
+        await _github_manager.aclose()
 
 
 app = FastAPI(
@@ -94,12 +132,8 @@ app = FastAPI(
 # CORS for local development
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:5173",
-    ],
+    # Compiled once by Starlette; matches localhost/127.0.0.1 on ports 3000 and 5173
+    allow_origin_regex=r"^http://(127\.0\.0\.1|localhost):(3000|5173)$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -111,371 +145,433 @@ app.add_middleware(
 # =============================================================================
 
 
-async def generate_plugin_task(task_id: str, prompt: str):
-    """
-    Background task for the complete plugin generation pipeline.
-
-    Flow (BMAD v6): Analyst -> PM -> Architect -> Developer -> Push -> Build -> Monitor
-    Flow (Legacy):  Synthesize -> Push -> Build -> Monitor
-    """
-    github_manager = get_github_manager()
+class BuildOutcome(str, Enum):
+    """Result of monitoring a pushed build."""
+    SUCCESS = "success"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    NOT_STARTED = "not_started"
 
-    # Store BMAD artifacts for potential repair
-    bmad_artifacts: BMADArtifacts | None = None
 
-    try:
-        # Step 1: Synthesize code with AI (BMAD or legacy)
-        logger.info(f"[{task_id}] Starting code synthesis...")
-        task_manager.update_task(task_id, status=TaskStatus.SYNTHESIZING)
+# Workflow outcomes that end monitoring
+BUILD_DONE_STATES = ("success", "failure", "cancelled")
 
-        # Variables to hold header files (only populated by schema-based mode)
-        processor_h = None
-        editor_h = None
 
-        if USE_BMAD_PIPELINE:
-            # BMAD v6 Pipeline: 4-Phase Gated Pipeline
-            logger.info(f"[{task_id}] Using BMAD v6 pipeline")
-            bmad = get_bmad_orchestrator()
-            processor_code, editor_code, error, bmad_artifacts = await bmad.run_pipeline(prompt)
-        else:
-            # Legacy single-agent approach (now with schema-based mode)
-            logger.info(f"[{task_id}] Using legacy single-agent pipeline")
-            ai_synthesizer = get_ai_synthesizer()
-            processor_code, editor_code, processor_h, editor_h, error = await ai_synthesizer.generate_code(prompt)
+async def wait_for_build(commit_sha: str, run_id: int) -> Optional[str]:
+    """
+    Wait for a workflow run to finish.
 
-        if error or not processor_code or not editor_code:
-            logger.error(f"[{task_id}] Code synthesis failed: {error}")
-            task_manager.update_task(
-                task_id,
-                status=TaskStatus.FAILED,
-                error_message=error or "Code generation failed",
-            )
-            return
+    Completion is delivered by the shared BuildWatcher (one batched runs
+    listing for all in-flight builds) or, with GITHUB_WEBHOOK_SECRET set, by
+    the workflow_run webhook - whichever comes first.
 
-        # Store generated code for potential repair
-        generated_code = {"processor": processor_code, "editor": editor_code}
-        if processor_h:
-            generated_code["processor_h"] = processor_h
-        if editor_h:
-            generated_code["editor_h"] = editor_h
+    Returns:
+        "success", "failure" or "cancelled", or None on timeout
+    """
+    watcher = get_build_watcher()
+    build = watcher.watch(commit_sha, run_id)
+    try:
+        status, _ = await asyncio.wait_for(build, timeout=settings.BUILD_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        return None
+    finally:
+        watcher.unwatch(commit_sha)
 
-        task_manager.update_task(
-            task_id,
-            generated_code=generated_code,
-        )
-        logger.info(f"[{task_id}] Code synthesis complete (files: {list(generated_code.keys())})")
+    # Any other conclusion (timed_out, startup_failure, ...) is a failed build
+    return status if status in BUILD_DONE_STATES else "failure"
 
-        # Step 1b: Validate header consistency BEFORE pushing
-        # This catches undeclared identifier errors locally instead of wasting CI time
-        is_consistent, consistency_errors = validate_header_consistency(
-            processor_h, processor_code, editor_h, editor_code
-        )
 
-        if not is_consistent:
-            # Header validation is ADVISORY only - log warnings but don't block
-            # The JUCE_TYPES allowlist can't cover all inherited methods, so we
-            # let CI be the final arbiter of correctness
-            logger.warning(f"[{task_id}] Header consistency advisory: {len(consistency_errors)} potential issues")
-            for err in consistency_errors[:5]:
-                logger.warning(f"[{task_id}]   - {err}")
-        else:
-            logger.info(f"[{task_id}] Header consistency check PASSED")
+# Code for prompts that already built successfully, keyed by normalized prompt
+_synthesis_cache = TTLCache(maxsize=512, ttl=settings.SYNTHESIS_CACHE_TTL_SECONDS)
 
-        # Step 2: Push to GitHub
-        logger.info(f"[{task_id}] Pushing to GitHub...")
-        task_manager.update_task(task_id, status=TaskStatus.PUSHING)
+# Filler words that don't change what plugin is being asked for
+PROMPT_STOPWORDS = frozenset({
+    "a", "an", "the", "please", "me", "i", "want", "need", "make", "create", "build",
+})
+_PROMPT_WORD_RE = re.compile(r"[a-z0-9]+")
 
-        # Truncate prompt for commit message
-        short_prompt = prompt[:50] + "..." if len(prompt) > 50 else prompt
-        commit_sha, push_error = github_manager.push_code(
-            processor_code,
-            editor_code,
-            commit_message=f"vAIst: {short_prompt}",
-            processor_h=processor_h,  # Schema-based mode generates headers
-            editor_h=editor_h,        # Schema-based mode generates headers
-        )
 
-        if push_error:
-            logger.error(f"[{task_id}] GitHub push failed: {push_error}")
-            task_manager.update_task(
-                task_id,
-                status=TaskStatus.FAILED,
-                error_message=push_error,
-            )
-            return
+def _prompt_cache_key(prompt: str) -> str:
+    """
+    Get the synthesis cache key for a prompt.
 
-        logger.info(f"[{task_id}] Pushed to GitHub: {commit_sha}")
+    Case, punctuation, whitespace and filler words are ignored, so
+    "Make a gain plugin." and "gain plugin" share an entry.
+    """
+    words = [w for w in _PROMPT_WORD_RE.findall(prompt.lower()) if w not in PROMPT_STOPWORDS]
+    return hashlib.sha256(" ".join(words).encode()).hexdigest()[:16]
 
-        # Step 3: Monitor build
-        task_manager.update_task(
-            task_id,
-            status=TaskStatus.BUILDING,
-            commit_sha=commit_sha,
-        )
 
-        # Poll for build completion
-        poll_interval = settings.BUILD_POLL_INTERVAL_SECONDS
-        timeout = settings.BUILD_TIMEOUT_SECONDS
-        max_polls = timeout // poll_interval
+async def _synthesize(
+    task_id: str, prompt: str
+) -> Tuple[Optional[Dict[str, str]], Optional[str], BMADArtifacts | None]:
+    """
+    Generate plugin code with the configured pipeline.
 
-        logger.info(f"[{task_id}] Monitoring build (timeout: {timeout}s)...")
+    Returns:
+        (generated_code, error_message, bmad_artifacts)
+        generated_code holds "processor", "editor" and, in schema mode,
+        "processor_h" / "editor_h".
+    """
+    bmad_artifacts: BMADArtifacts | None = None
 
-        for poll in range(max_polls):
-            await asyncio.sleep(poll_interval)
+    # Header files are only populated by schema-based mode
+    processor_h = None
+    editor_h = None
 
-            status, run_id, url = github_manager.get_workflow_status(commit_sha)
+    if USE_BMAD_PIPELINE:
+        # BMAD v6 Pipeline: 4-Phase Gated Pipeline
+        logger.info(f"[{task_id}] Using BMAD v6 pipeline")
+        bmad = get_bmad_orchestrator()
+        processor_code, editor_code, error, bmad_artifacts = await bmad.run_pipeline(prompt)
+    else:
+        # Legacy single-agent approach (now with schema-based mode)
+        logger.info(f"[{task_id}] Using legacy single-agent pipeline")
+        ai_synthesizer = get_ai_synthesizer()
+        processor_code, editor_code, processor_h, editor_h, error = await ai_synthesizer.generate_code(prompt)
 
-            if run_id:
-                task_manager.update_task(task_id, workflow_run_id=run_id)
+    if error or not processor_code or not editor_code:
+        return None, error or "Code generation failed", bmad_artifacts
 
-            if status == "success":
-                logger.info(f"[{task_id}] Build successful!")
-                # Fetch artifact download URLs
-                artifact_urls = github_manager.get_artifact_urls(run_id)
-                task_manager.update_task(
-                    task_id,
-                    status=TaskStatus.SUCCESS,
-                    workflow_run_id=run_id,
-                    download_urls=artifact_urls if artifact_urls else None,
-                )
-                return
+    generated_code = {"processor": processor_code, "editor": editor_code}
+    if processor_h:
+        generated_code["processor_h"] = processor_h
+    if editor_h:
+        generated_code["editor_h"] = editor_h
 
-            elif status in ("failure", "cancelled"):
-                task = task_manager.get_task(task_id)
-
-                # Attempt self-repair if retries available
-                if task and task.retry_count < settings.MAX_RETRY_ATTEMPTS:
-                    logger.warning(
-                        f"[{task_id}] Build failed, attempting repair "
-                        f"({task.retry_count + 1}/{settings.MAX_RETRY_ATTEMPTS})"
-                    )
-                    await attempt_repair(task_id, github_manager, bmad_artifacts)
-                    return
-                else:
-                    logger.error(f"[{task_id}] Build failed after max retries")
-                    task_manager.update_task(
-                        task_id,
-                        status=TaskStatus.FAILED,
-                        workflow_run_id=run_id,
-                        error_message=f"Build failed after {settings.MAX_RETRY_ATTEMPTS} attempts",
-                    )
-                    return
-
-            elif status == "not_found" and poll < 6:
-                # Give GitHub Actions a few seconds to start
-                logger.debug(f"[{task_id}] Waiting for workflow to start...")
-                continue
-
-            else:
-                logger.debug(f"[{task_id}] Build status: {status}")
-
-        # Timeout
-        logger.error(f"[{task_id}] Build timed out after {timeout}s")
-        task_manager.update_task(
-            task_id,
-            status=TaskStatus.FAILED,
-            error_message=f"Build timed out after {timeout} seconds",
-        )
+    return generated_code, None, bmad_artifacts
 
-    except Exception as e:
-        logger.exception(f"[{task_id}] Unexpected error in generation pipeline")
-        task_manager.update_task(
-            task_id,
-            status=TaskStatus.FAILED,
-            error_message=f"Internal error: {str(e)}",
-        )
 
-
-async def attempt_repair(
+async def _repair(
     task_id: str,
     github_manager: GitHubManager,
-    bmad_artifacts: BMADArtifacts | None = None,
-):
+    generated_code: Dict[str, str],
+    bmad_artifacts: BMADArtifacts | None,
+    retry_count: int,
+) -> Tuple[Optional[Dict[str, str]], Optional[str], BMADArtifacts | None]:
     """
-    Attempt to repair failed code and retry build.
+    Repair code after a failed build.
 
-    BMAD v6: Uses SM Agent to analyze error, Architect to fix tech spec, then Developer to re-execute.
+    BMAD v6: fast single-call repair on the first retry, then SM Agent analysis ->
+    Architect fixes tech spec -> Developer re-executes.
     Legacy: Uses Claude for direct code repair.
+
+    Returns:
+        (generated_code, error_message, bmad_artifacts)
     """
     task = task_manager.get_task(task_id)
-    if not task or not task.generated_code:
-        return
-
-    # Increment retry count
-    task_manager.update_task(
-        task_id,
-        retry_count=task.retry_count + 1,
-        status=TaskStatus.SYNTHESIZING,
-    )
 
-    # Get error info (simplified - in production, parse workflow logs)
+    # Get error info: tail of the failed job logs, falling back to the full archive scan
     error_msg = "Compilation error - please check GitHub Actions logs for details"
 
-    if task.workflow_run_id:
-        logs = github_manager.get_workflow_logs(task.workflow_run_id)
+    if task and task.workflow_run_id:
+        logs = (
+            await github_manager.get_failed_step_tail(task.workflow_run_id)
+            or await github_manager.get_workflow_logs(task.workflow_run_id)
+        )
         if logs:
             error_msg = logs
 
     logger.info(f"[{task_id}] Attempting repair with error: {error_msg[:100]}...")
 
     if USE_BMAD_PIPELINE and bmad_artifacts:
-        # BMAD v6 Repair: SM analyzes -> Architect fixes tech spec -> Developer re-executes
-        logger.info(f"[{task_id}] Using BMAD v6 repair pipeline")
         bmad = get_bmad_orchestrator()
-        processor_code, editor_code, repair_error, bmad_artifacts = await bmad.repair_with_bmad(
-            error_msg,
-            bmad_artifacts,
-            task.retry_count
-        )
+        if retry_count == 1:
+            # First retry: single-call diagnose + patch (most failures are trivial)
+            logger.info(f"[{task_id}] Using BMAD fast repair")
+            processor_code, editor_code, repair_error, bmad_artifacts = await bmad.fast_repair(
+                error_msg,
+                bmad_artifacts,
+            )
+        else:
+            # BMAD v6 Repair: SM analyzes -> Architect fixes tech spec -> Developer re-executes
+            logger.info(f"[{task_id}] Using BMAD v6 repair pipeline")
+            processor_code, editor_code, repair_error, bmad_artifacts = await bmad.repair_with_bmad(
+                error_msg,
+                bmad_artifacts,
+                retry_count
+            )
 
         if repair_error:
-            logger.error(f"[{task_id}] BMAD repair failed: {repair_error}")
-            task_manager.update_task(
-                task_id,
-                status=TaskStatus.FAILED,
-                error_message=f"BMAD repair failed: {repair_error}",
-            )
-            return
+            return None, f"BMAD repair failed: {repair_error}", bmad_artifacts
     else:
         # Legacy repair with Claude
         logger.info(f"[{task_id}] Using legacy repair pipeline")
         ai_synthesizer = get_ai_synthesizer()
 
-        # Get header file to provide context for repair (prevents pattern mismatch)
-        processor_h_for_repair = task.generated_code.get("processor_h")
-
         fixed_processor, repair_error = await ai_synthesizer.repair_code(
-            task.generated_code["processor"],
+            generated_code["processor"],
             error_msg,
             "Source/PluginProcessor.cpp",
-            header_code=processor_h_for_repair,  # Pass header for context
+            header_code=generated_code.get("processor_h"),  # Pass header for context
         )
 
         if repair_error:
-            logger.error(f"[{task_id}] Repair failed: {repair_error}")
-            task_manager.update_task(
-                task_id,
-                status=TaskStatus.FAILED,
-                error_message=f"Repair failed: {repair_error}",
-            )
-            return
+            return None, f"Repair failed: {repair_error}", bmad_artifacts
 
         # Use repaired processor with original editor
-        processor_code = fixed_processor or task.generated_code["processor"]
-        editor_code = task.generated_code["editor"]
+        processor_code = fixed_processor or generated_code["processor"]
+        editor_code = generated_code["editor"]
+
+    # Keep header files if they were originally generated (schema mode)
+    repaired_code = {**generated_code, "processor": processor_code, "editor": editor_code}
+    return repaired_code, None, bmad_artifacts
+
+
+async def _push(
+    task_id: str,
+    github_manager: GitHubManager,
+    generated_code: Dict[str, str],
+    commit_message: str,
+) -> Optional[str]:
+    """
+    Validate and push generated code, moving the task to BUILDING.
 
-    # Get header files if they were originally generated (schema mode)
-    processor_h = task.generated_code.get("processor_h")
-    editor_h = task.generated_code.get("editor_h")
+    Returns:
+        Commit SHA, or None if the push failed (task marked FAILED)
+    """
+    processor_h = generated_code.get("processor_h")
+    editor_h = generated_code.get("editor_h")
 
-    # Validate header consistency before pushing repair
+    # Validate header consistency BEFORE pushing
+    # This catches undeclared identifier errors locally instead of wasting CI time
     is_consistent, consistency_errors = validate_header_consistency(
-        processor_h, processor_code, editor_h, editor_code
+        processor_h, generated_code["processor"], editor_h, generated_code["editor"]
     )
 
     if not is_consistent:
-        if processor_h and editor_h:
-            # We have headers but still have errors after repair
-            logger.warning(f"[{task_id}] Repair still has undeclared identifiers: {consistency_errors}")
-            # Don't fail immediately on repair - let CI try (repair might have fixed it differently)
-        else:
-            logger.warning(f"[{task_id}] No headers for repair validation")
+        # Header validation is ADVISORY only - log warnings but don't block
+        # The JUCE_TYPES allowlist can't cover all inherited methods, so we
+        # let CI be the final arbiter of correctness
+        logger.warning(f"[{task_id}] Header consistency advisory: {len(consistency_errors)} potential issues")
+        for err in consistency_errors[:5]:
+            logger.warning(f"[{task_id}]   - {err}")
     else:
-        logger.info(f"[{task_id}] Repair passed header consistency check")
+        logger.info(f"[{task_id}] Header consistency check PASSED")
 
-    # Push repaired code
-    task_manager.update_task(task_id, status=TaskStatus.PUSHING)
+    logger.info(f"[{task_id}] Pushing to GitHub...")
+    # Only SHA-256 hashes of the generated files are stored with the status change
+    task_manager.update_task(
+        task_id,
+        status=TaskStatus.PUSHING,
+        **TaskState.hash_code(generated_code),
+    )
 
-    commit_sha, push_error = github_manager.push_code(
-        processor_code,
-        editor_code,
-        commit_message=f"vAIst: Repair attempt {task.retry_count + 1}",
-        processor_h=processor_h,
-        editor_h=editor_h,
+    commit_sha, push_error = await github_manager.push_code(
+        generated_code["processor"],
+        generated_code["editor"],
+        commit_message=commit_message,
+        processor_h=processor_h,  # Schema-based mode generates headers
+        editor_h=editor_h,        # Schema-based mode generates headers
     )
 
     if push_error:
+        logger.error(f"[{task_id}] GitHub push failed: {push_error}")
         task_manager.update_task(
             task_id,
             status=TaskStatus.FAILED,
             error_message=push_error,
         )
-        return
-
-    # Update and continue monitoring
-    generated_code = {"processor": processor_code, "editor": editor_code}
-    if processor_h:
-        generated_code["processor_h"] = processor_h
-    if editor_h:
-        generated_code["editor_h"] = editor_h
+        return None
 
+    logger.info(f"[{task_id}] Pushed to GitHub: {commit_sha}")
     task_manager.update_task(
         task_id,
         status=TaskStatus.BUILDING,
         commit_sha=commit_sha,
-        generated_code=generated_code,
     )
+    return commit_sha
 
-    logger.info(f"[{task_id}] Repair pushed, monitoring new build...")
 
-    # Monitor the new build with the new commit SHA
-    poll_interval = settings.BUILD_POLL_INTERVAL_SECONDS
-    timeout = settings.BUILD_TIMEOUT_SECONDS
-    max_polls = timeout // poll_interval
+async def _monitor_build(
+    task_id: str,
+    github_manager: GitHubManager,
+    commit_sha: str,
+) -> BuildOutcome:
+    """
+    Monitor the build for a pushed commit.
 
-    for poll in range(max_polls):
-        await asyncio.sleep(poll_interval)
+    Records the workflow run ID on the task; on success also stores the
+    artifact download URLs and marks the task SUCCESS.
+    """
+    # Resolve the workflow run for this commit, then poll it by ID
+    run_id = await github_manager.find_run_for_sha(
+        commit_sha, timeout=settings.WORKFLOW_LOOKUP_TIMEOUT_SECONDS
+    )
+    if not run_id:
+        logger.error(f"[{task_id}] No workflow run started for {commit_sha}")
+        return BuildOutcome.NOT_STARTED
 
-        status, run_id, url = github_manager.get_workflow_status(commit_sha)
+    task_manager.update_task(
+        task_id,
+        workflow_run_id=run_id,
+        workflow_url=github_manager.get_workflow_url(run_id),
+    )
+    logger.info(
+        f"[{task_id}] Monitoring build run {run_id} "
+        f"(timeout: {settings.BUILD_TIMEOUT_SECONDS}s)..."
+    )
 
-        if run_id:
-            task_manager.update_task(task_id, workflow_run_id=run_id)
+    status = await wait_for_build(commit_sha, run_id)
+    if status is None:
+        return BuildOutcome.TIMEOUT
+    if status != "success":
+        return BuildOutcome.FAILED
 
-        if status == "success":
-            logger.info(f"[{task_id}] Repair build successful!")
-            # Fetch artifact download URLs
-            artifact_urls = github_manager.get_artifact_urls(run_id)
-            task_manager.update_task(
-                task_id,
-                status=TaskStatus.SUCCESS,
-                workflow_run_id=run_id,
-                download_urls=artifact_urls if artifact_urls else None,
-            )
-            return
+    logger.info(f"[{task_id}] Build successful!")
+    # Fetch artifact download URLs
+    artifact_urls = await github_manager.get_artifact_urls(run_id)
+    task_manager.update_task(
+        task_id,
+        status=TaskStatus.SUCCESS,
+        download_urls=artifact_urls if artifact_urls else None,
+    )
+    return BuildOutcome.SUCCESS
+
+
+async def generate_plugin_task(task_id: str, prompt: str):
+    """
+    Background task for the complete plugin generation pipeline.
+
+    Flow (BMAD v6): Analyst -> PM -> Architect -> Developer -> Push -> Build -> Monitor
+    Flow (Legacy):  Synthesize -> Push -> Build -> Monitor
+
+    Failed builds loop through repair -> push -> monitor until the build
+    succeeds or MAX_RETRY_ATTEMPTS is exhausted.
+    """
+    github_manager = get_github_manager()
+
+    try:
+        # Step 1: Synthesize code with AI (BMAD or legacy)
+        logger.info(f"[{task_id}] Starting code synthesis...")
+        task_manager.update_task(task_id, status=TaskStatus.SYNTHESIZING)
+
+        cache_key = _prompt_cache_key(prompt)
+        cached = _synthesis_cache.get(cache_key)
+
+        if cached is not None:
+            # Copies, since repair replaces code and mutates artifacts
+            generated_code, bmad_artifacts = cached
+            generated_code = dict(generated_code)
+            bmad_artifacts = replace(bmad_artifacts) if bmad_artifacts else None
+            logger.info(f"[{task_id}] Reusing cached code for a previously built prompt")
+        else:
+            # Warm the CI caches while the LLM calls run
+            warmup = asyncio.create_task(github_manager.trigger_warmup_workflow())
+
+            try:
+                # BMAD artifacts are kept for potential repair
+                generated_code, error, bmad_artifacts = await _synthesize(task_id, prompt)
+            except BaseException:
+                # Synthesis failed: don't dispatch for a task that won't build
+                warmup.cancel()
+                raise
+            finally:
+                # Always reap the task so its outcome is never left unretrieved
+                await asyncio.gather(warmup, return_exceptions=True)
+            if error:
+                logger.error(f"[{task_id}] Code synthesis failed: {error}")
+                task_manager.update_task(task_id, status=TaskStatus.FAILED, error_message=error)
+                return
+
+            logger.info(f"[{task_id}] Code synthesis complete (files: {list(generated_code.keys())})")
+
+        # Truncate prompt for commit message
+        short_prompt = prompt[:50] + "..." if len(prompt) > 50 else prompt
+        commit_message = f"vAIst: {short_prompt}"
+        retry_count = 0
+
+        while True:
+            # Step 2: Push to GitHub
+            commit_sha = await _push(task_id, github_manager, generated_code, commit_message)
+            if not commit_sha:
+                return
+
+            # Step 3: Monitor build
+            outcome = await _monitor_build(task_id, github_manager, commit_sha)
+
+            if outcome is BuildOutcome.SUCCESS:
+                # Only code that is known to build is reused
+                _synthesis_cache.set(
+                    cache_key,
+                    (dict(generated_code), replace(bmad_artifacts) if bmad_artifacts else None),
+                )
+                return
 
-        elif status in ("failure", "cancelled"):
-            task = task_manager.get_task(task_id)
+            if outcome is BuildOutcome.NOT_STARTED:
+                task_manager.update_task(
+                    task_id,
+                    status=TaskStatus.FAILED,
+                    error_message="Build workflow did not start",
+                )
+                return
 
-            # Attempt another repair if retries available
-            if task and task.retry_count < settings.MAX_RETRY_ATTEMPTS:
-                logger.warning(
-                    f"[{task_id}] Repair build failed, attempting another repair "
-                    f"({task.retry_count + 1}/{settings.MAX_RETRY_ATTEMPTS})"
+            if outcome is BuildOutcome.TIMEOUT:
+                timeout = settings.BUILD_TIMEOUT_SECONDS
+                logger.error(f"[{task_id}] Build timed out after {timeout}s")
+                task_manager.update_task(
+                    task_id,
+                    status=TaskStatus.FAILED,
+                    error_message=f"Build timed out after {timeout} seconds",
                 )
-                await attempt_repair(task_id, github_manager, bmad_artifacts)
                 return
-            else:
+
+            # Step 4: Self-repair if retries available
+            if retry_count >= settings.MAX_RETRY_ATTEMPTS:
                 logger.error(f"[{task_id}] Build failed after max retries")
                 task_manager.update_task(
                     task_id,
                     status=TaskStatus.FAILED,
-                    workflow_run_id=run_id,
                     error_message=f"Build failed after {settings.MAX_RETRY_ATTEMPTS} attempts",
                 )
                 return
 
-        elif status == "not_found" and poll < 6:
-            # Give GitHub Actions a few seconds to start
-            logger.debug(f"[{task_id}] Waiting for repair workflow to start...")
-            continue
+            retry_count += 1
+            logger.warning(
+                f"[{task_id}] Build failed, attempting repair "
+                f"({retry_count}/{settings.MAX_RETRY_ATTEMPTS})"
+            )
+            task_manager.update_task(
+                task_id,
+                retry_count=retry_count,
+                status=TaskStatus.SYNTHESIZING,
+            )
 
-    # Timeout
-    logger.error(f"[{task_id}] Repair build timed out after {timeout}s")
-    task_manager.update_task(
-        task_id,
-        status=TaskStatus.FAILED,
-        error_message=f"Repair build timed out after {timeout} seconds",
-    )
+            generated_code, error, bmad_artifacts = await _repair(
+                task_id, github_manager, generated_code, bmad_artifacts, retry_count
+            )
+            if error:
+                logger.error(f"[{task_id}] {error}")
+                task_manager.update_task(task_id, status=TaskStatus.FAILED, error_message=error)
+                return
+
+            commit_message = f"vAIst: Repair attempt {retry_count}"
+
+    except Exception as e:
+        logger.exception(f"[{task_id}] Unexpected error in generation pipeline")
+        task_manager.update_task(
+            task_id,
+            status=TaskStatus.FAILED,
+            error_message=f"Internal error: {str(e)}",
+        )
+
+
+async def _generation_worker(queue: "asyncio.Queue[Tuple[str, str]]") -> None:
+    """Run queued generation tasks one at a time."""
+    while True:
+        task_id, prompt = await queue.get()
+        try:
+            await generate_plugin_task(task_id, prompt)
+        except Exception:
+            # Keep the worker alive; one failed task must not stop the queue
+            logger.exception(f"[{task_id}] Generation task crashed")
+            task_manager.update_task(
+                task_id,
+                status=TaskStatus.FAILED,
+                error_message="Internal error: generation task crashed",
+            )
+        finally:
+            queue.task_done()
 
 
 # =============================================================================
@@ -484,21 +580,22 @@ async def attempt_repair(
 
 
 @app.post("/v1/plugin/generate", response_model=GenerateResponse)
-async def generate_plugin(
-    request: GenerateRequest,
-    background_tasks: BackgroundTasks,
-):
+async def generate_plugin(request: GenerateRequest):
     """
     Start plugin generation from a natural language prompt.
 
-    Returns a task_id that can be used to poll for status.
+    Returns a task_id that can be used to poll for status. Responds 503
+    when the generation queue is full.
     """
+    if _generation_queue is None or _generation_queue.full():
+        raise HTTPException(status_code=503, detail="Generation queue is full, try again later")
+
     # Create task
     task = task_manager.create_task(prompt=request.prompt)
     logger.info(f"Created task {task.task_id} for prompt: {request.prompt[:50]}...")
 
-    # Start background generation
-    background_tasks.add_task(generate_plugin_task, task.task_id, request.prompt)
+    # Queue for the worker pool (no await between the check and here)
+    _generation_queue.put_nowait((task.task_id, request.prompt))
 
     return GenerateResponse(
         task_id=task.task_id,
@@ -517,61 +614,59 @@ async def get_status(task_id: str):
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    # Build workflow URL if we have run_id
-    workflow_url = None
-    if task.workflow_run_id:
-        workflow_url = (
-            f"https://github.com/{settings.GITHUB_REPO}/actions/runs/{task.workflow_run_id}"
-        )
+    return StatusResponse.model_validate(task, from_attributes=True)
 
-    # Build download URLs if available
-    download_urls = None
-    if task.download_urls:
-        download_urls = DownloadUrls(
-            windows=task.download_urls.get("windows"),
-            macos=task.download_urls.get("macos"),
-        )
 
-    return StatusResponse(
-        task_id=task.task_id,
-        status=task.status,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        commit_sha=task.commit_sha,
-        workflow_run_id=task.workflow_run_id,
-        workflow_url=workflow_url,
-        error_message=task.error_message,
-        retry_count=task.retry_count,
-        download_urls=download_urls,
-        plugin_id=task.plugin_id,
-    )
+@app.get("/v1/tasks", response_model=list[StatusResponse])
+async def list_tasks(limit: int = 20, status: Optional[TaskStatus] = None):
+    """
+    List recent tasks, optionally filtered by status.
+    """
+    tasks = task_manager.list_tasks(limit=limit, status=status)
 
+    return [StatusResponse.model_validate(task, from_attributes=True) for task in tasks]
 
-@app.get("/v1/tasks", response_model=list[StatusResponse])
-async def list_tasks(limit: int = 20):
+
+@app.post("/v1/webhooks/github")
+async def github_webhook(
+    request: Request,
+    x_hub_signature_256: Optional[str] = Header(None),
+    x_github_event: Optional[str] = Header(None),
+) -> Dict[str, str]:
     """
-    List recent tasks.
+    Receive GitHub workflow_run events and resolve waiting builds.
+
+    Requires GITHUB_WEBHOOK_SECRET; deliveries are authenticated with the
+    X-Hub-Signature-256 HMAC.
     """
-    tasks = task_manager.list_tasks(limit=limit)
-
-    return [
-        StatusResponse(
-            task_id=task.task_id,
-            status=task.status,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            commit_sha=task.commit_sha,
-            workflow_run_id=task.workflow_run_id,
-            workflow_url=(
-                f"https://github.com/{settings.GITHUB_REPO}/actions/runs/{task.workflow_run_id}"
-                if task.workflow_run_id
-                else None
-            ),
-            error_message=task.error_message,
-            retry_count=task.retry_count,
-        )
-        for task in tasks
-    ]
+    if not settings.GITHUB_WEBHOOK_SECRET:
+        raise HTTPException(status_code=404, detail="Webhooks not configured")
+
+    body = await request.body()
+    expected = "sha256=" + hmac.new(
+        settings.GITHUB_WEBHOOK_SECRET.encode(), body, hashlib.sha256
+    ).hexdigest()
+    if not x_hub_signature_256 or not hmac.compare_digest(expected, x_hub_signature_256):
+        raise HTTPException(status_code=401, detail="Invalid signature")
+
+    if x_github_event != "workflow_run":
+        return {"status": "ignored"}
+
+    payload = json.loads(body)
+    run = payload.get("workflow_run") or {}
+    if payload.get("action") != "completed" or not run.get("head_sha"):
+        return {"status": "ignored"}
+
+    resolved = task_manager.resolve_build(
+        run["head_sha"],
+        run.get("conclusion") or "unknown",
+        run.get("id"),
+    )
+    logger.info(
+        f"Webhook: run {run.get('id')} for {run['head_sha'][:7]} "
+        f"{run.get('conclusion')} ({'resolved' if resolved else 'no waiter'})"
+    )
+    return {"status": "resolved" if resolved else "ignored"}
 
 
 @app.get("/health")
@@ -601,5 +696,10 @@ if __name__ == "__main__":
         "backend.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        # uvloop + httptools (from uvicorn[standard]) where available;
+        # plain asyncio/h11 otherwise (e.g. Windows)
+        loop="auto",
+        http="auto",
+        # The file-watching reloader is for development only
+        reload=settings.DEBUG,
     )
@@ -4,9 +4,11 @@ Pydantic schemas for request/response validation and task state.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 from datetime import datetime
 from enum import Enum
+import hashlib
+import time
 import uuid
 
 
@@ -82,17 +84,20 @@ class TaskState(BaseModel):
     status: TaskStatus = TaskStatus.PENDING
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Monotonic creation time for TTL checks; process-local, never serialized
+    created_at_ns: int = Field(default_factory=time.monotonic_ns, exclude=True)
 
     # GitHub tracking
     commit_sha: Optional[str] = None
     workflow_run_id: Optional[int] = None
+    workflow_url: Optional[str] = None  # Set together with workflow_run_id
 
     # Error handling
     error_message: Optional[str] = None
     retry_count: int = 0
 
-    # Generated code (for potential repair)
-    generated_code: Optional[Dict[str, str]] = None  # {"processor": "...", "editor": "..."}
+    # Generated code content hashes (see hash_code)
+    generated_code_sha256: Optional[Dict[str, str]] = None  # {"processor": "<hex>", ...}
 
     # Artifact downloads (populated on SUCCESS)
     download_urls: Optional[Dict[str, str]] = None  # {"windows": "url", "macos": "url"}
@@ -101,3 +106,22 @@ class TaskState(BaseModel):
     class Config:
         # Allow mutation for updates
         frozen = False
+
+    @staticmethod
+    def hash_code(code: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """
+        Build the update_task() fields that record generated code.
+
+        Args:
+            code: Generated files ({"processor": "...", "editor": "...", ...})
+
+        Returns:
+            Keyword arguments for generated_code_sha256
+        """
+        return {
+            "generated_code_sha256": {
+                name: hashlib.sha256(source.encode()).hexdigest()
+                for name, source in code.items()
+                if source is not None
+            },
+        }
@@ -5,6 +5,11 @@ The Breakthrough Method for Agile AI-Driven Development.
 Each phase uses a specialized agent with fresh context.
 """
 
+import re
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Iterator, List, Optional, Tuple
+
 # =============================================================================
 # Phase 1: ANALYST AGENT
 # Purpose: Expand user prompt into structured Product Brief
@@ -285,6 +290,41 @@ The previous build failed. Based on the SM analysis, you must FIX the Tech Spec.
 ## Corrected Tech Spec:
 """
 
+# Single-pass repair used for the first retry: diagnose + patch in one call
+FAST_REPAIR_PROMPT = """You are the vAIst Repair Agent.
+
+A build has failed. Diagnose the error AND fix the code in a single pass.
+
+## Template Type: {plugin_type}
+
+## Build Error:
+```
+{build_error}
+```
+
+## Tech Spec:
+{tech_spec}
+
+## Current Logic Code (inside the sample loop):
+```cpp
+{logic_code}
+```
+
+## AVAILABLE VARIABLES (GROUND TRUTH):
+{available_params}
+
+## CONSTRAINTS:
+{constraints}
+
+## Rules
+- Return ONLY 1-3 lines of code - the loops already exist
+- Do NOT declare variables - use ONLY the AVAILABLE VARIABLES
+- The ONLY thing to modify is channelData[sample]
+
+## OUTPUT FORMAT - Respond with JSON only:
+{{"root_cause": "<one sentence>", "logic_code": "<corrected C++ lines>"}}
+"""
+
 # =============================================================================
 # Template-Specific Parameter Mappings
 # These are injected into the Architect prompt based on plugin type
@@ -362,3 +402,115 @@ TEMPLATE_PARAMS = {
         ],
     },
 }
+
+# Prompt-ready bullet lists, joined once at import (read-only)
+TEMPLATE_PARAMS_STR = MappingProxyType({
+    plugin_type: MappingProxyType({
+        "available_params": "\n".join(f"- {p}" for p in params["available_params"]),
+        "constraints": "\n".join(f"- {c}" for c in params["constraints"]),
+    })
+    for plugin_type, params in TEMPLATE_PARAMS.items()
+})
+
+
+# =============================================================================
+# Identifier Allowlists
+# One precompiled pattern per plugin type matches any identifier that is NOT
+# an available variable, so validating Architect output is a single scan.
+# =============================================================================
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+
+
+def _extract_identifiers(available_params: List[str]) -> List[str]:
+    """
+    Get the variable names declared by a template's available params.
+
+    The name comes before the parenthesis or " - " description; array
+    notation ("z1[channel]") and lists ("b0, b1, b2") yield every name.
+    """
+    names = set()
+    for param in available_params:
+        names.update(_IDENTIFIER_RE.findall(param.split("(")[0].split(" - ")[0]))
+    return sorted(names)
+
+
+DISALLOWED_IDENT_RE = MappingProxyType({
+    plugin_type: re.compile(
+        r"\b(?!(?:"
+        + "|".join(re.escape(name) for name in _extract_identifiers(params["available_params"]))
+        + r")\b)[A-Za-z_]\w*",
+        re.IGNORECASE,
+    )
+    for plugin_type, params in TEMPLATE_PARAMS.items()
+})
+
+
+# =============================================================================
+# Precompiled Prompt Renderers
+# Each prompt is split into static chunks and placeholders once at import,
+# so rendering is a join instead of re-parsing the format string per call.
+# =============================================================================
+
+class CompiledPrompt:
+    """A str.format-style prompt pre-split into literal chunks and placeholders."""
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, template: str):
+        """
+        Compile a prompt.
+
+        Args:
+            template: Prompt with {name} placeholders and {{ }} escapes
+        """
+        parts: List[Tuple[str, Optional[str]]] = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if spec or conversion:
+                raise ValueError(f"Unsupported placeholder format in prompt: {{{field}}}")
+            parts.append((literal, field))
+        self._parts = tuple(parts)
+
+    def iter(self, **values: Any) -> Iterator[str]:
+        """
+        Yield the prompt as literal chunks interleaved with the values.
+
+        A value may also be a tuple of chunks, which are yielded in turn.
+        """
+        for literal, field in self._parts:
+            if literal:
+                yield literal
+            if field is not None:
+                value = values[field]
+                if isinstance(value, tuple):
+                    yield from value
+                else:
+                    yield str(value)
+
+    def __call__(self, **values: str) -> str:
+        """Render the prompt."""
+        return "".join(self.iter(**values))
+
+
+def compile_prompt(template: str) -> CompiledPrompt:
+    """
+    Compile a str.format-style prompt into a renderer.
+
+    Args:
+        template: Prompt with {name} placeholders and {{ }} escapes
+
+    Returns:
+        Callable taking the placeholders as keyword arguments
+    """
+    return CompiledPrompt(template)
+
+
+RENDER = MappingProxyType({
+    "analyst": compile_prompt(ANALYST_PROMPT),
+    "pm": compile_prompt(PM_PROMPT),
+    "architect": compile_prompt(ARCHITECT_PROMPT),
+    "developer": compile_prompt(DEVELOPER_PROMPT),
+    "sm_analyst": compile_prompt(SM_ANALYST_PROMPT),
+    "repair_architect": compile_prompt(REPAIR_ARCHITECT_PROMPT),
+    "fast_repair": compile_prompt(FAST_REPAIR_PROMPT),
+})
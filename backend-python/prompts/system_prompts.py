@@ -10,13 +10,14 @@ Includes Architect Verification Gate integration to prevent AI hallucinations
 by providing exact variable names that are available in each template.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from backend.template_manager import PluginTemplate
 
 # Import CodeVerifier for exact identifier lists
 from backend.code_verifier import CodeVerifier
+from backend.prompts.bmad_prompts import compile_prompt
 
 
 # =============================================================================
@@ -71,7 +72,7 @@ Just the raw DSP math that processes audio samples.
 # Full Generation System Prompt (Fallback Mode)
 # =============================================================================
 
-SYSTEM_PROMPT = """You are the vAIst DSP Coder, an expert C++ Audio Developer specializing in the JUCE 8 framework.
+SYSTEM_PROMPT_CORE = """You are the vAIst DSP Coder, an expert C++ Audio Developer specializing in the JUCE 8 framework.
 
 TASK: Generate complete replacement code for PluginProcessor.cpp and PluginEditor.cpp based on the user's plugin description.
 
@@ -130,6 +131,12 @@ myAttachment = std::make_unique<juce::SliderParameterAttachment>(
 );
 ```
 
+Now generate the code based on the user's plugin description.
+"""
+
+# Reference skeleton (~600 tokens). Left out of first attempts and only sent
+# once a generation has failed, see get_generation_messages()
+SYSTEM_PROMPT_EXAMPLE = """
 EXAMPLE STRUCTURE FOR PluginProcessor.cpp:
 ```cpp
 #include "PluginProcessor.h"
@@ -192,10 +199,11 @@ juce::AudioProcessor* JUCE_CALLTYPE createPluginFilter() {
     return new VAIstAudioProcessor();
 }
 ```
-
-Now generate the code based on the user's plugin description.
 """
 
+# Full prompt, core plus example
+SYSTEM_PROMPT = SYSTEM_PROMPT_CORE + SYSTEM_PROMPT_EXAMPLE
+
 
 # =============================================================================
 # Repair Prompt Template
@@ -228,21 +236,121 @@ IMPORTANT:
 """
 
 
+# Invariant heads of the full-generation prompt, built once
+_GEN_PREFIX = SYSTEM_PROMPT_CORE + "\n\nUSER REQUEST:\n"
+_GEN_PREFIX_WITH_EXAMPLE = SYSTEM_PROMPT + "\n\nUSER REQUEST:\n"
+
+# Anthropic system blocks marked for prompt caching, so repeat calls reuse
+# the cached prefix instead of re-processing it. The example is a separate
+# block after the core, so the core prefix is shared by both variants.
+SYSTEM_PROMPT_BLOCKS = (
+    {"type": "text", "text": SYSTEM_PROMPT_CORE, "cache_control": {"type": "ephemeral"}},
+)
+SYSTEM_PROMPT_EXAMPLE_BLOCKS = SYSTEM_PROMPT_BLOCKS + (
+    {"type": "text", "text": SYSTEM_PROMPT_EXAMPLE, "cache_control": {"type": "ephemeral"}},
+)
+
+# Repair prompt split into static chunks once; see compile_prompt
+_render_repair = compile_prompt(REPAIR_PROMPT_TEMPLATE)
+
+# Header context inserted into the repair prompt when a header is provided
+_HEADER_CONTEXT_HEAD = """
+CORRESPONDING HEADER FILE (PluginProcessor.h):
+```cpp
+"""
+_HEADER_CONTEXT_TAIL = """
+```
+
+The implementation MUST match this header. Do NOT change the parameter pattern.
+"""
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def get_generation_prompt(user_prompt: str) -> str:
+def get_system_prompt(include_example: bool = False) -> str:
+    """
+    Get the full-generation system prompt.
+
+    Args:
+        include_example: Append the reference PluginProcessor.cpp skeleton
+
+    Returns:
+        System prompt text
+    """
+    return SYSTEM_PROMPT if include_example else SYSTEM_PROMPT_CORE
+
+
+def get_generation_prompt(user_prompt: str, include_example: bool = False) -> str:
     """
     Combine system prompt with user request.
 
     Args:
         user_prompt: User's plugin description
+        include_example: Include the reference skeleton (for retries)
 
     Returns:
         Complete prompt for AI
     """
-    return f"{SYSTEM_PROMPT}\n\nUSER REQUEST:\n{user_prompt}"
+    prefix = _GEN_PREFIX_WITH_EXAMPLE if include_example else _GEN_PREFIX
+    return prefix + user_prompt
+
+
+def get_generation_messages(user_prompt: str, include_example: bool = False) -> Dict[str, Any]:
+    """
+    Build Anthropic Messages API arguments for full generation.
+
+    The static system prompt is sent as cacheable blocks; only the user
+    request varies between calls.
+
+    Args:
+        user_prompt: User's plugin description
+        include_example: Include the reference skeleton (for retries)
+
+    Returns:
+        Keyword arguments ("system", "messages") for messages.create()
+    """
+    blocks = SYSTEM_PROMPT_EXAMPLE_BLOCKS if include_example else SYSTEM_PROMPT_BLOCKS
+    return {
+        "system": list(blocks),
+        "messages": [{"role": "user", "content": user_prompt}],
+    }
+
+
+def iter_repair_prompt(
+    error_message: str,
+    original_code: str,
+    filename: str,
+    header_code: str = None
+) -> Iterator[str]:
+    """
+    Iterate over the repair prompt in chunks.
+
+    The (possibly large) code and header are yielded as-is rather than
+    copied into intermediate strings; join once at the point of use.
+
+    Args:
+        error_message: Compiler error output
+        original_code: The code that failed to compile
+        filename: Source file name
+        header_code: Optional header file content for context
+
+    Returns:
+        Iterator over prompt text chunks
+    """
+    return _render_repair.iter(
+        error_message=error_message,
+        header_context=_header_context(header_code),
+        original_code=original_code,
+        filename=filename
+    )
+
+
+def _header_context(header_code: Optional[str]) -> Tuple[str, ...]:
+    """Header context section as prompt chunks (empty without a header)."""
+    if not header_code:
+        return ()
+    return (_HEADER_CONTEXT_HEAD, header_code, _HEADER_CONTEXT_TAIL)
 
 
 def get_repair_prompt(
@@ -263,24 +371,41 @@ def get_repair_prompt(
     Returns:
         Complete repair prompt
     """
-    # Build header context section if header is provided
-    header_context = ""
-    if header_code:
-        header_context = f"""
-CORRESPONDING HEADER FILE (PluginProcessor.h):
-```cpp
-{header_code}
-```
+    return "".join(iter_repair_prompt(error_message, original_code, filename, header_code))
 
-The implementation MUST match this header. Do NOT change the parameter pattern.
-"""
 
-    return REPAIR_PROMPT_TEMPLATE.format(
-        error_message=error_message,
-        header_context=header_context,
+def get_batch_repair_prompt(
+    errors: List[str],
+    original_code: str,
+    filename: str,
+    header_code: str = None
+) -> str:
+    """
+    Create one repair prompt covering several compiler errors.
+
+    The errors are rendered as a numbered list in the COMPILER ERROR slot of
+    the same precompiled repair template, so every error is fixed in a
+    single round-trip instead of one build/repair cycle each.
+
+    Args:
+        errors: Distinct compiler errors (see CodeParser.extract_compiler_errors)
+        original_code: The code that failed to compile
+        filename: Source file name
+        header_code: Optional header file content for context
+
+    Returns:
+        Complete repair prompt
+    """
+    error_list = (
+        f"{len(errors)} errors - fix ALL of them in this one pass:\n",
+        "\n".join(f"{i}. {error}" for i, error in enumerate(errors, 1)),
+    )
+    return "".join(_render_repair.iter(
+        error_message=error_list,
+        header_context=_header_context(header_code),
         original_code=original_code,
         filename=filename
-    )
+    ))
 
 
 def get_template_prompt(
@@ -301,11 +426,9 @@ def get_template_prompt(
     Returns:
         Complete prompt asking AI to generate only the DSP logic
     """
-    # Format available params as bullet list
-    params_str = "\n".join(f"- {p}" for p in template.available_params)
-
-    # Format constraints as bullet list
-    constraints_str = "\n".join(f"- {c}" for c in template.constraints)
+    # Bullet lists are cached on the (shared) template
+    params_str = template.formatted_params
+    constraints_str = template.formatted_constraints
 
     # Get exact identifiers from CodeVerifier (Architect Verification Gate)
     exact_ids_str = ""
@@ -341,8 +464,8 @@ def get_template_repair_prompt(
     Returns:
         Prompt to fix the DSP logic
     """
-    params_str = "\n".join(f"- {p}" for p in template.available_params)
-    constraints_str = "\n".join(f"- {c}" for c in template.constraints)
+    params_str = template.formatted_params
+    constraints_str = template.formatted_constraints
 
     return f"""The DSP logic you provided caused a compilation error.
 
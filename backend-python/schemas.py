@@ -13,8 +13,8 @@ Philosophy:
 """
 
 from enum import Enum
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, Dict, List, Optional, Literal, Union
+from pydantic import BaseModel, Field, model_validator
 
 
 # =============================================================================
@@ -133,18 +133,19 @@ class PluginParameter(BaseModel):
         description="Skew factor for knob response (1.0 = linear)"
     )
 
-    @field_validator('default_value')
-    @classmethod
-    def default_in_range(cls, v, info):
+    @model_validator(mode='after')
+    def default_in_range(self) -> 'PluginParameter':
         """Ensure default is within min/max range."""
-        min_val = info.data.get('min_value', 0.0)
-        max_val = info.data.get('max_value', 1.0)
-        if v < min_val or v > max_val:
-            raise ValueError(f'default ({v}) must be between min ({min_val}) and max ({max_val})')
-        return v
+        if not self.min_value <= self.default_value <= self.max_value:
+            raise ValueError(
+                f'default ({self.default_value}) must be between '
+                f'min ({self.min_value}) and max ({self.max_value})'
+            )
+        return self
 
     class Config:
         populate_by_name = True
+        frozen = True
 
 
 # =============================================================================
@@ -154,6 +155,9 @@ class PluginParameter(BaseModel):
 class GainDSP(BaseModel):
     """DSP configuration for gain plugins."""
 
+    # Union tag for PluginResponse.dsp
+    kind: Literal["gain"] = "gain"
+
     # Gain range in dB
     gain_range_db: float = Field(
         default=24.0,
@@ -175,10 +179,16 @@ class GainDSP(BaseModel):
         description="Smoothing time in milliseconds"
     )
 
+    class Config:
+        frozen = True
+
 
 class WaveshaperDSP(BaseModel):
     """DSP configuration for waveshaper/distortion plugins."""
 
+    # Union tag for PluginResponse.dsp
+    kind: Literal["waveshaper"] = "waveshaper"
+
     # Waveshaping function - AI MUST choose from enum
     waveshaping_function: WaveshapingFunction = Field(
         default=WaveshapingFunction.TANH,
@@ -213,10 +223,16 @@ class WaveshaperDSP(BaseModel):
         description="Asymmetric clipping (-1 to 1, 0 = symmetric)"
     )
 
+    class Config:
+        frozen = True
+
 
 class FilterDSP(BaseModel):
     """DSP configuration for filter plugins."""
 
+    # Union tag for PluginResponse.dsp
+    kind: Literal["filter"] = "filter"
+
     # Filter type - AI MUST choose from enum
     filter_type: FilterType = Field(
         default=FilterType.LOWPASS,
@@ -259,10 +275,16 @@ class FilterDSP(BaseModel):
         description="Use biquad filter implementation"
     )
 
+    class Config:
+        frozen = True
+
 
 class DelayDSP(BaseModel):
     """DSP configuration for delay plugins."""
 
+    # Union tag for PluginResponse.dsp
+    kind: Literal["delay"] = "delay"
+
     # Maximum delay time
     max_delay_ms: float = Field(
         default=1000.0,
@@ -297,6 +319,34 @@ class DelayDSP(BaseModel):
         description="Enable ping-pong stereo delay"
     )
 
+    class Config:
+        frozen = True
+
+
+# Discriminated on "kind": pydantic-core dispatches on the tag instead of
+# trying every DSP model in turn
+PluginDSP = Annotated[
+    Union[GainDSP, WaveshaperDSP, FilterDSP, DelayDSP],
+    Field(discriminator="kind"),
+]
+
+# Pre-union response keys, still accepted on input
+_LEGACY_DSP_KEYS = {
+    "gain_dsp": "gain",
+    "waveshaper_dsp": "waveshaper",
+    "filter_dsp": "filter",
+    "delay_dsp": "delay",
+}
+
+# DSP kind implied by each category (categories without a DSP model omitted)
+_CATEGORY_DSP_KIND = {
+    PluginCategory.GAIN.value: "gain",
+    PluginCategory.WAVESHAPER.value: "waveshaper",
+    PluginCategory.DISTORTION.value: "waveshaper",
+    PluginCategory.FILTER.value: "filter",
+    PluginCategory.DELAY.value: "delay",
+}
+
 
 # =============================================================================
 # Complete Plugin Response Schema
@@ -339,198 +389,164 @@ class PluginResponse(BaseModel):
         description="List of plugin parameters (1-8)"
     )
 
-    # DSP configuration - category-specific, optional
-    # Only one of these should be populated based on category
-    gain_dsp: Optional[GainDSP] = Field(
-        default=None,
-        description="DSP config for gain plugins"
-    )
-
-    waveshaper_dsp: Optional[WaveshaperDSP] = Field(
-        default=None,
-        description="DSP config for waveshaper/distortion plugins"
-    )
-
-    filter_dsp: Optional[FilterDSP] = Field(
+    # DSP configuration - category-specific, optional; tagged by "kind" so
+    # only the matching model is validated
+    dsp: Optional[PluginDSP] = Field(
         default=None,
-        description="DSP config for filter plugins"
+        description="DSP config matching the category (omit if none applies)"
     )
 
-    delay_dsp: Optional[DelayDSP] = Field(
-        default=None,
-        description="DSP config for delay plugins"
-    )
-
-    @field_validator('parameters')
+    @model_validator(mode='before')
     @classmethod
-    def unique_param_names(cls, v):
+    def normalize_dsp(cls, data: Any) -> Any:
+        """
+        Accept the legacy per-category DSP keys and fill in a missing tag.
+
+        {"filter_dsp": {...}} becomes {"dsp": {"kind": "filter", ...}}; a
+        "dsp" object without "kind" is tagged from the category, or dropped
+        if the category has no DSP model (the generator ignores it anyway).
+        """
+        if not isinstance(data, dict):
+            return data
+
+        wanted = _CATEGORY_DSP_KIND.get(data.get("category"))
+        dsp = data.get("dsp")
+        if dsp is None:
+            legacy = [k for k in _LEGACY_DSP_KEYS if data.get(k) is not None]
+            if not legacy:
+                return data
+            # Prefer the config matching the category, as the generator did
+            key = next((k for k in legacy if _LEGACY_DSP_KEYS[k] == wanted), legacy[0])
+            dsp = data[key]
+            if isinstance(dsp, dict):
+                dsp = dict(dsp, kind=_LEGACY_DSP_KEYS[key])
+        elif isinstance(dsp, dict) and "kind" not in dsp:
+            dsp = None if wanted is None else dict(dsp, kind=wanted)
+        else:
+            return data
+
+        data = {k: v for k, v in data.items() if k not in _LEGACY_DSP_KEYS}
+        data["dsp"] = dsp
+        return data
+
+    @model_validator(mode='after')
+    def unique_param_names(self) -> 'PluginResponse':
         """Ensure all parameter names are unique."""
-        names = [p.name for p in v]
-        if len(names) != len(set(names)):
+        if len({p.name for p in self.parameters}) != len(self.parameters):
             raise ValueError('All parameter names must be unique')
-        return v
+        return self
+
+    class Config:
+        frozen = True
+
+
+# Bound once so hot paths skip the class attribute lookup; validate_json()
+# accepts bytes and parses them in pydantic-core without a Python dict
+PLUGIN_RESPONSE_VALIDATOR = PluginResponse.__pydantic_validator__
+
+
+def parse_plugin_response(raw: Union[bytes, str]) -> PluginResponse:
+    """
+    Parse and validate raw AI JSON output in one pass.
+
+    This is the canonical entry point for LLM output: pydantic-core parses
+    the JSON straight into the model, with no intermediate dict.
+
+    Args:
+        raw: JSON text as returned by the model (bytes or str)
+
+    Returns:
+        Validated PluginResponse
+
+    Raises:
+        ValidationError: On malformed JSON (error type "json_invalid")
+            or schema violations
+    """
+    return PLUGIN_RESPONSE_VALIDATOR.validate_json(raw)
 
 
 # =============================================================================
 # Gemini Schema Export (for structured output)
 # =============================================================================
 
-def get_gemini_schema():
+# JSON Schema keys Gemini's OpenAPI subset rejects or has no use for
+_GEMINI_DROP_KEYS = frozenset(
+    {"title", "default", "additionalProperties", "$defs", "discriminator"}
+)
+
+
+def _prune_for_gemini(node: Any, defs: Dict[str, Any]) -> Any:
     """
-    Generate the schema dict for Gemini's response_schema parameter.
+    Convert a Pydantic JSON schema node into Gemini's response_schema subset.
+
+    Inlines $ref definitions, turns Optional (anyOf [X, null]) into a
+    nullable X, rewrites oneOf/const (tagged unions) as anyOf/enum, and
+    drops keys Gemini doesn't accept.
 
-    This tells Gemini exactly what JSON structure to output.
+    Args:
+        node: Schema node (dict, list or scalar)
+        defs: The root schema's $defs
+
+    Returns:
+        Pruned copy of the node
     """
-    return {
-        "type": "object",
-        "properties": {
-            "plugin_name": {
-                "type": "string",
-                "description": "Plugin display name"
-            },
-            "category": {
-                "type": "string",
-                "enum": [c.value for c in PluginCategory],
-                "description": "Plugin category"
-            },
-            "description": {
-                "type": "string",
-                "description": "Brief plugin description"
-            },
-            "parameters": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Internal C++ variable name (camelCase)"
-                        },
-                        "label": {
-                            "type": "string",
-                            "description": "Display name for UI"
-                        },
-                        "min": {
-                            "type": "number",
-                            "description": "Minimum value"
-                        },
-                        "max": {
-                            "type": "number",
-                            "description": "Maximum value"
-                        },
-                        "default": {
-                            "type": "number",
-                            "description": "Default value"
-                        },
-                        "unit": {
-                            "type": "string",
-                            "enum": [u.value for u in ParameterUnit],
-                            "description": "Unit for display"
-                        }
-                    },
-                    "required": ["name", "label", "min", "max", "default"]
-                },
-                "minItems": 1,
-                "maxItems": 8
-            },
-            "waveshaper_dsp": {
-                "type": "object",
-                "properties": {
-                    "waveshaping_function": {
-                        "type": "string",
-                        "enum": [f.value for f in WaveshapingFunction],
-                        "description": "Waveshaping transfer function"
-                    },
-                    "pre_gain_range": {
-                        "type": "number",
-                        "description": "Maximum pre-gain multiplier"
-                    },
-                    "output_compensation": {
-                        "type": "boolean",
-                        "description": "Auto-compensate output level"
-                    },
-                    "mix_enabled": {
-                        "type": "boolean",
-                        "description": "Enable dry/wet mix"
-                    },
-                    "asymmetry": {
-                        "type": "number",
-                        "description": "Asymmetric clipping amount"
-                    }
-                }
-            },
-            "filter_dsp": {
-                "type": "object",
-                "properties": {
-                    "filter_type": {
-                        "type": "string",
-                        "enum": [f.value for f in FilterType],
-                        "description": "Filter type"
-                    },
-                    "min_frequency_hz": {
-                        "type": "number",
-                        "description": "Min cutoff frequency"
-                    },
-                    "max_frequency_hz": {
-                        "type": "number",
-                        "description": "Max cutoff frequency"
-                    },
-                    "min_resonance": {
-                        "type": "number",
-                        "description": "Min Q/resonance"
-                    },
-                    "max_resonance": {
-                        "type": "number",
-                        "description": "Max Q/resonance"
-                    }
-                }
-            },
-            "delay_dsp": {
-                "type": "object",
-                "properties": {
-                    "max_delay_ms": {
-                        "type": "number",
-                        "description": "Max delay time in ms"
-                    },
-                    "max_feedback": {
-                        "type": "number",
-                        "description": "Max feedback (0-0.99)"
-                    },
-                    "ping_pong": {
-                        "type": "boolean",
-                        "description": "Enable ping-pong"
-                    }
-                }
-            },
-            "gain_dsp": {
-                "type": "object",
-                "properties": {
-                    "gain_range_db": {
-                        "type": "number",
-                        "description": "Max gain range in dB"
-                    },
-                    "smoothing_enabled": {
-                        "type": "boolean",
-                        "description": "Apply parameter smoothing"
-                    }
-                }
-            }
-        },
-        "required": ["plugin_name", "category", "parameters"]
-    }
+    if isinstance(node, list):
+        return [_prune_for_gemini(item, defs) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    if "$ref" in node:
+        # Field-level keys (description) override the shared definition's
+        resolved = dict(defs[node["$ref"].rsplit("/", 1)[-1]])
+        resolved.update((k, v) for k, v in node.items() if k != "$ref")
+        return _prune_for_gemini(resolved, defs)
+
+    any_of = node.get("anyOf")
+    if any_of is not None:
+        branches = [b for b in any_of if b.get("type") != "null"]
+        if len(branches) == 1:
+            merged = dict(branches[0])
+            merged.update((k, v) for k, v in node.items() if k != "anyOf")
+            merged["nullable"] = True
+            return _prune_for_gemini(merged, defs)
+
+    pruned = {}
+    for key, value in node.items():
+        if key in _GEMINI_DROP_KEYS:
+            continue
+        if key == "properties":
+            pruned[key] = {name: _prune_for_gemini(prop, defs) for name, prop in value.items()}
+        elif key == "oneOf":
+            pruned["anyOf"] = _prune_for_gemini(value, defs)
+        elif key == "const":
+            pruned["enum"] = [value]
+        else:
+            pruned[key] = _prune_for_gemini(value, defs)
+    return pruned
+
+
+# Derived from PluginResponse once at import, so it can never drift from
+# the models and costs nothing per request
+_PLUGIN_RESPONSE_JSON_SCHEMA = PluginResponse.model_json_schema()
+GEMINI_PLUGIN_SCHEMA = _prune_for_gemini(
+    _PLUGIN_RESPONSE_JSON_SCHEMA, _PLUGIN_RESPONSE_JSON_SCHEMA.get("$defs", {})
+)
+
+
+def get_gemini_schema() -> dict:
+    """
+    Get the schema dict for Gemini's response_schema parameter.
+
+    Returns the shared module-level dict - treat it as read-only.
+    """
+    return GEMINI_PLUGIN_SCHEMA
 
 
 # =============================================================================
 # Schema Prompt Generator
 # =============================================================================
 
-def get_schema_prompt() -> str:
-    """
-    Generate the prompt that tells the AI exactly what JSON to output.
-
-    This is included in every generation request.
-    """
-    return """You MUST respond with a valid JSON object matching this EXACT structure:
+_SCHEMA_PROMPT = """You MUST respond with a valid JSON object matching this EXACT structure:
 
 {
   "plugin_name": "string (3-32 chars)",
@@ -546,26 +562,28 @@ def get_schema_prompt() -> str:
       "unit": "" | "%" | "dB" | "ms" | "Hz" | ":1"
     }
   ],
-  "waveshaper_dsp": {  // Include if category is waveshaper/distortion
+  "dsp": {  // Include for gain/waveshaper/distortion/filter/delay - ONE of:
+    // category waveshaper/distortion:
+    "kind": "waveshaper",
     "waveshaping_function": "tanh" | "atan" | "soft_clip" | "hard_clip" | "sine_fold" | "cubic",
     "pre_gain_range": 10.0,
     "output_compensation": true,
     "mix_enabled": true,
     "asymmetry": 0.0
-  },
-  "filter_dsp": {  // Include if category is filter
+    // category filter:
+    "kind": "filter",
     "filter_type": "lowpass" | "highpass" | "bandpass" | "notch" | "peak" | "lowshelf" | "highshelf",
     "min_frequency_hz": 20.0,
     "max_frequency_hz": 20000.0,
     "min_resonance": 0.5,
     "max_resonance": 10.0
-  },
-  "delay_dsp": {  // Include if category is delay
+    // category delay:
+    "kind": "delay",
     "max_delay_ms": 1000.0,
     "max_feedback": 0.9,
     "ping_pong": false
-  },
-  "gain_dsp": {  // Include if category is gain
+    // category gain:
+    "kind": "gain",
     "gain_range_db": 24.0,
     "smoothing_enabled": true
   }
@@ -575,7 +593,16 @@ CRITICAL RULES:
 1. Output ONLY valid JSON - no markdown, no explanation
 2. Parameter "name" MUST be camelCase (e.g., "driveAmount", not "drive_amount")
 3. Parameter "label" is the UI display name (e.g., "Drive Amount")
-4. Include the appropriate *_dsp object based on the category
+4. Include the "dsp" object for the category, with "kind" set as shown
 5. All number values must be valid floats
 6. 1-8 parameters per plugin
 """
+
+
+def get_schema_prompt() -> str:
+    """
+    Get the prompt that tells the AI exactly what JSON to output.
+
+    This is included in every generation request.
+    """
+    return _SCHEMA_PROMPT
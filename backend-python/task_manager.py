@@ -3,15 +3,25 @@ vAIst Task Manager
 Thread-safe in-memory task tracking with TTL expiration.
 """
 
-from typing import Dict, Optional, Any
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Any
 from threading import Lock
-from datetime import datetime, timedelta
+from datetime import datetime
+import asyncio
 import logging
+import time
 
 from backend.models import TaskState, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Updatable TaskState fields, checked with one set lookup per key
+_TASK_FIELDS = frozenset(TaskState.model_fields)
+
+# Expired tasks removed per lock acquisition in cleanup_expired
+_CLEANUP_BATCH_SIZE = 100
+
 
 class TaskManager:
     """
@@ -30,7 +40,22 @@ class TaskManager:
         """
         self._tasks: Dict[str, TaskState] = {}
         self._lock = Lock()
-        self._ttl = timedelta(hours=task_ttl_hours)
+        self._ttl_ns = task_ttl_hours * 3600 * 1_000_000_000
+
+        # Column-oriented index in creation order, so list/filter scans walk
+        # flat lists instead of every TaskState. Positions in _pos are
+        # absolute; subtract _base (entries trimmed by cleanup) to index.
+        self._ids: List[str] = []
+        self._statuses: List[TaskStatus] = []
+        self._created_ns: List[int] = []
+        self._pos: Dict[str, int] = {}
+        self._base = 0
+
+        # Live task count per status, kept in step with the columns
+        self._status_counts: Dict[TaskStatus, int] = defaultdict(int)
+
+        # Pending build results keyed by commit SHA (event loop only)
+        self._build_futures: Dict[str, asyncio.Future] = {}
 
     def create_task(self, prompt: str) -> TaskState:
         """
@@ -45,6 +70,11 @@ class TaskManager:
         task = TaskState(prompt=prompt)
         with self._lock:
             self._tasks[task.task_id] = task
+            self._pos[task.task_id] = self._base + len(self._ids)
+            self._ids.append(task.task_id)
+            self._statuses.append(task.status)
+            self._created_ns.append(task.created_at_ns)
+            self._status_counts[task.status] += 1
             logger.info(f"Created task {task.task_id}")
         return task
 
@@ -58,12 +88,16 @@ class TaskManager:
         Returns:
             TaskState if found, None otherwise
         """
-        with self._lock:
-            return self._tasks.get(task_id)
+        # Lock-free: a single dict lookup is atomic under the GIL, so status
+        # polling never queues behind writers, listings or cleanup
+        return self._tasks.get(task_id)
 
     def update_task(self, task_id: str, **kwargs: Any) -> Optional[TaskState]:
         """
-        Update task fields.
+        Update task fields in a single locked write.
+
+        Fields whose value is unchanged are skipped; if nothing changes,
+        updated_at is left as is.
 
         Args:
             task_id: UUID of the task
@@ -78,37 +112,59 @@ class TaskManager:
                 return None
 
             task = self._tasks[task_id]
+            old_status = task.status
+            changed = set()
             for key, value in kwargs.items():
-                if hasattr(task, key):
-                    setattr(task, key, value)
-                else:
+                if key not in _TASK_FIELDS:
                     logger.warning(f"Unknown task field: {key}")
+                elif getattr(task, key) != value:
+                    setattr(task, key, value)
+                    changed.add(key)
+
+            if not changed:
+                return task
 
             task.updated_at = datetime.utcnow()
 
             # Log status transitions
-            if "status" in kwargs:
+            if "status" in changed:
+                self._statuses[self._pos[task_id] - self._base] = task.status
+                self._status_counts[old_status] -= 1
+                self._status_counts[task.status] += 1
                 logger.info(f"Task {task_id} status: {kwargs['status']}")
 
             return task
 
-    def list_tasks(self, limit: int = 100) -> list[TaskState]:
+    def list_tasks(
+        self, limit: int = 100, status: Optional[TaskStatus] = None
+    ) -> list[TaskState]:
         """
         List recent tasks.
 
         Args:
             limit: Maximum number of tasks to return
+            status: Only return tasks in this status (optional)
 
         Returns:
             List of TaskState objects, most recent first
         """
+        if limit <= 0:
+            return []
+
         with self._lock:
-            tasks = sorted(
-                self._tasks.values(),
-                key=lambda t: t.created_at,
-                reverse=True
-            )
-            return tasks[:limit]
+            # Columns are already in creation order - no sort needed
+            if status is None:
+                ids = self._ids[:-limit - 1:-1]
+            else:
+                ids = []
+                statuses = self._statuses
+                for i in range(len(statuses) - 1, -1, -1):
+                    if statuses[i] == status:
+                        ids.append(self._ids[i])
+                        if len(ids) == limit:
+                            break
+
+            return [self._tasks[tid] for tid in ids]
 
     def cleanup_expired(self) -> int:
         """
@@ -117,19 +173,89 @@ class TaskManager:
         Returns:
             Number of tasks removed
         """
-        cutoff = datetime.utcnow() - self._ttl
-        with self._lock:
-            expired = [
-                tid for tid, task in self._tasks.items()
-                if task.created_at < cutoff
-            ]
-            for tid in expired:
-                del self._tasks[tid]
+        # Integer monotonic times: no datetime arithmetic, and wall-clock
+        # adjustments can't break the sorted order
+        cutoff_ns = time.monotonic_ns() - self._ttl_ns
+        removed = 0
+        while True:
+            # Expire in bounded batches, releasing the lock in between so
+            # creates and updates never stall behind a large sweep
+            with self._lock:
+                # Creation order means expired tasks form a sorted prefix of
+                # the columns, so its length is a binary search away
+                count = min(
+                    bisect_left(self._created_ns, cutoff_ns),
+                    _CLEANUP_BATCH_SIZE,
+                )
+                if not count:
+                    break
+
+                for tid in self._ids[:count]:
+                    del self._tasks[tid]
+                    del self._pos[tid]
+                for status in self._statuses[:count]:
+                    self._status_counts[status] -= 1
+
+                del self._ids[:count]
+                del self._statuses[:count]
+                del self._created_ns[:count]
+                self._base += count
+            removed += count
+
+        if removed:
+            logger.info(f"Cleaned up {removed} expired tasks")
+
+        return removed
+
+    def await_build(self, commit_sha: str) -> asyncio.Future:
+        """
+        Register interest in the build result for a commit.
+
+        Must be called from the event loop; the future is resolved by
+        resolve_build() when the workflow_run webhook arrives.
 
-            if expired:
-                logger.info(f"Cleaned up {len(expired)} expired tasks")
+        Args:
+            commit_sha: Git commit SHA of the pushed build
+
+        Returns:
+            Future resolving to (status, run_id)
+        """
+        future = self._build_futures.get(commit_sha)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            self._build_futures[commit_sha] = future
+        return future
+
+    def resolve_build(
+        self, commit_sha: str, status: str, run_id: Optional[int]
+    ) -> bool:
+        """
+        Resolve a pending build with its final status.
+
+        Args:
+            commit_sha: Git commit SHA of the build
+            status: Workflow conclusion (success, failure, cancelled, ...)
+            run_id: GitHub Actions workflow run ID
 
-            return len(expired)
+        Returns:
+            True if a task was waiting on this build
+        """
+        future = self._build_futures.pop(commit_sha, None)
+        if future is None or future.done():
+            return False
+        future.set_result((status, run_id))
+        return True
+
+    def discard_build(self, commit_sha: str) -> None:
+        """
+        Stop waiting for a build (e.g. after timeout or a polled result).
+
+        Args:
+            commit_sha: Git commit SHA of the build
+        """
+        future = self._build_futures.pop(commit_sha, None)
+        if future is not None and not future.done():
+            future.cancel()
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -139,10 +265,11 @@ class TaskManager:
             Dict with counts by status
         """
         with self._lock:
-            stats: Dict[str, int] = {}
-            for task in self._tasks.values():
-                status = task.status.value
-                stats[status] = stats.get(status, 0) + 1
+            stats = {
+                status.value: count
+                for status, count in self._status_counts.items()
+                if count
+            }
             stats["total"] = len(self._tasks)
             return stats
 
@@ -8,7 +8,8 @@ import logging
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Tuple
+from functools import cached_property
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,16 @@ class PluginTemplate:
     # Constraints for the AI
     constraints: list[str]
 
+    @cached_property
+    def formatted_params(self) -> str:
+        """Available params as a prompt bullet list (built once per template)."""
+        return "\n".join(f"- {p}" for p in self.available_params)
+
+    @cached_property
+    def formatted_constraints(self) -> str:
+        """Constraints as a prompt bullet list (built once per template)."""
+        return "\n".join(f"- {c}" for c in self.constraints)
+
 
 # Logic injection markers
 LOGIC_START = "// === AI_LOGIC_START ==="
@@ -50,6 +61,10 @@ class TemplateManager:
         PluginType.DELAY: ["delay", "echo", "reverb", "time", "feedback"],
     }
 
+    # Templates are static, so they are built on first use and shared
+    # (read-only) by every request
+    _templates: Optional[Dict[PluginType, PluginTemplate]] = None
+
     @classmethod
     def detect_plugin_type(cls, prompt: str) -> PluginType:
         """
@@ -89,14 +104,15 @@ class TemplateManager:
         Returns:
             PluginTemplate with processor and editor code
         """
-        templates = {
-            PluginType.GAIN: cls._get_gain_template(),
-            PluginType.WAVESHAPER: cls._get_waveshaper_template(),
-            PluginType.FILTER: cls._get_filter_template(),
-            PluginType.DELAY: cls._get_delay_template(),
-            PluginType.GENERIC: cls._get_generic_template(),
-        }
-        return templates.get(plugin_type, cls._get_generic_template())
+        if cls._templates is None:
+            cls._templates = {
+                PluginType.GAIN: cls._get_gain_template(),
+                PluginType.WAVESHAPER: cls._get_waveshaper_template(),
+                PluginType.FILTER: cls._get_filter_template(),
+                PluginType.DELAY: cls._get_delay_template(),
+                PluginType.GENERIC: cls._get_generic_template(),
+            }
+        return cls._templates.get(plugin_type, cls._templates[PluginType.GENERIC])
 
     @classmethod
     def inject_logic(
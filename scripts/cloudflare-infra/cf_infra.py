@@ -22,7 +22,7 @@ Usage:
     python cf_infra.py setup --config cloudflare-config.yaml --dry-run
 
 Requirements:
-    pip install cloudflare pyyaml toml typer rich
+    pip install cloudflare pyyaml typer rich  (plus tomli on Python < 3.11)
 
 Author: Bodywave Engineering
 """
@@ -32,24 +32,31 @@ from __future__ import annotations
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Any, Optional
+from threading import Lock
+from typing import Any, Callable, Hashable, Iterable, Iterator, Optional, Sequence
 
-import toml
-import yaml
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+
+# rich.panel, rich.table and yaml are imported where they are used, so
+# commands that don't need them (init, --help) don't pay their import time
 
 try:
+    try:
+        import tomllib  # Python 3.11+
+    except ModuleNotFoundError:
+        import tomli as tomllib
+    import httpx
     import typer
-    from cloudflare import Cloudflare
+    from cloudflare import Cloudflare, DefaultHttpxClient
     import cloudflare as cf_errors
 except ImportError as e:
     print(f"Missing dependency: {e}")
-    print("Install with: pip install cloudflare pyyaml toml typer rich")
+    print("Install with: pip install -r requirements.txt")
     sys.exit(1)
 
 
@@ -65,7 +72,7 @@ class NamingConvention(str, Enum):
     SIMPLE = "simple"  # {env}-{project}-{resource}
 
 
-@dataclass
+@dataclass(slots=True)
 class KVNamespaceConfig:
     """Configuration for a KV namespace."""
 
@@ -73,7 +80,7 @@ class KVNamespaceConfig:
     namespace_id: Optional[str] = None  # Existing namespace ID (if known)
 
 
-@dataclass
+@dataclass(slots=True)
 class R2BucketConfig:
     """Configuration for an R2 bucket."""
 
@@ -82,7 +89,15 @@ class R2BucketConfig:
     public_access: bool = False  # Whether bucket allows public read access
 
 
-@dataclass
+# Security products a "skip" rule bypasses unless configured otherwise.
+# Shared and immutable: rules only copy it when building an API payload.
+_DEFAULT_SKIP_PRODUCTS = ("bic", "hot", "rateLimit", "securityLevel", "uaBlock", "waf", "zoneLockdown")
+
+# Expression matched by the CI/CD health check bypass rule
+_HEALTH_EXPR = '(http.request.uri.path eq "/health")'
+
+
+@dataclass(slots=True)
 class FirewallRuleConfig:
     """Configuration for a WAF/Firewall rule."""
 
@@ -91,12 +106,12 @@ class FirewallRuleConfig:
     expression: str  # Firewall expression (e.g., "(http.request.uri.path eq \"/health\")")
     action: str = "skip"  # Action: skip, block, challenge, js_challenge, managed_challenge
     # Products to skip when action is "skip" (bot protection, waf, etc.)
-    skip_products: list[str] = field(default_factory=lambda: ["bic", "hot", "rateLimit", "securityLevel", "uaBlock", "waf", "zoneLockdown"])
+    skip_products: Sequence[str] = _DEFAULT_SKIP_PRODUCTS
     priority: int = 1  # Lower = higher priority
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentConfig:
     """Configuration for a single environment (dev, production, etc.)."""
 
@@ -118,7 +133,7 @@ class EnvironmentConfig:
     r2_buckets: list[R2BucketConfig] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Complete project configuration."""
 
@@ -153,7 +168,9 @@ class ProjectConfig:
 # Console Output Helpers
 # =============================================================================
 
-console = Console()
+# No automatic highlighting: the log helpers style their own tags, and the
+# highlighter's regex pass over every line more than doubles print cost
+console = Console(highlight=False)
 
 
 def log_info(message: str) -> None:
@@ -185,6 +202,13 @@ def log_dry_run(message: str) -> None:
 # Wrangler.toml Parser
 # =============================================================================
 
+# Worker name patterns the project name is derived from
+_PROJECT_BODYWAVE_RE = re.compile(r"backend-\w+-(.+?)-apps-bodywave-org")  # backend-{env}-{project}-apps-bodywave-org
+_PROJECT_BOOKING_RE = re.compile(r"(.+?)-booking-api-\w+")  # {project}-booking-api-{env}
+
+# Parsed wrangler.toml documents by resolved path, with the (mtime_ns, size) they were read at
+_WRANGLER_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 class WranglerParser:
     """Parses wrangler.toml to extract project configuration."""
@@ -194,12 +218,27 @@ class WranglerParser:
         self.data: dict[str, Any] = {}
 
     def parse(self) -> dict[str, Any]:
-        """Parse the wrangler.toml file."""
-        if not self.path.exists():
-            raise FileNotFoundError(f"wrangler.toml not found: {self.path}")
+        """Parse the wrangler.toml file, reusing the parse while it is unchanged.
+
+        The parsed document is shared between parsers and must not be mutated.
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"wrangler.toml not found: {self.path}") from None
+
+        key = self.path.resolve()
+        stamp = (stat.st_mtime_ns, stat.st_size)
 
-        with open(self.path) as f:
-            self.data = toml.load(f)
+        cached = _WRANGLER_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            self.data = cached[1]
+            return self.data
+
+        # tomllib requires binary mode
+        with open(self.path, "rb") as f:
+            self.data = tomllib.load(f)
+        _WRANGLER_CACHE[key] = (stamp, self.data)
 
         return self.data
 
@@ -208,33 +247,24 @@ class WranglerParser:
         name = self.data.get("name", "")
 
         # Try to extract project name from naming patterns
-        # Pattern: backend-{env}-{project}-apps-bodywave-org
-        match = re.search(r"backend-\w+-(.+?)-apps-bodywave-org", name)
-        if match:
-            return match.group(1)
-
-        # Pattern: {project}-booking-api-{env}
-        match = re.search(r"(.+?)-booking-api-\w+", name)
-        if match:
-            return match.group(1)
+        for pattern in (_PROJECT_BODYWAVE_RE, _PROJECT_BOOKING_RE):
+            match = pattern.search(name)
+            if match:
+                return match.group(1)
 
         # Fallback: use the name as-is
         return name if name else None
 
     def get_environments(self) -> dict[str, dict[str, Any]]:
         """Extract environment configurations."""
-        envs = {}
+        # [env.dev] tables parse to a nested "env" dict
+        env = self.data.get("env")
+        envs = dict(env) if isinstance(env, dict) else {}
 
+        # Quoted ["env.dev"] tables stay flat top-level keys (rare)
         for key, value in self.data.items():
-            if key.startswith("env.") or (key == "env" and isinstance(value, dict)):
-                if key == "env":
-                    # Handle [env] with nested keys
-                    for env_name, env_config in value.items():
-                        envs[env_name] = env_config
-                else:
-                    # Handle [env.dev] style
-                    env_name = key.replace("env.", "")
-                    envs[env_name] = value
+            if key.startswith("env."):
+                envs[key[4:]] = value
 
         return envs
 
@@ -267,29 +297,64 @@ class WranglerParser:
 # =============================================================================
 
 
+# ${VAR} references in config values (whole values or embedded)
+_ENVVAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _interpolate_env(value: Any) -> Any:
+    """Resolve ${VAR} references throughout a parsed YAML tree (unset -> "")."""
+    if isinstance(value, str):
+        if "${" not in value:
+            return value
+        return _ENVVAR_RE.sub(lambda m: os.environ.get(m.group(1), ""), value)
+    if isinstance(value, dict):
+        return {k: _interpolate_env(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_interpolate_env(v) for v in value]
+    return value
+
+
+# Parsed YAML documents by resolved path, with the (mtime_ns, size) they were read at
+_YAML_CACHE: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+
+def _load_yaml_document(config_path: Path) -> Any:
+    """Parse a YAML file, reusing the parse while the file is unchanged.
+
+    The raw document is cached (not the interpolated config), so ${VAR}
+    values always reflect the current environment and secrets never leave
+    the process.
+    """
+    stat = config_path.stat()
+    key = config_path.resolve()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    import yaml  # Deferred: only commands that read a config file need it
+
+    # libyaml-backed loader when PyYAML was built with it (the usual wheels are)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, "rb") as f:
+        document = yaml.load(f, Loader=loader)
+    _YAML_CACHE[key] = (stamp, document)
+    return document
+
+
 def load_config_from_yaml(config_path: Path) -> ProjectConfig:
     """Load configuration from YAML file."""
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
-
-    # Resolve environment variables in values
-    def resolve_env_vars(value: Any) -> Any:
-        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-            env_var = value[2:-1]
-            return os.environ.get(env_var, "")
-        return value
+    # Interpolation rebuilds every container, so the cached document is never mutated
+    data = _interpolate_env(_load_yaml_document(config_path))
 
     # Get credentials
     creds = data.get("credentials", {})
-    api_token = resolve_env_vars(creds.get("api_token", "")) or os.environ.get(
-        "CLOUDFLARE_API_TOKEN", ""
-    )
-    account_id = resolve_env_vars(creds.get("account_id", "")) or os.environ.get(
-        "CLOUDFLARE_ACCOUNT_ID", ""
-    )
+    api_token = creds.get("api_token", "") or os.environ.get("CLOUDFLARE_API_TOKEN", "")
+    account_id = creds.get("account_id", "") or os.environ.get("CLOUDFLARE_ACCOUNT_ID", "")
 
     if not api_token:
         raise ValueError("API token not provided. Set CLOUDFLARE_API_TOKEN or credentials.api_token")
@@ -390,7 +455,7 @@ def load_config_from_yaml(config_path: Path) -> ProjectConfig:
                 description=rule_data.get("description"),
                 expression=rule_data.get("expression"),
                 action=rule_data.get("action", "skip"),
-                skip_products=rule_data.get("skip_products", ["bic", "hot", "rateLimit", "securityLevel", "uaBlock", "waf", "zoneLockdown"]),
+                skip_products=rule_data.get("skip_products", _DEFAULT_SKIP_PRODUCTS),
                 priority=rule_data.get("priority", 1),
                 enabled=rule_data.get("enabled", True),
             )
@@ -496,44 +561,229 @@ def load_config_from_wrangler(
 # =============================================================================
 
 
+# Upper bound on concurrent API calls per fan-out
+_MAX_WORKERS = 8
+
+# SDK pool sizes, with idle connections kept long enough to be reused
+# across setup phases instead of re-handshaking TLS
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+# Attempts after the first for 408/409/429/5xx and connection errors. The SDK
+# backs off exponentially with jitter (0.5s up to 8s) and honors Retry-After;
+# the default of 2 is too few once calls fan out and hit rate limits.
+_MAX_RETRIES = 5
+
+# Page sizes for paginated listings, within each endpoint's maximum
+# (the API default is 20, which turns busy accounts into many round-trips)
+_ZONES_PER_PAGE = 50
+_KV_PER_PAGE = 100
+_DNS_PER_PAGE = 1000
+
+
+def _iter_all(pager: Any) -> Iterator[Any]:
+    """Iterate every item of a paginated SDK listing, fetching pages lazily.
+
+    Pages are only requested as iteration reaches them, so a caller that
+    stops early never fetches the rest. The SDK only stops paging once it
+    receives an empty page; a page shorter than the per_page the API reports
+    already means the listing is complete, so that final round-trip is skipped.
+    """
+    for page in pager.iter_pages():
+        batch = page.result or []
+        yield from batch
+        per_page = getattr(getattr(page, "result_info", None), "per_page", None)
+        if per_page and len(batch) < per_page:
+            return
+
+
+# Cloudflare error codes for "already exists" (R2 bucket, KV namespace title)
+_ALREADY_EXISTS_CODES = frozenset({10004, 10014})
+# Endpoints without a dedicated code only say so in the error message
+_ALREADY_EXISTS_RE = re.compile(r"already (?:exists|being used)", re.IGNORECASE)
+
+
+def _is_already_exists(error: cf_errors.APIError) -> bool:
+    """Whether an API error reports that the resource already exists."""
+    if isinstance(error, cf_errors.ConflictError):
+        return True
+
+    details = getattr(error, "errors", None)
+    if not details:
+        return bool(_ALREADY_EXISTS_RE.search(error.message))
+
+    return any(
+        detail.code in _ALREADY_EXISTS_CODES or _ALREADY_EXISTS_RE.search(detail.message or "")
+        for detail in details
+    )
+
+
+# Mutating methods replaced by their _dry_run_* stubs in dry-run mode
+_DRY_RUN_METHODS = (
+    "create_pages_project",
+    "add_custom_domain_to_pages",
+    "create_kv_namespace",
+    "create_r2_bucket",
+    "create_firewall_rules_bulk",
+    "create_dns_record",
+)
+
+
 class CloudflareInfraManager:
     """Manages Cloudflare infrastructure (Pages, DNS, Workers)."""
 
     def __init__(self, config: ProjectConfig):
         self.config = config
-        self.client = Cloudflare(api_token=config.api_token)
-        self._zone_id: Optional[str] = config.zone_id
+        # One pooled HTTP client shared by every call (and worker thread)
+        self.client = Cloudflare(
+            api_token=config.api_token,
+            http_client=DefaultHttpxClient(limits=_HTTP_LIMITS),
+            max_retries=_MAX_RETRIES,
+        )
+        if config.zone_id:
+            # Seed the cached property: no discovery needed
+            self.__dict__["zone_id"] = config.zone_id
 
-    @property
-    def zone_id(self) -> str:
-        """Get or discover the zone ID for the root domain."""
-        if not self._zone_id:
-            self._zone_id = self._discover_zone_id()
-        return self._zone_id
+        if config.dry_run:
+            # Swap the mutating calls for logging stubs once, so the real
+            # methods never need their own dry-run checks
+            for name in _DRY_RUN_METHODS:
+                setattr(self, name, getattr(self, f"_dry_run_{name}"))
+
+        # Per-run snapshots of account/zone listings, fetched on first use
+        self._listings: dict[Hashable, Any] = {}
+        self._listing_locks: dict[Hashable, Lock] = {}
+        self._listings_lock = Lock()
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self.client.close()
+
+    def __enter__(self) -> CloudflareInfraManager:
+        return self
 
-    def _discover_zone_id(self) -> str:
-        """Discover zone ID from root domain."""
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @cached_property
+    def zone_id(self) -> str:
+        """Discover the zone ID for the root domain."""
         log_info(f"Discovering zone ID for {self.config.root_domain}...")
 
         try:
-            zones = list(self.client.zones.list(name=self.config.root_domain))
-            if not zones:
+            zone = next(
+                _iter_all(self.client.zones.list(name=self.config.root_domain, per_page=_ZONES_PER_PAGE)),
+                None,
+            )
+            if zone is None:
                 raise ValueError(f"Zone not found for domain: {self.config.root_domain}")
 
-            zone_id = zones[0].id
+            zone_id = zone.id
             log_success(f"Found zone ID: {zone_id}")
             return zone_id
         except Exception as e:
             log_error(f"Failed to discover zone ID: {e}")
             raise
 
-    def verify_token(self) -> bool:
-        """Verify the API token is valid."""
+    def _cached(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return a value fetched once per run and shared by all workers."""
+        with self._listings_lock:
+            lock = self._listing_locks.setdefault(key, Lock())
+
+        # Per-key lock: concurrent callers wait for one fetch instead of racing
+        with lock:
+            value = self._listings.get(key)
+            if value is None:
+                value = self._listings[key] = fetch()
+            return value
+
+    def _cached_listing(self, key: Hashable, fetch: Callable[[], Iterable[Any]]) -> list[Any]:
+        """Return a listing fetched once per run and shared by all workers.
+
+        Existence checks consult the snapshot instead of re-listing per
+        resource; creators append what they create to keep it current.
+        """
+        return self._cached(key, lambda: list(fetch()))
+
+    def _invalidate_listing(self, key: Hashable) -> None:
+        """Drop a cached listing or index so the next use refetches it."""
+        self._listings.pop(key, None)
+
+    def _get_pages_domains(self, project_name: str) -> set[str]:
+        """Names of a Pages project's custom domains."""
+        return self._cached(
+            ("pages_domains", project_name),
+            lambda: {
+                domain.name
+                for domain in self.client.pages.projects.domains.list(
+                    project_name=project_name,
+                    account_id=self.config.account_id,
+                )
+            },
+        )
+
+    def _get_kv_namespaces(self) -> dict[str, Any]:
+        """KV namespaces in the account, keyed by title."""
+        return self._cached(
+            "kv_namespaces",
+            lambda: {
+                ns.title: ns
+                for ns in _iter_all(
+                    self.client.kv.namespaces.list(account_id=self.config.account_id, per_page=_KV_PER_PAGE)
+                )
+            },
+        )
+
+    def _get_r2_buckets(self) -> dict[str, Any]:
+        """R2 buckets in the account, keyed by name."""
+        def fetch() -> dict[str, Any]:
+            response = self.client.r2.buckets.list(account_id=self.config.account_id)
+            # Newer SDKs wrap the buckets in a response object
+            buckets = getattr(response, "buckets", response) or []
+            return {bucket.name: bucket for bucket in buckets}
+
+        return self._cached("r2_buckets", fetch)
+
+    def _get_dns_index(self) -> dict[tuple[str, str], str]:
+        """Zone DNS record IDs keyed by (type, lowercased name), from one listing."""
+        return self._cached(
+            "dns_index",
+            lambda: {
+                (record.type, record.name.lower()): record.id
+                for record in _iter_all(
+                    self.client.dns.records.list(zone_id=self.zone_id, per_page=_DNS_PER_PAGE)
+                )
+            },
+        )
+
+    def _get_zone_rulesets(self) -> list[Any]:
+        """Rulesets of the zone."""
+        return self._cached_listing(
+            "zone_rulesets",
+            lambda: self.client.rulesets.list(zone_id=self.zone_id),
+        )
+
+    def verify_token(self, zone_scoped: Optional[bool] = None) -> bool:
+        """Verify the API token is valid.
+
+        When zone-scoped work follows, zone discovery doubles as the check, so
+        the zone ID is already cached (and shared by every worker) when setup
+        starts. Otherwise only the token itself is verified, so a token with
+        account-scoped permissions alone (Pages/KV/R2) still passes.
+        zone_scoped defaults to whether DNS records or firewall rules are enabled.
+        """
         log_info("Verifying API token...")
 
+        if zone_scoped is None:
+            zone_scoped = self.config.create_dns_records or self.config.create_firewall_rules
+
         try:
-            # Try to list zones as a simple verification
-            list(self.client.zones.list(per_page=1))
+            if not zone_scoped:
+                self.client.user.tokens.verify()
+            elif self.config.zone_id:
+                # Zone ID configured: one authenticated fetch of that zone
+                self.client.zones.get(zone_id=self.config.zone_id)
+            else:
+                self.zone_id
             log_success("API token is valid")
             return True
         except cf_errors.AuthenticationError:
@@ -551,10 +801,6 @@ class CloudflareInfraManager:
         """Create a Cloudflare Pages project."""
         log_info(f"Creating Pages project: {project_name}...")
 
-        if self.config.dry_run:
-            log_dry_run(f"Create Pages project '{project_name}' with branch '{production_branch}'")
-            return True
-
         try:
             # Check if project already exists
             try:
@@ -579,7 +825,7 @@ class CloudflareInfraManager:
 
         except cf_errors.APIError as e:
             # Handle "already exists" error gracefully
-            if "already exists" in str(e).lower():
+            if _is_already_exists(e):
                 log_warning(f"Pages project '{project_name}' already exists")
                 return True
             log_error(f"Failed to create Pages project: {e}")
@@ -592,23 +838,12 @@ class CloudflareInfraManager:
         """Add a custom domain to a Pages project."""
         log_info(f"Adding custom domain '{domain_name}' to Pages project '{project_name}'...")
 
-        if self.config.dry_run:
-            log_dry_run(f"Add custom domain '{domain_name}' to Pages project '{project_name}'")
-            return True
-
         try:
             # Check if domain already exists
             try:
-                domains = list(
-                    self.client.pages.projects.domains.list(
-                        project_name=project_name,
-                        account_id=self.config.account_id,
-                    )
-                )
-                for domain in domains:
-                    if domain.name == domain_name:
-                        log_warning(f"Custom domain '{domain_name}' already exists on project")
-                        return True
+                if domain_name in self._get_pages_domains(project_name):
+                    log_warning(f"Custom domain '{domain_name}' already exists on project")
+                    return True
             except Exception:
                 pass  # Continue to add
 
@@ -618,11 +853,13 @@ class CloudflareInfraManager:
                 account_id=self.config.account_id,
                 name=domain_name,
             )
+            if (domains := self._listings.get(("pages_domains", project_name))) is not None:
+                domains.add(domain_name)
             log_success(f"Added custom domain: {domain_name}")
             return True
 
         except cf_errors.APIError as e:
-            if "already exists" in str(e).lower() or "already being used" in str(e).lower():
+            if _is_already_exists(e):
                 log_warning(f"Custom domain '{domain_name}' already exists")
                 return True
             log_error(f"Failed to add custom domain: {e}")
@@ -639,20 +876,13 @@ class CloudflareInfraManager:
         """Create a Cloudflare KV namespace and return its ID."""
         log_info(f"Creating KV namespace: {namespace_name}...")
 
-        if self.config.dry_run:
-            log_dry_run(f"Create KV namespace '{namespace_name}'")
-            return "dry-run-kv-id"
-
         try:
             # Check if namespace already exists
             try:
-                namespaces = list(
-                    self.client.kv.namespaces.list(account_id=self.config.account_id)
-                )
-                for ns in namespaces:
-                    if ns.title == namespace_name:
-                        log_warning(f"KV namespace '{namespace_name}' already exists with ID: {ns.id}")
-                        return ns.id
+                ns = self._get_kv_namespaces().get(namespace_name)
+                if ns is not None:
+                    log_warning(f"KV namespace '{namespace_name}' already exists with ID: {ns.id}")
+                    return ns.id
             except Exception:
                 pass  # Continue to create
 
@@ -662,20 +892,20 @@ class CloudflareInfraManager:
                 title=namespace_name,
             )
             namespace_id = result.id
+            if (namespaces := self._listings.get("kv_namespaces")) is not None:
+                namespaces[namespace_name] = result
             log_success(f"Created KV namespace: {namespace_name} (ID: {namespace_id})")
             return namespace_id
 
         except cf_errors.APIError as e:
-            if "already exists" in str(e).lower():
+            if _is_already_exists(e):
                 log_warning(f"KV namespace '{namespace_name}' already exists")
-                # Try to get the ID
+                # Try to get the ID (created since the snapshot was taken)
                 try:
-                    namespaces = list(
-                        self.client.kv.namespaces.list(account_id=self.config.account_id)
-                    )
-                    for ns in namespaces:
-                        if ns.title == namespace_name:
-                            return ns.id
+                    self._invalidate_listing("kv_namespaces")
+                    ns = self._get_kv_namespaces().get(namespace_name)
+                    if ns is not None:
+                        return ns.id
                 except Exception:
                     pass
                 return None
@@ -690,11 +920,9 @@ class CloudflareInfraManager:
         log_info("Listing KV namespaces...")
 
         try:
-            namespaces = list(
-                self.client.kv.namespaces.list(account_id=self.config.account_id)
-            )
+            namespaces = self._get_kv_namespaces()
             result = []
-            for ns in namespaces:
+            for ns in namespaces.values():
                 result.append({"id": ns.id, "title": ns.title})
                 log_info(f"  - {ns.title}: {ns.id}")
             return result
@@ -710,28 +938,22 @@ class CloudflareInfraManager:
         """Create a Cloudflare R2 bucket and return its name."""
         log_info(f"Creating R2 bucket: {bucket_name}...")
 
-        if self.config.dry_run:
-            log_dry_run(f"Create R2 bucket '{bucket_name}' (public_access={public_access})")
-            return bucket_name
-
         try:
             # Check if bucket already exists
             try:
-                buckets = list(
-                    self.client.r2.buckets.list(account_id=self.config.account_id)
-                )
-                for bucket in buckets:
-                    if bucket.name == bucket_name:
-                        log_warning(f"R2 bucket '{bucket_name}' already exists")
-                        return bucket_name
+                if bucket_name in self._get_r2_buckets():
+                    log_warning(f"R2 bucket '{bucket_name}' already exists")
+                    return bucket_name
             except Exception:
                 pass  # Continue to create
 
             # Create the bucket
-            self.client.r2.buckets.create(
+            result = self.client.r2.buckets.create(
                 account_id=self.config.account_id,
                 name=bucket_name,
             )
+            if (buckets := self._listings.get("r2_buckets")) is not None:
+                buckets[bucket_name] = result
             log_success(f"Created R2 bucket: {bucket_name}")
 
             # Note: Public access for R2 requires additional configuration via
@@ -743,7 +965,7 @@ class CloudflareInfraManager:
             return bucket_name
 
         except cf_errors.APIError as e:
-            if "already exists" in str(e).lower() or "10004" in str(e):
+            if _is_already_exists(e):
                 log_warning(f"R2 bucket '{bucket_name}' already exists")
                 return bucket_name
             log_error(f"Failed to create R2 bucket: {e}")
@@ -757,11 +979,9 @@ class CloudflareInfraManager:
         log_info("Listing R2 buckets...")
 
         try:
-            buckets = list(
-                self.client.r2.buckets.list(account_id=self.config.account_id)
-            )
+            buckets = self._get_r2_buckets()
             result = []
-            for bucket in buckets:
+            for bucket in buckets.values():
                 result.append({"name": bucket.name, "creation_date": str(bucket.creation_date) if hasattr(bucket, 'creation_date') else "N/A"})
                 log_info(f"  - {bucket.name}")
             return result
@@ -773,6 +993,21 @@ class CloudflareInfraManager:
     # Firewall Rules Management (WAF Bypass for CI/CD Health Checks)
     # -------------------------------------------------------------------------
 
+    def _load_custom_ruleset(self) -> tuple[Optional[Any], list[Any]]:
+        """Find the zone's custom firewall ruleset and fetch its rules.
+
+        Returns:
+            (ruleset or None if the zone has none yet, its current rules)
+        """
+        for rs in self._get_zone_rulesets():
+            if rs.kind == "zone" and rs.phase == "http_request_firewall_custom":
+                ruleset_details = self.client.rulesets.get(
+                    ruleset_id=rs.id,
+                    zone_id=self.zone_id,
+                )
+                return rs, ruleset_details.rules or []
+        return None, []
+
     def create_firewall_rule(self, rule_config: FirewallRuleConfig) -> bool:
         """Create or update a zone-level firewall rule.
 
@@ -780,161 +1015,138 @@ class CloudflareInfraManager:
         firewall rules API). Creates a skip rule to bypass bot protection for
         specific paths like /health endpoints.
         """
-        log_info(f"Creating firewall rule: {rule_config.name}...")
+        return self.create_firewall_rules_bulk([rule_config])
 
-        if self.config.dry_run:
-            log_dry_run(
-                f"Create firewall rule '{rule_config.name}' with expression: {rule_config.expression}"
-            )
+    def create_firewall_rules_bulk(self, rule_configs: list[FirewallRuleConfig]) -> bool:
+        """Create several zone-level firewall rules with a single ruleset write.
+
+        The custom ruleset is looked up once, rules whose description is
+        already present are skipped, and the rest are appended in one
+        update (or one create if the zone has no custom ruleset yet).
+        """
+        if not rule_configs:
             return True
 
-        try:
-            # Check if rule already exists by listing custom rules
-            existing_rule_id = None
-            try:
-                # Get the zone's custom firewall ruleset
-                rulesets = list(
-                    self.client.rulesets.list(zone_id=self.zone_id)
-                )
-                custom_ruleset = None
-                for rs in rulesets:
-                    if rs.kind == "zone" and rs.phase == "http_request_firewall_custom":
-                        custom_ruleset = rs
-                        break
+        for rule_config in rule_configs:
+            log_info(f"Creating firewall rule: {rule_config.name}...")
 
-                if custom_ruleset:
-                    # Get the ruleset details to find existing rule
-                    ruleset_details = self.client.rulesets.get(
-                        ruleset_id=custom_ruleset.id,
-                        zone_id=self.zone_id,
-                    )
-                    if ruleset_details.rules:
-                        for rule in ruleset_details.rules:
-                            if rule.description == rule_config.description:
-                                existing_rule_id = rule.id
-                                log_warning(
-                                    f"Firewall rule '{rule_config.name}' already exists (ID: {existing_rule_id})"
-                                )
-                                return True
-            except Exception as e:
-                log_info(f"No existing custom ruleset found, will create new: {e}")
-
-            # Create the firewall rule using the Rulesets API
-            # Phase: http_request_firewall_custom for zone-level custom rules
-            rule_data = {
-                "action": rule_config.action,
-                "expression": rule_config.expression,
-                "description": rule_config.description,
-                "enabled": rule_config.enabled,
-            }
+        names = ", ".join(rule_config.name for rule_config in rule_configs)
 
-            # Add action_parameters for skip action
-            if rule_config.action == "skip":
-                rule_data["action_parameters"] = {
-                    "products": rule_config.skip_products,
+        try:
+            # One lookup serves both the existence checks and the update payload
+            custom_ruleset, existing_rules = self._load_custom_ruleset()
+
+            existing = {rule.description: rule.id for rule in existing_rules}
+            new_rules = []
+            for rule_config in rule_configs:
+                if rule_config.description in existing:
+                    log_warning(
+                        f"Firewall rule '{rule_config.name}' already exists "
+                        f"(ID: {existing[rule_config.description]})"
+                    )
+                    continue
+
+                # Create the firewall rule using the Rulesets API
+                # Phase: http_request_firewall_custom for zone-level custom rules
+                rule_data = {
+                    "action": rule_config.action,
+                    "expression": rule_config.expression,
+                    "description": rule_config.description,
+                    "enabled": rule_config.enabled,
                 }
 
+                # Add action_parameters for skip action
+                if rule_config.action == "skip":
+                    rule_data["action_parameters"] = {
+                        "products": list(rule_config.skip_products),
+                    }
+
+                existing[rule_config.description] = None  # Duplicates within the batch
+                new_rules.append(rule_data)
+
+            if not new_rules:
+                return True
+
             # Create or update the ruleset
             try:
-                # Try to get existing custom ruleset
-                rulesets = list(self.client.rulesets.list(zone_id=self.zone_id))
-                custom_ruleset = None
-                for rs in rulesets:
-                    if rs.kind == "zone" and rs.phase == "http_request_firewall_custom":
-                        custom_ruleset = rs
-                        break
-
                 if custom_ruleset:
-                    # Update existing ruleset with new rule
-                    existing_rules = []
-                    ruleset_details = self.client.rulesets.get(
-                        ruleset_id=custom_ruleset.id,
-                        zone_id=self.zone_id,
-                    )
-                    if ruleset_details.rules:
-                        existing_rules = [
-                            {
+                    # Update existing ruleset with the new rules, keeping the
+                    # current rules (without None fields) ahead of them
+                    all_rules = [
+                        {
+                            k: v
+                            for k, v in {
                                 "action": r.action,
                                 "expression": r.expression,
                                 "description": r.description,
                                 "enabled": r.enabled,
-                                "action_parameters": r.action_parameters if hasattr(r, 'action_parameters') else None,
-                            }
-                            for r in ruleset_details.rules
-                            if r.description != rule_config.description  # Skip if updating same rule
-                        ]
-                        # Filter out None action_parameters
-                        existing_rules = [
-                            {k: v for k, v in r.items() if v is not None}
-                            for r in existing_rules
-                        ]
-
-                    # Add our new rule
-                    all_rules = existing_rules + [rule_data]
+                                "action_parameters": getattr(r, "action_parameters", None),
+                            }.items()
+                            if v is not None
+                        }
+                        for r in existing_rules
+                    ] + new_rules
 
                     self.client.rulesets.update(
                         ruleset_id=custom_ruleset.id,
                         zone_id=self.zone_id,
                         rules=all_rules,
                     )
-                    log_success(f"Updated firewall ruleset with rule: {rule_config.name}")
+                    log_success(f"Updated firewall ruleset with rules: {names}")
                 else:
-                    # Create new ruleset with the rule
+                    # Create new ruleset with the rules
                     self.client.rulesets.create(
                         zone_id=self.zone_id,
                         kind="zone",
                         name="Custom Firewall Rules",
                         phase="http_request_firewall_custom",
-                        rules=[rule_data],
+                        rules=new_rules,
                     )
-                    log_success(f"Created firewall ruleset with rule: {rule_config.name}")
+                    self._invalidate_listing("zone_rulesets")
+                    log_success(f"Created firewall ruleset with rules: {names}")
 
                 return True
 
             except cf_errors.APIError as e:
                 # Handle specific API errors
-                if "already exists" in str(e).lower():
-                    log_warning(f"Firewall rule '{rule_config.name}' already exists")
+                if _is_already_exists(e):
+                    log_warning(f"Firewall rules already exist: {names}")
                     return True
                 raise
 
         except cf_errors.APIError as e:
-            log_error(f"Failed to create firewall rule: {e}")
+            log_error(f"Failed to create firewall rules: {e}")
             return False
         except Exception as e:
-            log_error(f"Failed to create firewall rule: {e}")
+            log_error(f"Failed to create firewall rules: {e}")
             return False
 
-    def list_firewall_rules(self) -> list[dict[str, Any]]:
-        """List all custom firewall rules in the zone."""
+    def iter_firewall_rules(self) -> Iterator[dict[str, Any]]:
+        """Yield the zone's custom firewall rules as they are read from the ruleset."""
         log_info("Listing firewall rules...")
 
-        try:
-            rulesets = list(self.client.rulesets.list(zone_id=self.zone_id))
-            result = []
-
-            for rs in rulesets:
-                if rs.kind == "zone" and rs.phase == "http_request_firewall_custom":
-                    ruleset_details = self.client.rulesets.get(
-                        ruleset_id=rs.id,
-                        zone_id=self.zone_id,
-                    )
-                    if ruleset_details.rules:
-                        for rule in ruleset_details.rules:
-                            result.append({
-                                "id": rule.id,
-                                "description": rule.description,
-                                "expression": rule.expression,
-                                "action": rule.action,
-                                "enabled": rule.enabled,
-                            })
-                            log_info(f"  - {rule.description}: {rule.expression}")
+        _, rules = self._load_custom_ruleset()
+        for rule in rules:
+            yield {
+                "id": rule.id,
+                "description": rule.description,
+                "expression": rule.expression,
+                "action": rule.action,
+                "enabled": rule.enabled,
+            }
 
-            return result
+    def list_firewall_rules(self) -> list[dict[str, Any]]:
+        """List all custom firewall rules in the zone."""
+        try:
+            result = list(self.iter_firewall_rules())
         except Exception as e:
             log_error(f"Failed to list firewall rules: {e}")
             return []
 
+        for rule in result:
+            log_info(f"  - {rule['description']}: {rule['expression']}")
+        return result
+
     def setup_health_endpoint_bypass(self) -> bool:
         """Create a firewall rule to bypass bot protection for /health endpoints.
 
@@ -944,9 +1156,9 @@ class CloudflareInfraManager:
         health_bypass_rule = FirewallRuleConfig(
             name="ci-health-check-bypass",
             description="Bypass bot protection for CI/CD health checks",
-            expression='(http.request.uri.path eq "/health")',
+            expression=_HEALTH_EXPR,
             action="skip",
-            skip_products=["bic", "hot", "rateLimit", "securityLevel", "uaBlock", "waf", "zoneLockdown"],
+            skip_products=_DEFAULT_SKIP_PRODUCTS,
             priority=1,
             enabled=True,
         )
@@ -970,25 +1182,14 @@ class CloudflareInfraManager:
 
         log_info(f"Creating {record_type} record: {name} -> {target}...")
 
-        if self.config.dry_run:
-            log_dry_run(f"Create {record_type} record: {name} -> {target} (proxied={proxied})")
-            return True
-
         try:
-            # Check if record already exists
+            # Check if record already exists (one zone-wide listing per run)
             existing_id = None
             try:
-                records = list(
-                    self.client.dns.records.list(
-                        zone_id=self.zone_id,
-                        type=record_type,
-                        name=name,
-                    )
-                )
-                if records:
-                    existing_id = records[0].id
+                dns_index = self._get_dns_index()
+                existing_id = dns_index.get((record_type, name.lower()))
             except Exception:
-                pass
+                dns_index = None
 
             if existing_id:
                 # Update existing record
@@ -1005,7 +1206,7 @@ class CloudflareInfraManager:
                 log_success(f"Updated {record_type} record: {name}")
             else:
                 # Create new record
-                self.client.dns.records.create(
+                result = self.client.dns.records.create(
                     zone_id=self.zone_id,
                     type=record_type,
                     name=name,
@@ -1013,6 +1214,8 @@ class CloudflareInfraManager:
                     proxied=proxied,
                     ttl=ttl,
                 )
+                if dns_index is not None:
+                    dns_index[(record_type, name.lower())] = result.id
                 log_success(f"Created {record_type} record: {name} -> {target}")
 
             return True
@@ -1024,105 +1227,150 @@ class CloudflareInfraManager:
             log_error(f"Failed to create/update DNS record: {e}")
             return False
 
+    # -------------------------------------------------------------------------
+    # Dry-Run Stubs (installed over the methods above by __init__)
+    # -------------------------------------------------------------------------
+
+    def _dry_run_create_pages_project(self, project_name: str, production_branch: str = "main") -> bool:
+        log_info(f"Creating Pages project: {project_name}...")
+        log_dry_run(f"Create Pages project '{project_name}' with branch '{production_branch}'")
+        return True
+
+    def _dry_run_add_custom_domain_to_pages(self, project_name: str, domain_name: str) -> bool:
+        log_info(f"Adding custom domain '{domain_name}' to Pages project '{project_name}'...")
+        log_dry_run(f"Add custom domain '{domain_name}' to Pages project '{project_name}'")
+        return True
+
+    def _dry_run_create_kv_namespace(self, namespace_name: str) -> Optional[str]:
+        log_info(f"Creating KV namespace: {namespace_name}...")
+        log_dry_run(f"Create KV namespace '{namespace_name}'")
+        return "dry-run-kv-id"
+
+    def _dry_run_create_r2_bucket(self, bucket_name: str, public_access: bool = False) -> Optional[str]:
+        log_info(f"Creating R2 bucket: {bucket_name}...")
+        log_dry_run(f"Create R2 bucket '{bucket_name}' (public_access={public_access})")
+        return bucket_name
+
+    def _dry_run_create_firewall_rules_bulk(self, rule_configs: list[FirewallRuleConfig]) -> bool:
+        for rule_config in rule_configs:
+            log_info(f"Creating firewall rule: {rule_config.name}...")
+            log_dry_run(
+                f"Create firewall rule '{rule_config.name}' with expression: {rule_config.expression}"
+            )
+        return True
+
+    def _dry_run_create_dns_record(
+        self,
+        name: str,
+        target: str,
+        record_type: str = "CNAME",
+        proxied: Optional[bool] = None,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        proxied = proxied if proxied is not None else self.config.dns_proxied
+        log_info(f"Creating {record_type} record: {name} -> {target}...")
+        log_dry_run(f"Create {record_type} record: {name} -> {target} (proxied={proxied})")
+        return True
+
     # -------------------------------------------------------------------------
     # High-Level Operations
     # -------------------------------------------------------------------------
 
-    def setup_environment(self, env_config: EnvironmentConfig) -> bool:
-        """Set up all infrastructure for an environment."""
-        log_info(f"\n{'='*50}")
-        log_info(f"Setting up environment: {env_config.name}")
-        log_info(f"{'='*50}\n")
+    def _run_concurrently(self, calls: list[Callable[[], Any]]) -> list[Any]:
+        """Run independent API calls on a thread pool, returning results in order."""
+        # Dry runs stay serial so the planned actions print in a stable order
+        if len(calls) <= 1 or self.config.dry_run:
+            return [call() for call in calls]
 
+        # The SDK's httpx client is thread-safe, so workers share its connection pool
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(calls))) as pool:
+            futures = [pool.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def _setup_pages_project(
+        self, project_name: str, production_branch: str, custom_domains: list[str]
+    ) -> bool:
+        """Create a Pages project, then attach its custom domains."""
         success = True
 
-        # Create Pages project (frontend)
-        if self.config.create_pages and env_config.pages_project_name:
-            if not self.create_pages_project(
-                env_config.pages_project_name,
-                env_config.pages_production_branch,
-            ):
-                success = False
+        if self.config.create_pages:
+            success = self.create_pages_project(project_name, production_branch)
 
-        # Add custom domains to Pages (frontend) - supports multiple domains
-        if self.config.add_custom_domains and env_config.pages_project_name:
-            for custom_domain in env_config.pages_custom_domains:
-                if not self.add_custom_domain_to_pages(
-                    env_config.pages_project_name,
-                    custom_domain,
-                ):
-                    success = False
-
-        # Create DNS records for Pages (frontend) - supports multiple domains
-        if self.config.create_dns_records and env_config.pages_custom_domains:
-            pages_target = f"{env_config.pages_project_name}.pages.dev"
-            for custom_domain in env_config.pages_custom_domains:
-                if not self.create_dns_record(
-                    custom_domain,
-                    pages_target,
-                ):
-                    success = False
-
-        # Create Admin Pages project
-        if self.config.create_pages and env_config.admin_project_name:
-            if not self.create_pages_project(
-                env_config.admin_project_name,
-                env_config.admin_production_branch,
-            ):
-                success = False
+        # Domains can only be attached once the project exists
+        if self.config.add_custom_domains:
+            results = self._run_concurrently([
+                partial(self.add_custom_domain_to_pages, project_name, custom_domain)
+                for custom_domain in custom_domains
+            ])
+            success = all(results) and success
+
+        return success
+
+    def _setup_kv_namespace(self, kv_config: KVNamespaceConfig) -> bool:
+        """Create a KV namespace and record its ID."""
+        namespace_id = self.create_kv_namespace(kv_config.name)
+        if not namespace_id:
+            return False
+        kv_config.namespace_id = namespace_id
+        return True
+
+    def _setup_r2_bucket(self, r2_config: R2BucketConfig) -> bool:
+        """Create an R2 bucket and record its name."""
+        bucket_name = self.create_r2_bucket(r2_config.name, r2_config.public_access)
+        if not bucket_name:
+            return False
+        r2_config.bucket_id = bucket_name
+        return True
+
+    def setup_environment(self, env_config: EnvironmentConfig) -> bool:
+        """Set up all infrastructure for an environment.
 
-        # Add custom domains to Admin Pages - supports multiple domains
-        if self.config.add_custom_domains and env_config.admin_project_name:
-            for custom_domain in env_config.admin_custom_domains:
-                if not self.add_custom_domain_to_pages(
-                    env_config.admin_project_name,
-                    custom_domain,
-                ):
-                    success = False
-
-        # Create DNS records for Admin Pages - supports multiple domains
-        if self.config.create_dns_records and env_config.admin_custom_domains:
-            admin_target = f"{env_config.admin_project_name}.pages.dev"
-            for custom_domain in env_config.admin_custom_domains:
-                if not self.create_dns_record(
-                    custom_domain,
-                    admin_target,
-                ):
-                    success = False
+        Resources are independent of each other apart from a Pages project and
+        its custom domains, so the API calls run concurrently.
+        """
+        log_info(f"\n{'='*50}")
+        log_info(f"Setting up environment: {env_config.name}")
+        log_info(f"{'='*50}\n")
+
+        calls: list[Callable[[], bool]] = []
+
+        # Pages projects (frontend and admin) - supports multiple domains each
+        for project_name, production_branch, custom_domains in (
+            (env_config.pages_project_name, env_config.pages_production_branch, env_config.pages_custom_domains),
+            (env_config.admin_project_name, env_config.admin_production_branch, env_config.admin_custom_domains),
+        ):
+            if project_name:
+                calls.append(partial(self._setup_pages_project, project_name, production_branch, custom_domains))
+
+            # DNS records for the Pages domains
+            if self.config.create_dns_records and custom_domains:
+                pages_target = f"{project_name}.pages.dev"
+                calls.extend(
+                    partial(self.create_dns_record, custom_domain, pages_target)
+                    for custom_domain in custom_domains
+                )
 
         # Create DNS records for Workers (if custom domain specified)
-        if self.config.create_dns_records and env_config.worker_custom_domain:
-            worker_target = f"{env_config.worker_name}.workers.dev" if env_config.worker_name else None
-            if worker_target:
-                if not self.create_dns_record(
-                    env_config.worker_custom_domain,
-                    worker_target,
-                ):
-                    success = False
+        if self.config.create_dns_records and env_config.worker_custom_domain and env_config.worker_name:
+            calls.append(partial(
+                self.create_dns_record,
+                env_config.worker_custom_domain,
+                f"{env_config.worker_name}.workers.dev",
+            ))
 
         # Create KV Namespaces (Sprint 8)
-        for kv_config in env_config.kv_namespaces:
-            namespace_id = self.create_kv_namespace(kv_config.name)
-            if not namespace_id:
-                success = False
-            else:
-                kv_config.namespace_id = namespace_id
+        calls.extend(partial(self._setup_kv_namespace, kv_config) for kv_config in env_config.kv_namespaces)
 
         # Create R2 Buckets (Sprint I1 - Media Storage)
         if self.config.create_r2_buckets:
-            for r2_config in env_config.r2_buckets:
-                bucket_name = self.create_r2_bucket(r2_config.name, r2_config.public_access)
-                if not bucket_name:
-                    success = False
-                else:
-                    r2_config.bucket_id = bucket_name
+            calls.extend(partial(self._setup_r2_bucket, r2_config) for r2_config in env_config.r2_buckets)
 
-        return success
+        return all(self._run_concurrently(calls))
 
     def setup_all(self) -> bool:
         """Set up infrastructure for all environments."""
-        # Verify token first
-        if not self.verify_token():
+        # Verify token first (dry runs make no API calls, so skip the round-trip)
+        if not self.config.dry_run and not self.verify_token():
             return False
 
         # Display configuration summary
@@ -1136,15 +1384,17 @@ class CloudflareInfraManager:
             log_info("Setting up zone-level firewall rules")
             log_info("=" * 50 + "\n")
 
-            for rule_config in self.config.firewall_rules:
-                if not self.create_firewall_rule(rule_config):
-                    success = False
-
-        # Set up each environment
-        for env_name, env_config in self.config.environments.items():
-            if not self.setup_environment(env_config):
+            if not self.create_firewall_rules_bulk(self.config.firewall_rules):
                 success = False
 
+        # Environments touch disjoint resources, so set them up concurrently
+        results = self._run_concurrently([
+            partial(self.setup_environment, env_config)
+            for env_config in self.config.environments.values()
+        ])
+        if not all(results):
+            success = False
+
         # Display final summary
         self._display_final_summary(success)
 
@@ -1152,6 +1402,8 @@ class CloudflareInfraManager:
 
     def _display_config_summary(self) -> None:
         """Display configuration summary."""
+        from rich.table import Table
+
         table = Table(title="Configuration Summary")
         table.add_column("Setting", style="cyan")
         table.add_column("Value", style="green")
@@ -1168,29 +1420,34 @@ class CloudflareInfraManager:
 
     def _display_final_summary(self, success: bool) -> None:
         """Display final setup summary."""
-        console.print()
-        console.print("=" * 60)
+        from rich.panel import Panel
+
+        console.print("\n" + "=" * 60)
 
         if success:
-            resources = []
-            for env in self.config.environments.values():
-                for domain in env.pages_custom_domains:
-                    resources.append(f"  - {domain} -> {env.pages_project_name}.pages.dev")
-                for domain in env.admin_custom_domains:
-                    resources.append(f"  - {domain} -> {env.admin_project_name}.pages.dev")
-            console.print(Panel.fit(
+            resources = "\n".join(
+                f"  - {domain} -> {project_name}.pages.dev"
+                for env in self.config.environments.values()
+                for project_name, domains in (
+                    (env.pages_project_name, env.pages_custom_domains),
+                    (env.admin_project_name, env.admin_custom_domains),
+                )
+                for domain in domains
+            )
+            summary = Panel.fit(
                 "[green]Setup Complete![/green]\n\n"
                 "Resources created/updated:\n"
-                + "\n".join(resources),
+                + resources,
                 title="Summary",
-            ))
+            )
         else:
-            console.print(Panel.fit(
+            summary = Panel.fit(
                 "[red]Setup completed with errors[/red]\n"
                 "Check the logs above for details.",
                 title="Summary",
-            ))
+            )
 
+        console.print(summary)
         console.print()
         log_info("SSL certificates may take a few minutes to activate.")
         log_info("Check status in Cloudflare Dashboard -> Pages -> Custom Domains")
@@ -1207,6 +1464,80 @@ app = typer.Typer(
 )
 
 
+@lru_cache(maxsize=1)
+def _cf_creds() -> tuple[str, str]:
+    """Read the API token and account ID from the environment once per process."""
+    return (
+        os.environ.get("CLOUDFLARE_API_TOKEN", ""),
+        os.environ.get("CLOUDFLARE_ACCOUNT_ID", ""),
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_config_path() -> Optional[Path]:
+    """cloudflare-config.yaml in the current directory, if present (checked once per process)."""
+    default_config = Path("cloudflare-config.yaml")
+    return default_config if default_config.exists() else None
+
+
+def _resolve_project_config(
+    config: Optional[Path],
+    wrangler: Optional[Path] = None,
+    domain: Optional[str] = None,
+    *,
+    domain_project_name: Optional[str] = None,
+    use_default: bool = True,
+) -> ProjectConfig:
+    """Load the project config from the options shared by the commands.
+
+    Args:
+        config: --config path; takes precedence over everything else
+        wrangler: --wrangler path, loaded together with --domain
+        domain: --domain root domain
+        domain_project_name: Project name for a minimal config built from
+            --domain and the environment credentials; None if the command
+            does not accept --domain on its own
+        use_default: Fall back to cloudflare-config.yaml in the current directory
+
+    Raises:
+        typer.Exit: If no configuration could be resolved
+    """
+    if config:
+        return load_config_from_yaml(config)
+
+    if wrangler:
+        if not domain:
+            log_error("--domain is required when using --wrangler")
+            raise typer.Exit(1)
+        return load_config_from_wrangler(wrangler, domain)
+
+    if domain and domain_project_name:
+        # Create minimal config for zone-level operations
+        api_token, account_id = _cf_creds()
+        if not api_token:
+            log_error("CLOUDFLARE_API_TOKEN environment variable not set")
+            raise typer.Exit(1)
+        if not account_id:
+            log_error("CLOUDFLARE_ACCOUNT_ID environment variable not set")
+            raise typer.Exit(1)
+
+        return ProjectConfig(
+            project_name=domain_project_name,
+            account_id=account_id,
+            api_token=api_token,
+            root_domain=domain,
+        )
+
+    # Try to find config file in current directory
+    default_config = _default_config_path() if use_default else None
+    if default_config:
+        return load_config_from_yaml(default_config)
+
+    alternative = "--domain" if domain_project_name else "--wrangler"
+    log_error(f"No configuration provided. Use --config or {alternative}")
+    raise typer.Exit(1)
+
+
 @app.command()
 def setup(
     config: Optional[Path] = typer.Option(
@@ -1256,22 +1587,7 @@ def setup(
         python cf_infra.py setup --config cloudflare-config.yaml --env dev
     """
     try:
-        # Load configuration
-        if config:
-            project_config = load_config_from_yaml(config)
-        elif wrangler:
-            if not domain:
-                log_error("--domain is required when using --wrangler")
-                raise typer.Exit(1)
-            project_config = load_config_from_wrangler(wrangler, domain)
-        else:
-            # Try to find config file in current directory
-            default_config = Path("cloudflare-config.yaml")
-            if default_config.exists():
-                project_config = load_config_from_yaml(default_config)
-            else:
-                log_error("No configuration provided. Use --config or --wrangler")
-                raise typer.Exit(1)
+        project_config = _resolve_project_config(config, wrangler, domain)
 
         # Apply CLI overrides
         if dry_run:
@@ -1285,8 +1601,8 @@ def setup(
             project_config.environments = {env: project_config.environments[env]}
 
         # Run setup
-        manager = CloudflareInfraManager(project_config)
-        success = manager.setup_all()
+        with CloudflareInfraManager(project_config) as manager:
+            success = manager.setup_all()
 
         if not success:
             raise typer.Exit(1)
@@ -1302,6 +1618,18 @@ def setup(
         raise typer.Exit(1)
 
 
+# EnvironmentConfig fields shown by `validate`, in display order
+_VALIDATE_FIELDS = (
+    ("pages_project_name", "Pages Project"),
+    ("pages_custom_domains", "Pages Domain"),
+    ("admin_project_name", "Admin Project"),
+    ("admin_custom_domains", "Admin Domain"),
+    ("worker_name", "Worker Name"),
+    ("worker_custom_domain", "Worker Domain"),
+    ("d1_database_name", "D1 Database"),
+)
+
+
 @app.command()
 def validate(
     config: Optional[Path] = typer.Option(
@@ -1330,17 +1658,12 @@ def validate(
         python cf_infra.py validate --config cloudflare-config.yaml
         python cf_infra.py validate --wrangler ./apps/backend/wrangler.toml --domain bodywave.org
     """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
     try:
-        if config:
-            project_config = load_config_from_yaml(config)
-        elif wrangler:
-            if not domain:
-                log_error("--domain is required when using --wrangler")
-                raise typer.Exit(1)
-            project_config = load_config_from_wrangler(wrangler, domain)
-        else:
-            log_error("No configuration provided. Use --config or --wrangler")
-            raise typer.Exit(1)
+        project_config = _resolve_project_config(config, wrangler, domain, use_default=False)
 
         # Display configuration
         console.print(Panel.fit(
@@ -1351,33 +1674,26 @@ def validate(
             title="Validation Result",
         ))
 
-        # Show environment details
+        # Show environment details, written to the terminal in one print
+        tables = []
         for env_name, env_config in project_config.environments.items():
             table = Table(title=f"Environment: {env_name}")
             table.add_column("Resource", style="cyan")
             table.add_column("Value", style="green")
 
-            if env_config.pages_project_name:
-                table.add_row("Pages Project", env_config.pages_project_name)
-            if env_config.pages_custom_domains:
-                for i, domain in enumerate(env_config.pages_custom_domains):
-                    label = "Pages Domain" if i == 0 else "  (alias)"
-                    table.add_row(label, domain)
-            if env_config.admin_project_name:
-                table.add_row("Admin Project", env_config.admin_project_name)
-            if env_config.admin_custom_domains:
-                for i, domain in enumerate(env_config.admin_custom_domains):
-                    label = "Admin Domain" if i == 0 else "  (alias)"
-                    table.add_row(label, domain)
-            if env_config.worker_name:
-                table.add_row("Worker Name", env_config.worker_name)
-            if env_config.worker_custom_domain:
-                table.add_row("Worker Domain", env_config.worker_custom_domain)
-            if env_config.d1_database_name:
-                table.add_row("D1 Database", env_config.d1_database_name)
+            for attr, label in _VALIDATE_FIELDS:
+                value = getattr(env_config, attr)
+                if isinstance(value, list):
+                    # Domain lists: first entry under the label, the rest as aliases
+                    for i, item in enumerate(value):
+                        table.add_row(label if i == 0 else "  (alias)", item)
+                elif value:
+                    table.add_row(label, value)
 
-            console.print(table)
-            console.print()
+            # Blank line after each table
+            tables += (table, "")
+
+        console.print(Group(*tables))
 
     except FileNotFoundError as e:
         log_error(str(e))
@@ -1387,6 +1703,54 @@ def validate(
         raise typer.Exit(1)
 
 
+# Template written by `init` ({{ }} are literal braces for ${VAR} references)
+_CONFIG_TEMPLATE = """# Cloudflare Infrastructure Configuration
+# Generated by cf-infra init
+# ========================================
+
+credentials:
+  api_token: "${{CLOUDFLARE_API_TOKEN}}"
+  account_id: "${{CLOUDFLARE_ACCOUNT_ID}}"
+
+domain:
+  root: "{root_domain}"
+
+project:
+  name: "{project}"
+  wrangler_path: "{wrangler}"
+  naming_convention: "{naming}"
+
+environments:
+  dev:
+    worker:
+      custom_domain: "api-dev.{project}.{root_domain}"
+    pages:
+      project_name: "dev-{project}-frontend"
+      custom_domain: "dev.{project}.{root_domain}"
+      production_branch: "dev"
+
+  production:
+    worker:
+      custom_domain: "api.{project}.{root_domain}"
+    pages:
+      project_name: "prod-{project}-frontend"
+      custom_domain: "{project}.{root_domain}"
+      production_branch: "prod"
+
+dns:
+  auto_create: true
+  proxied: true
+  ttl: 1
+
+features:
+  create_pages: true
+  add_custom_domains: true
+  create_dns_records: true
+  validate_ssl: true
+  dry_run: false
+"""
+
+
 @app.command()
 def init(
     output: Path = typer.Option(
@@ -1441,53 +1805,15 @@ def init(
         root_domain = domain or "example.com"
 
         # Generate config template
-        config_template = f"""# Cloudflare Infrastructure Configuration
-# Generated by cf-infra init
-# ========================================
-
-credentials:
-  api_token: "${{CLOUDFLARE_API_TOKEN}}"
-  account_id: "${{CLOUDFLARE_ACCOUNT_ID}}"
-
-domain:
-  root: "{root_domain}"
-
-project:
-  name: "{detected_project_name}"
-  wrangler_path: "{wrangler or './apps/backend/wrangler.toml'}"
-  naming_convention: "{naming_convention}"
-
-environments:
-  dev:
-    worker:
-      custom_domain: "api-dev.{detected_project_name}.{root_domain}"
-    pages:
-      project_name: "dev-{detected_project_name}-frontend"
-      custom_domain: "dev.{detected_project_name}.{root_domain}"
-      production_branch: "dev"
-
-  production:
-    worker:
-      custom_domain: "api.{detected_project_name}.{root_domain}"
-    pages:
-      project_name: "prod-{detected_project_name}-frontend"
-      custom_domain: "{detected_project_name}.{root_domain}"
-      production_branch: "prod"
-
-dns:
-  auto_create: true
-  proxied: true
-  ttl: 1
-
-features:
-  create_pages: true
-  add_custom_domains: true
-  create_dns_records: true
-  validate_ssl: true
-  dry_run: false
-"""
-
-        output.write_text(config_template)
+        config_template = _CONFIG_TEMPLATE.format_map({
+            "root_domain": root_domain,
+            "project": detected_project_name,
+            "wrangler": wrangler or "./apps/backend/wrangler.toml",
+            "naming": naming_convention,
+        })
+
+        # Always UTF-8, which is what the YAML loader decodes bytes as
+        output.write_bytes(config_template.encode("utf-8"))
         log_success(f"Generated config file: {output}")
         log_info("Edit the file to customize your configuration")
         log_info("Then run: python cf_infra.py setup --config cloudflare-config.yaml")
@@ -1533,59 +1859,43 @@ def health_bypass(
         # Dry run
         python cf_infra.py health-bypass --config cloudflare-config.yaml --dry-run
     """
-    try:
-        # Load configuration
-        if config:
-            project_config = load_config_from_yaml(config)
-        elif domain:
-            # Create minimal config for just creating the firewall rule
-            api_token = os.environ.get("CLOUDFLARE_API_TOKEN", "")
-            account_id = os.environ.get("CLOUDFLARE_ACCOUNT_ID", "")
-
-            if not api_token:
-                log_error("CLOUDFLARE_API_TOKEN environment variable not set")
-                raise typer.Exit(1)
-            if not account_id:
-                log_error("CLOUDFLARE_ACCOUNT_ID environment variable not set")
-                raise typer.Exit(1)
+    from rich.panel import Panel
 
-            project_config = ProjectConfig(
-                project_name="health-bypass",
-                account_id=account_id,
-                api_token=api_token,
-                root_domain=domain,
-            )
-        else:
-            # Try to find config file in current directory
-            default_config = Path("cloudflare-config.yaml")
-            if default_config.exists():
-                project_config = load_config_from_yaml(default_config)
-            else:
-                log_error("No configuration provided. Use --config or --domain")
-                raise typer.Exit(1)
+    try:
+        project_config = _resolve_project_config(
+            config, domain=domain, domain_project_name="health-bypass"
+        )
 
         # Apply CLI overrides
         if dry_run:
             project_config.dry_run = True
 
         # Create the manager and set up the health bypass
-        manager = CloudflareInfraManager(project_config)
-
-        if not manager.verify_token():
-            raise typer.Exit(1)
+        with CloudflareInfraManager(project_config) as manager:
+            if not project_config.dry_run and not manager.verify_token(zone_scoped=True):
+                raise typer.Exit(1)
 
-        log_info(f"Setting up health endpoint bypass for zone: {project_config.root_domain}")
+            log_info(f"Setting up health endpoint bypass for zone: {project_config.root_domain}")
 
-        success = manager.setup_health_endpoint_bypass()
+            success = manager.setup_health_endpoint_bypass()
 
-        if success:
+        if success and project_config.dry_run:
+            console.print(Panel.fit(
+                "[yellow]Dry run: would create the health endpoint bypass rule[/yellow]\n\n"
+                "Rule details:\n"
+                f"  - Expression: {_HEALTH_EXPR}\n"
+                "  - Action: Skip bot protection\n"
+                f"  - Products bypassed: {', '.join(_DEFAULT_SKIP_PRODUCTS)}",
+                title="Dry Run",
+            ))
+        elif success:
             console.print(Panel.fit(
                 "[green]Health endpoint bypass rule created![/green]\n\n"
                 "CI/CD health checks from GitHub Actions can now reach /health endpoints.\n\n"
                 "Rule details:\n"
-                "  - Expression: (http.request.uri.path eq \"/health\")\n"
+                f"  - Expression: {_HEALTH_EXPR}\n"
                 "  - Action: Skip bot protection\n"
-                "  - Products bypassed: bic, hot, rateLimit, securityLevel, uaBlock, waf, zoneLockdown",
+                f"  - Products bypassed: {', '.join(_DEFAULT_SKIP_PRODUCTS)}",
                 title="Success",
             ))
         else:
@@ -1625,53 +1935,38 @@ def list_firewall_rules_cmd(
         python cf_infra.py list-firewall-rules --config cloudflare-config.yaml
         python cf_infra.py list-firewall-rules --domain bodywave.org
     """
+    from rich.table import Table
+
     try:
-        if config:
-            project_config = load_config_from_yaml(config)
-        elif domain:
-            api_token = os.environ.get("CLOUDFLARE_API_TOKEN", "")
-            account_id = os.environ.get("CLOUDFLARE_ACCOUNT_ID", "")
-
-            if not api_token or not account_id:
-                log_error("CLOUDFLARE_API_TOKEN and CLOUDFLARE_ACCOUNT_ID must be set")
-                raise typer.Exit(1)
+        project_config = _resolve_project_config(
+            config, domain=domain, domain_project_name="list-rules"
+        )
 
-            project_config = ProjectConfig(
-                project_name="list-rules",
-                account_id=account_id,
-                api_token=api_token,
-                root_domain=domain,
-            )
-        else:
-            default_config = Path("cloudflare-config.yaml")
-            if default_config.exists():
-                project_config = load_config_from_yaml(default_config)
-            else:
-                log_error("No configuration provided. Use --config or --domain")
+        with CloudflareInfraManager(project_config) as manager:
+            if not manager.verify_token(zone_scoped=True):
                 raise typer.Exit(1)
 
-        manager = CloudflareInfraManager(project_config)
-
-        if not manager.verify_token():
-            raise typer.Exit(1)
-
-        rules = manager.list_firewall_rules()
-
-        if rules:
+            # Rows go straight from the API response into the table,
+            # without an intermediate list of rule dicts
             table = Table(title="Custom Firewall Rules")
             table.add_column("Description", style="cyan")
             table.add_column("Expression", style="green")
             table.add_column("Action", style="yellow")
             table.add_column("Enabled", style="magenta")
 
-            for rule in rules:
-                table.add_row(
-                    rule.get("description", "N/A"),
-                    rule.get("expression", "N/A"),
-                    rule.get("action", "N/A"),
-                    str(rule.get("enabled", "N/A")),
-                )
+            try:
+                for rule in manager.iter_firewall_rules():
+                    table.add_row(
+                        rule.get("description", "N/A"),
+                        rule.get("expression", "N/A"),
+                        rule.get("action", "N/A"),
+                        str(rule.get("enabled", "N/A")),
+                    )
+            except Exception as e:
+                # As before: a listing error reports no rules instead of exiting 1
+                log_error(f"Failed to list firewall rules: {e}")
 
+        if table.row_count:
             console.print(table)
         else:
             log_info("No custom firewall rules found")